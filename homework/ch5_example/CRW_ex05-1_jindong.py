@@ -1,39 +1,109 @@
 # architecture
-# 네이버 open api에 요청 -> 검색 결과를 json 파일로 저장
-import urllib.request
-import urllib.parse
-import urllib.error
-import json
+# 네이버 open api에 요청 -> 검색 결과를 JSONL 파일에 도착하는 대로 저장 (요청하면 기존 json 형식으로 변환)
+# 검색어마다 10페이지(start=1..901)를 동시에 요청 (연결 재사용, 초당/하루 요청 한도, 429/5xx 재시도)
+# 중간에 멈추면 다시 실행했을 때 끝난 페이지는 건너뛰고 이어서 수집
+import argparse
+import asyncio
+import logging
 import os
-import time
+import sys
+from urllib.parse import urlsplit
+
+from http_client import AsyncHttpClient, HostLimit, QuotaExceededError
+from jsonl_sink import JsonlSink, export_json
+
+logger = logging.getLogger(__name__)
+
+CLIENT_ID = os.environ.get('NAVER_CLIENT_ID', 'Q_ZBQe8hknZaoRCQivJF')
+CLIENT_SECRET = os.environ.get('NAVER_CLIENT_SECRET', 'rCffqkIgDq')
+
+BASE_URL = 'https://openapi.naver.com/v1/search/blog'
+
+# 네이버 검색 API 한도: 하루 25,000회, 초당 10회
+RATE_PER_SECOND = 10
+DAILY_LIMIT = 25000
+
+DISPLAY = 100
+PAGE_STARTS = range(1, 1000, DISPLAY)  # 1, 101, ..., 901
+
+
+async def fetch_page(client, base_url, query, start):
+    params = {"query": query, "display": DISPLAY, "start": start, "sort": "date"}
+    response = await client.get(base_url, params=params)
+    return response.json()['items']
+
+
+async def crawl_query(client, base_url, query, sink):
+    # 아직 끝나지 않은 페이지들을 동시에 요청하고, 끝나는 대로 sink에 기록
+    # 실패한 페이지는 건너뛰고 (다음 실행에서 다시 시도) 나머지는 계속 진행
+    done = sink.completed(query)
+    starts = [start for start in PAGE_STARTS if start not in done]
+
+    async def fetch_and_store(start):
+        items = await fetch_page(client, base_url, query, start)
+        sink.add_page(query, start, items)
+        return len(items)
+
+    results = await asyncio.gather(*(fetch_and_store(start) for start in starts), return_exceptions=True)
+    count = 0
+    for start, result in zip(starts, results):
+        if isinstance(result, QuotaExceededError):
+            raise result
+        if isinstance(result, Exception):
+            logger.warning("'%s' start=%d 실패: %s", query, start, result)
+            continue
+        count += result
+    return count
+
+
+async def crawl(queries, sink, base_url=BASE_URL, rate=RATE_PER_SECOND, concurrency=10, daily_limit=DAILY_LIMIT):
+    """
+    여러 검색어를 한 번에 수집해 sink에 기록
+
+    Returns:
+        검색어 -> 이번 실행에서 새로 수집한 결과 개수
+    """
+    host_limits = {urlsplit(base_url).hostname: HostLimit(rate=rate, concurrency=concurrency, daily_limit=daily_limit)}
+    headers = {"X-Naver-Client-Id": CLIENT_ID, "X-Naver-Client-Secret": CLIENT_SECRET}
+    async with AsyncHttpClient(concurrency, host_limits=host_limits, headers=headers) as client:
+        try:
+            results = await asyncio.gather(*(crawl_query(client, base_url, query, sink) for query in queries))
+        finally:
+            logger.info(client.stats.report())
+    return dict(zip(queries, results))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="네이버 블로그 검색 결과 수집")
+    parser.add_argument('queries', nargs='*', help="검색어 (없으면 입력받음)")
+    parser.add_argument('--output', default='naver_crawling_.jsonl', help="결과 JSONL 파일")
+    parser.add_argument('--fresh', action='store_true', help="체크포인트와 기존 출력 파일을 무시하고 처음부터 수집")
+    parser.add_argument('--flush-every', type=int, default=500, help="몇 건마다 파일에 쓸지")
+    parser.add_argument('--export-json', metavar='PATH', nargs='?', const='naver_crawling_.json',
+                        help="수집 후 기존 형식(들여쓰기 JSON)으로 변환 (기본 naver_crawling_.json)")
+    parser.add_argument('--base-url', default=BASE_URL, help="API 주소 (테스트용 로컬 서버 등)")
+    parser.add_argument('--rate', type=float, default=RATE_PER_SECOND, help="초당 요청 수")
+    parser.add_argument('--concurrency', type=int, default=10, help="동시 연결 수")
+    return parser.parse_args()
+
 
 def main():
-    client_id = 'Q_ZBQe8hknZaoRCQivJF'
-    client_secret = 'rCffqkIgDq'
-
-    encText = input("검색어: ").strip()
-    encText = urllib.parse.quote(encText) # encoding
-
-    base = 'https://openapi.naver.com/v1/search/blog?query='
-    news_list = []
-
-    for i in range(1, 1000, 100):
-        url = base + encText +"&display=100&start=%d&sort=date" % i
-            
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", client_id)
-        request.add_header("X-Naver-Client-Secret", client_secret)
-        response = urllib.request.urlopen(request)
-        response_body = response.read().decode('utf-8')
-
-        naver_json = json.loads(response_body) # 문자열을 -> dict, list로 변환
-
-        # for j in range(len(naver_json['items'])):
-        #     news_list.append(naver_json['items'][j]) # 현재 리스트
-        news_list.extend(naver_json['items']) # 리스트 원소를 알아서 붙임
-        
-    with open('naver_crawling_.json', 'w', encoding='utf-8') as f:
-        json.dump(news_list, f, ensure_ascii=False, indent = 4)    
-        
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    queries = args.queries or [input("검색어: ").strip()]
+
+    try:
+        sink = JsonlSink(args.output, flush_every=args.flush_every, resume=not args.fresh)
+    except (FileExistsError, ValueError) as e:
+        sys.exit(str(e))
+    with sink:
+        counts = asyncio.run(crawl(queries, sink, args.base_url, args.rate, args.concurrency))
+    for query, count in counts.items():
+        print(f"'{query}': {count}건 수집")
+
+    if args.export_json:
+        total = export_json(args.output, args.export_json)
+        print(f"{args.export_json}: {total}건 저장")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
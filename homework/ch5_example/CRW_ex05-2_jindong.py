@@ -1,53 +1,236 @@
-import requests
-import time
+# architecture
+# 서울 열린데이터 api(ChunmanFreeSuggestions)를 1000건 구간으로 나눠 동시에 요청 (초당 요청 한도, 429/5xx 재시도)
+# 구간마다 iterparse로 <row>를 읽어 끝까지 파싱된 구간만 파일(xml/csv/parquet)에 씀 -> 전체 데이터를 메모리에 모으지 않음
+# 구간 순서대로 쓰고, 동시에 받아 두는 구간은 concurrency개까지만
+# 요청이나 파싱에 실패한 구간은 끝에 모아서 알려주고 종료 코드 1로 끝냄
+import argparse
+import asyncio
+import collections
+import csv
+import io
+import logging
+import os
+import sys
 import xml.etree.ElementTree as ET
-import xml.dom.minidom
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
 
+from http_client import AsyncHttpClient, HostLimit
 
-def main():
-    key = '506d4e6e51736b64383150517a4264'
-    base = 'http://openapi.seoul.go.kr:8088/'
-    service = 'ChunmanFreeSuggestions'
-
-    # 전체 개수 확인
-    url = f'{base}{key}/xml/{service}/1/1'
-    response = requests.get(url)
-    root = ET.fromstring(response.content.decode('utf-8'))
-    total_count = int(root.find('list_total_count').text)
-    print(f"전체 데이터 개수: {total_count}")
-
-    # 루트 노드 생성 (최종 XML 통합용)
-    root_total = ET.Element(service)
-
-    # 1000개씩 요청 반복
-    for start in range(1, total_count + 1, 1000):
-        end = min(start + 999, total_count) # 끝나는 지점
-        url = f'{base}{key}/xml/{service}/{start}/{end}'
-        response = requests.get(url)
-        time.sleep(0.2)  # 서버 과부하 방지용 딜레이
-        xml_str = response.content.decode('utf-8')
-        
-        # 현재 구간 XML 파싱
+logger = logging.getLogger(__name__)
+
+# 키가 URL 경로에 들어가므로 ResponseCache를 붙일 때는 redact=[KEY]로 캐시 키와 저장된 URL에서 뺌
+KEY = os.environ.get('SEOUL_API_KEY', '506d4e6e51736b64383150517a4264')
+BASE_URL = 'http://openapi.seoul.go.kr:8088/'
+SERVICE = 'ChunmanFreeSuggestions'
+
+WINDOW = 1000  # 한 번에 요청할 수 있는 최대 건수
+RATE_PER_SECOND = 5  # 서버 과부하 방지 (기존 0.2초 딜레이와 같은 속도)
+
+OUTPUT_FORMATS = ('xml', 'csv', 'parquet')
+
+
+def parse_rows(content):
+    """
+    응답 XML의 <row>를 {태그: 값} 목록으로 읽음 (읽은 row 요소는 바로 지워서 트리가 커지지 않게 함)
+
+    Raises:
+        ET.ParseError: 잘못된 XML (중간에 잘린 응답 등)
+    """
+    rows = []
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if root is None:
+            root = elem
+        elif event == 'end' and elem.tag == 'row':
+            rows.append({child.tag: child.text for child in elem})
+            root.remove(elem)
+    return rows
+
+
+def check_columns(rows, fieldnames):
+    """첫 row에 없던 컬럼이 있으면 ValueError (아무것도 쓰기 전에 확인)"""
+    for values in rows:
+        extra = set(values) - set(fieldnames)
+        if extra:
+            raise ValueError(f"첫 row에 없던 컬럼: {', '.join(sorted(extra))}")
+
+
+class XmlWriter:
+    # 기존 seoul_data.xml과 같은 모양 (<ChunmanFreeSuggestions> 아래 들여쓰기된 <row>)
+    def __init__(self, path):
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write(f'<?xml version="1.0" ?>\n<{SERVICE}>\n')
+
+    def write(self, rows):
+        for values in rows:
+            lines = ['    <row>']
+            for tag, text in values.items():
+                lines.append(f'        <{tag}>{escape(text)}</{tag}>' if text else f'        <{tag}/>')
+            lines.append('    </row>\n')
+            self._file.write('\n'.join(lines))
+
+    def close(self):
+        self._file.write(f'</{SERVICE}>\n')
+        self._file.close()
+
+
+class CsvWriter:
+    # 컬럼은 첫 row의 태그 순서 (없는 컬럼은 빈 값, 새 컬럼이 나오면 그 구간을 쓰지 않고 ValueError)
+    def __init__(self, path):
+        self._file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = None
+
+    def write(self, rows):
+        if not rows:
+            return
+        fieldnames = self._writer.fieldnames if self._writer else list(rows[0])
+        check_columns(rows, fieldnames)
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, restval='', extrasaction='raise')
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter:
+    # 구간 하나를 row group 하나로 씀 (pyarrow 필요, 모든 컬럼은 문자열)
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("parquet 출력에는 pyarrow가 필요합니다. (pip install pyarrow)")
+        self._pa = pa
+        self._pq = pq
+        self._path = path
+        self._writer = None
+
+    def write(self, rows):
+        if not rows:
+            return
+        fieldnames = self._writer.schema.names if self._writer else list(rows[0])
+        check_columns(rows, fieldnames)
+        if self._writer is None:
+            schema = self._pa.schema([(name, self._pa.string()) for name in fieldnames])
+            self._writer = self._pq.ParquetWriter(self._path, schema)
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._writer.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {'xml': XmlWriter, 'csv': CsvWriter, 'parquet': ParquetWriter}
+
+
+def write_window(writer, content):
+    """
+    구간 하나를 끝까지 파싱한 뒤 쓰고 쓴 건수를 반환
+
+    Raises:
+        ET.ParseError: 잘못된 XML (아무것도 쓰지 않음)
+        ValueError: 첫 구간에 없던 컬럼 (csv/parquet, 아무것도 쓰지 않음)
+    """
+    rows = parse_rows(content)
+    writer.write(rows)
+    return len(rows)
+
+
+async def fetch_window(client, base_url, start, end):
+    url = f'{base_url}{KEY}/xml/{SERVICE}/{start}/{end}'
+    response = await client.get(url)
+    return response.content
+
+
+async def fetch_total_count(client, base_url):
+    url = f'{base_url}{KEY}/xml/{SERVICE}/1/1'
+    response = await client.get(url)
+    root = ET.fromstring(response.content)
+    return int(root.find('list_total_count').text)
+
+
+async def crawl(writer, base_url=BASE_URL, rate=RATE_PER_SECOND, concurrency=4):
+    """
+    전체 구간을 동시에 받아 순서대로 writer에 씀
+
+    Returns:
+        (쓴 row 개수, 실패한 구간 [(시작, 끝, 이유)])
+    """
+    host_limits = {urlsplit(base_url).hostname: HostLimit(rate=rate, concurrency=concurrency)}
+    async with AsyncHttpClient(concurrency, host_limits=host_limits) as client:
+        total_count = await fetch_total_count(client, base_url)
+        print(f"전체 데이터 개수: {total_count}")
+
+        windows = iter([(start, min(start + WINDOW - 1, total_count)) for start in range(1, total_count + 1, WINDOW)])
+        pending = collections.deque()
+
+        def schedule():
+            window = next(windows, None)
+            if window is not None:
+                pending.append((window, asyncio.create_task(fetch_window(client, base_url, *window))))
+
+        for _ in range(concurrency):
+            schedule()
+
+        written = 0
+        failed = []
         try:
-            chunk_root = ET.fromstring(xml_str)
-        except ET.ParseError as e:
-            continue
+            while pending:
+                (start, end), task = pending.popleft()
+                schedule()  # 앞 구간을 쓰는 동안 다음 구간을 받음
+                try:
+                    content = await task
+                except Exception as e:
+                    logger.warning("%d~%d 요청 실패: %s", start, end, e)
+                    failed.append((start, end, f"요청 실패: {e}"))
+                    continue
+                # 파싱과 파일 쓰기는 스레드에서 (그동안 다른 구간 응답을 계속 받음)
+                try:
+                    written += await asyncio.to_thread(write_window, writer, content)
+                except ET.ParseError as e:
+                    logger.warning("%d~%d 파싱 실패: %s", start, end, e)
+                    failed.append((start, end, f"파싱 실패: {e}"))
+                    continue
+                except ValueError as e:
+                    logger.warning("%d~%d 컬럼 불일치: %s", start, end, e)
+                    failed.append((start, end, f"컬럼 불일치: {e}"))
+                    continue
+                print(f"{start}~{end} 완료 ({written}건 누적)")
+        finally:
+            for _, task in pending:
+                task.cancel()
+            logger.info(client.stats.report())
+    return written, failed
 
-        # <row> 요소만 추출해서 전체 XML에 추가
-        for row in chunk_root.findall('row'):
-            root_total.append(row)
 
-        print(f"{start}~{end} 완료 ({len(root_total)}건 누적)")
+def parse_args():
+    parser = argparse.ArgumentParser(description="서울시 천만상상 오아시스 시민제안 수집")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='xml', help="출력 형식")
+    parser.add_argument('--output', help="출력 파일 (기본 seoul_data.<형식>)")
+    parser.add_argument('--base-url', default=BASE_URL, help="API 주소 (테스트용 로컬 서버 등)")
+    parser.add_argument('--rate', type=float, default=RATE_PER_SECOND, help="초당 요청 수")
+    parser.add_argument('--concurrency', type=int, default=4, help="동시에 받는 구간 개수")
+    return parser.parse_args()
 
-    # 전체 XML 문자열로 변환
-    xml_str = ET.tostring(root_total, encoding='utf-8')
 
-    # 보기 좋게 정렬 (minidom으로 들여쓰기)
-    dom = xml.dom.minidom.parseString(xml_str)
-    pretty_xml = dom.toprettyxml(indent="    ")
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    output = args.output or f'seoul_data.{args.format}'
+
+    writer = WRITERS[args.format](output)
+    try:
+        written, failed = asyncio.run(crawl(writer, args.base_url, args.rate, args.concurrency))
+    finally:
+        writer.close()
+    print(f"{output}: {written}건 저장")
+    if failed:
+        for start, end, reason in failed:
+            print(f"  {start}~{end} 누락 ({reason})")
+        sys.exit(f"{len(failed)}개 구간을 받지 못했습니다. 다시 실행해 주세요.")
 
-    with open('seoul_data.xml', 'w', encoding='utf-8') as f:
-        f.write(pretty_xml)
-    
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,9 +1,13 @@
-import urllib.request
-import requests
 import pandas as pd
 import matplotlib.pyplot as plt
 import platform
 
+from http_client import HttpClient
+from response_cache import ResponseCache
+
+# 연도별 사고 통계는 자주 바뀌지 않으므로 일주일 동안 저장된 응답을 사용
+CACHE_TTLS = {'apis.data.go.kr/B552061/frequentzoneBicycle': 7 * 24 * 60 * 60}
+
 def main():
     year = int(input("사고 년도 조회: "))
     siDo = int(input("시 코드: "))
@@ -25,7 +29,9 @@ def main():
     }
 
 
-    response = requests.get(base, params=params)
+    with ResponseCache(ttls=CACHE_TTLS) as cache, HttpClient(cache=cache) as client:
+        response = client.get(base, params=params)
+        print(client.stats.report())
 
     df = pd.DataFrame(response.json()['items']['item'])
     df = df.loc[:,['sido_sgg_nm', 'occrrnc_cnt']]
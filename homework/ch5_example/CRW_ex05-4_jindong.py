@@ -1,7 +1,10 @@
-import urllib.parse
-import urllib.request
 import pandas as pd
-import requests
+
+from http_client import HttpClient
+from response_cache import ResponseCache
+
+# 충전소 현황은 하루 단위로 갱신되므로 하루 동안은 저장된 응답을 사용
+CACHE_TTLS = {'bigdata.kepco.co.kr/openapi/v1/EVcharge.do': 24 * 60 * 60}
 
 def main():
     key = 'e1T6q1NWu4cmSjE98s1SM6V551NLQvS2M2OBmxHO'
@@ -12,27 +15,31 @@ def main():
 
     arr_total = []
 
-    for i in metro_list:
-        dict = {} # 도시와, 도시의 충전량 개수를 담기 위한 딕셔너리
-        params = {
-            'metroCd': i,
-            'apiKey': key,
-            'returnType' : 'json',
-        }
+    # 16개 지역 요청이 연결 하나를 재사용 (실패한 요청은 재시도, 다시 실행하면 캐시에서 바로 읽음)
+    with ResponseCache(ttls=CACHE_TTLS) as cache, HttpClient(cache=cache) as client:
+        for i in metro_list:
+            dict = {} # 도시와, 도시의 충전량 개수를 담기 위한 딕셔너리
+            params = {
+                'metroCd': i,
+                'apiKey': key,
+                'returnType' : 'json',
+            }
+
+            response = client.get(base, params=params)
 
-        response = requests.get(base, params=params)
+            arr = response.json()['data']
 
-        arr = response.json()['data']
+            total = 0
 
-        total = 0
+            for i in range(len(arr)):
+                total = total + arr[i]['rapidCnt'] + arr[i]['slowCnt']
 
-        for i in range(len(arr)):
-            total = total + arr[i]['rapidCnt'] + arr[i]['slowCnt']
+            dict['metro'] = arr[i]['metro']
+            dict['total'] = total
 
-        dict['metro'] = arr[i]['metro']
-        dict['total'] = total
+            arr_total.append(dict)
 
-        arr_total.append(dict)
+        print(client.stats.report())
 
     df = pd.DataFrame(arr_total)
     df.to_csv('시도별 충전소 설치 현황.csv')
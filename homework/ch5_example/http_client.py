@@ -0,0 +1,378 @@
+# 크롤러 공용 HTTP 요청 도구
+# keep-alive 연결 풀 + 호스트별 동시 요청/초당 요청 제한 + 429/5xx 재시도 + 요청 통계 + 응답 캐시(선택)
+# 같은 설정으로 동기(HttpClient)와 비동기(AsyncHttpClient) 코드에서 모두 사용
+#
+# 다른 폴더의 노트북에서는 경로를 추가해서 import
+#   import sys
+#   sys.path.append('../homework/ch5_example')
+#   from http_client import HttpClient
+import asyncio
+import collections
+import contextlib
+import itertools
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from response_cache import CacheMissError
+
+logger = logging.getLogger(__name__)
+
+# 요청마다 찍히는 httpx 로그 대신 CrawlStats로 요약
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# 재시도할 응답 코드 (요청 제한, 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 기본 타임아웃 (초, 연결/읽기 각각)
+DEFAULT_TIMEOUT = 10.0
+
+# gzip/deflate로 압축해서 받음 (httpx가 응답을 자동으로 풀어줌)
+DEFAULT_HEADERS = {'Accept-Encoding': 'gzip, deflate'}
+
+
+class QuotaExceededError(Exception):
+    """하루 요청 한도를 모두 사용함"""
+
+
+class TokenBucket:
+    """
+    초당 rate개까지 요청을 허용하는 토큰 버킷 (순간적으로는 capacity개까지)
+
+    daily_limit을 주면 전체 요청 수가 한도에 닿았을 때 QuotaExceededError를 발생시킨다.
+    요청마다 토큰을 미리 예약하고 순서대로 기다리므로 스레드와 이벤트 루프에서 같이 써도 된다.
+    """
+
+    def __init__(self, rate: float = None, capacity: int = None, daily_limit: int = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate or 1))
+        self.daily_limit = daily_limit
+        self.used = 0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        # 토큰 하나를 예약하고 기다려야 할 시간을 반환 (토큰이 모자라면 음수로 빚을 짐)
+        with self._lock:
+            if self.daily_limit is not None and self.used >= self.daily_limit:
+                raise QuotaExceededError(f"하루 요청 한도 {self.daily_limit}회를 모두 사용했습니다.")
+            self.used += 1
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def acquire_sync(self):
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class HostLimit:
+    """
+    호스트 하나에 대한 요청 제한 (None이면 제한 없음)
+
+    Args:
+        rate: 초당 요청 수
+        concurrency: 동시에 보내는 요청 수
+        daily_limit: 전체 요청 수 한도 (넘으면 QuotaExceededError)
+    """
+
+    def __init__(self, rate: float = None, concurrency: int = None, daily_limit: int = None):
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, daily_limit=daily_limit) if rate or daily_limit else None
+
+
+class CrawlStats:
+    """요청 횟수, 재시도, 응답 코드, 받은 바이트, 지연 시간 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0  # 전송된 크기 (압축 상태)
+        self.decoded_bytes = 0  # 압축을 푼 크기
+        self.status = collections.Counter()
+        self.cache = collections.Counter()  # 캐시 적중(hits), 304로 재검증(revalidated)
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, response: httpx.Response = None):
+        with self._lock:
+            self.requests += 1
+            self.latencies.append(elapsed)
+            if response is None:
+                self.errors += 1
+                return
+            self.status[response.status_code] += 1
+            self.bytes += response.num_bytes_downloaded
+            self.decoded_bytes += len(response.content)
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_cache(self, kind: str):
+        with self._lock:
+            self.cache[kind] += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            summary = {
+                "requests": self.requests,
+                "retries": self.retries,
+                "errors": self.errors,
+                "status": dict(self.status),
+                "bytes": self.bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "cache": dict(self.cache),
+            }
+        if latencies:
+            summary["latency_ms"] = {
+                "avg": round(sum(latencies) / len(latencies) * 1000, 1),
+                "p50": round(latencies[len(latencies) // 2] * 1000, 1),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1),
+                "max": round(latencies[-1] * 1000, 1),
+            }
+        return summary
+
+    def report(self) -> str:
+        """한 줄 요약 (크롤링이 끝난 뒤 출력용)"""
+        summary = self.summary()
+        line = (f"요청 {summary['requests']}회 (재시도 {summary['retries']}, 연결 오류 {summary['errors']}), "
+                f"응답 {summary['status']}, 수신 {summary['bytes'] / 1024:.1f}KB"
+                f" (압축 해제 {summary['decoded_bytes'] / 1024:.1f}KB)")
+        if "latency_ms" in summary:
+            latency = summary["latency_ms"]
+            line += f", 지연 평균 {latency['avg']}ms / p95 {latency['p95']}ms"
+        if summary["cache"]:
+            line += f", 캐시 적중 {summary['cache'].get('hits', 0)}회 (재검증 {summary['cache'].get('revalidated', 0)}회)"
+        return line
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """지수 백오프 + full jitter (여러 요청이 동시에 다시 몰리지 않도록 0 ~ 상한 사이 임의 값)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class _BaseClient:
+    # 동기/비동기 클라이언트가 같이 쓰는 설정과 재시도 판단
+
+    def __init__(self, concurrency: int = 10, timeout: float = DEFAULT_TIMEOUT, retries: int = 4,
+                 backoff: float = 0.5, host_limits: dict = None, stats: CrawlStats = None, cache=None):
+        self.retries = retries
+        self.backoff = backoff
+        self.host_limits = dict(host_limits or {})
+        self.stats = stats or CrawlStats()
+        self.cache = cache
+        self._semaphores = {}
+        self._options = {
+            "limits": httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            "timeout": timeout,
+            "headers": dict(DEFAULT_HEADERS),
+            "follow_redirects": True,
+        }
+
+    def _client_options(self, kwargs: dict) -> dict:
+        options = dict(self._options)
+        options["headers"] = {**self._options["headers"], **(kwargs.pop('headers', None) or {})}
+        options.update(kwargs)
+        return options
+
+    def _limit_for(self, url):
+        host = urlsplit(str(url)).hostname
+        return host, self.host_limits.get(host)
+
+    def _from_cache(self, method: str, url, kwargs: dict):
+        """
+        캐시에서 응답을 찾고, 유효 시간이 지난 응답이면 조건부 요청 헤더를 kwargs에 추가
+
+        Returns:
+            (캐시 키, 캐시 항목, 바로 돌려줄 응답) - GET이 아니거나 캐시가 없으면 모두 None
+        """
+        if self.cache is None or method != 'GET':
+            return None, None, None
+        params = kwargs.get('params')
+        full_url = httpx.URL(url).copy_merge_params(params) if params else httpx.URL(url)
+        key = self.cache.key_for(full_url)
+        entry = self.cache.lookup(key)
+        if entry is not None and (entry.fresh or self.cache.offline):
+            self.stats.record_cache('hits')
+            return key, entry, entry.to_response(full_url)
+        if self.cache.offline:
+            raise CacheMissError(f"오프라인 모드인데 캐시에 없는 요청입니다: {self.cache.normalize(full_url)}")
+        if entry is not None:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **entry.validators()}
+        return key, entry, None
+
+    def _update_cache(self, key, entry, response: httpx.Response) -> httpx.Response:
+        # 304면 저장된 응답을 다시 유효하게 하고 그 응답을 반환, 200이면 저장
+        if key is None:
+            return response
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, response.request.url)
+            self.stats.record_cache('revalidated')
+            return entry.to_response(response.request.url)
+        if response.status_code == 200:
+            self.cache.store(key, response.request.url, response)
+        return response
+
+    def _retry_delay(self, attempt: int, url, response: httpx.Response = None, error: Exception = None):
+        """재시도 전에 기다릴 시간 (재시도하지 않으면 None)"""
+        if attempt >= self.retries:
+            return None
+        if error is not None:
+            delay = backoff_delay(attempt, self.backoff)
+            logger.warning("요청 실패 %s (%s), %.2f초 후 재시도", url, error, delay)
+        elif response.status_code in RETRY_STATUS:
+            retry_after = response.headers.get('Retry-After')
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff_delay(attempt, self.backoff)
+            logger.warning("응답 %d %s, %.2f초 후 재시도", response.status_code, url, delay)
+        else:
+            return None
+        self.stats.record_retry()
+        return delay
+
+
+class HttpClient(_BaseClient):
+    """
+    keep-alive 연결을 재사용하는 동기 클라이언트 (스레드에서 같이 써도 됨)
+
+    요청 제한을 지키며 요청하고, 429/5xx와 연결 오류는 jitter가 있는 지수 백오프로 재시도한다.
+    Retry-After 헤더가 있으면 그 시간만큼 기다린다.
+    재시도를 모두 실패하면 마지막 오류(httpx.HTTPStatusError 등)를 그대로 발생시킨다.
+
+    Args:
+        concurrency: 유지할 최대 연결 수
+        timeout: 타임아웃 (초)
+        retries: 최대 재시도 횟수
+        backoff: 백오프 기본 대기 시간 (초)
+        host_limits: 호스트 이름 -> HostLimit
+        stats: 요청 통계를 모을 CrawlStats (None이면 새로 만듦)
+        cache: GET 응답을 저장/재사용할 ResponseCache (None이면 캐시 안 함)
+        **kwargs: httpx.Client 옵션 (headers, verify 등)
+    """
+
+    def __init__(self, concurrency: int = 10, timeout: float = DEFAULT_TIMEOUT, retries: int = 4,
+                 backoff: float = 0.5, host_limits: dict = None, stats: CrawlStats = None, cache=None, **kwargs):
+        super().__init__(concurrency, timeout, retries, backoff, host_limits, stats, cache)
+        self._client = httpx.Client(**self._client_options(kwargs))
+        self._semaphore_lock = threading.Lock()
+
+    def _slot(self, host, limit):
+        if limit is None or not limit.concurrency:
+            return contextlib.nullcontext()
+        with self._semaphore_lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(limit.concurrency)
+            return self._semaphores[host]
+
+    def request(self, method: str, url, **kwargs) -> httpx.Response:
+        key, entry, cached = self._from_cache(method, url, kwargs)
+        if cached is not None:
+            return cached
+        host, limit = self._limit_for(url)
+        for attempt in itertools.count():
+            if limit is not None and limit.bucket is not None:
+                limit.bucket.acquire_sync()
+            response = error = None
+            with self._slot(host, limit):
+                started = time.perf_counter()
+                try:
+                    response = self._client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+                self.stats.record(time.perf_counter() - started, response)
+
+            delay = self._retry_delay(attempt, url, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                response = self._update_cache(key, entry, response)
+                response.raise_for_status()
+                return response
+            time.sleep(delay)
+
+    def get(self, url, **kwargs) -> httpx.Response:
+        return self.request('GET', url, **kwargs)
+
+    def close(self):
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHttpClient(_BaseClient):
+    """HttpClient의 비동기 버전 (옵션과 재시도, 통계, 캐시는 같음)"""
+
+    def __init__(self, concurrency: int = 10, timeout: float = DEFAULT_TIMEOUT, retries: int = 4,
+                 backoff: float = 0.5, host_limits: dict = None, stats: CrawlStats = None, cache=None, **kwargs):
+        super().__init__(concurrency, timeout, retries, backoff, host_limits, stats, cache)
+        self._client = httpx.AsyncClient(**self._client_options(kwargs))
+
+    def _slot(self, host, limit):
+        if limit is None or not limit.concurrency:
+            return contextlib.nullcontext()
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(limit.concurrency)
+        return self._semaphores[host]
+
+    async def request(self, method: str, url, **kwargs) -> httpx.Response:
+        # SQLite 캐시 조회/저장은 이벤트 루프를 막지 않도록 스레드에서
+        key = entry = cached = None
+        if self.cache is not None:
+            key, entry, cached = await asyncio.to_thread(self._from_cache, method, url, kwargs)
+        if cached is not None:
+            return cached
+        host, limit = self._limit_for(url)
+        for attempt in itertools.count():
+            if limit is not None and limit.bucket is not None:
+                await limit.bucket.acquire()
+            response = error = None
+            async with self._slot(host, limit):
+                started = time.perf_counter()
+                try:
+                    response = await self._client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+                self.stats.record(time.perf_counter() - started, response)
+
+            delay = self._retry_delay(attempt, url, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                if key is not None:
+                    response = await asyncio.to_thread(self._update_cache, key, entry, response)
+                response.raise_for_status()
+                return response
+            await asyncio.sleep(delay)
+
+    async def get(self, url, **kwargs) -> httpx.Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
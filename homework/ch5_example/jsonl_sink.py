@@ -0,0 +1,147 @@
+# 크롤링 결과를 도착하는 대로 JSONL로 이어 쓰고, 검색어별로 끝난 페이지를 체크포인트에 기록
+# 중간에 멈춰도 다시 실행하면 끝난 페이지는 건너뛰고 이어서 수집
+import itertools
+import json
+import os
+import textwrap
+
+
+class JsonlSink:
+    """
+    페이지 단위로 결과를 모아 flush_every건마다 한 줄에 하나씩(compact JSON) 파일 끝에 쓴다
+
+    flush할 때마다 체크포인트(<경로>.checkpoint.json)에 파일 크기와 검색어별로 끝난 페이지를 기록한다.
+    다시 열 때 파일이 체크포인트보다 길면(체크포인트를 쓰기 전에 멈춘 경우) 그 뒷부분을 잘라
+    체크포인트에 기록된 페이지와 파일 내용이 항상 일치하도록 한다.
+    체크포인트 없이 내용이 있는 파일은 다른 실행의 결과일 수 있으므로 resume=False일 때만 비운다.
+
+    Raises:
+        FileExistsError: resume=True인데 체크포인트 없이 내용이 있는 파일인 경우
+        ValueError: 파일이 체크포인트에 기록된 크기보다 짧은 경우 (파일이 바뀌었거나 지워진 경우)
+    """
+
+    def __init__(self, path, flush_every=500, resume=True):
+        self.path = path
+        self.checkpoint_path = path + '.checkpoint.json'
+        self.flush_every = flush_every
+        self.written = 0
+        self._lines = []
+        self._pending_pages = []  # 아직 파일에 쓰지 않은 (검색어, 페이지)
+        self._completed = {}  # 검색어 -> 끝난 페이지 집합
+        size = 0
+
+        if resume and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            size = checkpoint['bytes']
+            actual = os.path.getsize(path) if os.path.exists(path) else 0
+            if actual < size:
+                # truncate는 파일을 늘리므로(NUL로 채움) 이어 쓰지 않고 멈춤
+                raise ValueError(
+                    f"{path}가 체크포인트({size}바이트)보다 짧습니다({actual}바이트). "
+                    f"처음부터 다시 수집하려면 resume=False(--fresh)로 실행하세요."
+                )
+            self._completed = {query: set(pages) for query, pages in checkpoint['queries'].items()}
+        elif resume and os.path.exists(path) and os.path.getsize(path) > 0:
+            raise FileExistsError(
+                f"{path}에 체크포인트 없는 기존 결과가 있습니다. 덮어쓰려면 resume=False(--fresh)로 실행하세요."
+            )
+
+        # 이어 쓰기: 체크포인트 뒤에 남은 불완전한 기록은 버림 (처음부터면 파일을 비움)
+        self._file = open(path, 'ab' if os.path.exists(path) else 'wb')
+        self._file.truncate(size)
+        self._file.seek(size)
+        if not resume:
+            # 이전 실행의 체크포인트가 남아 있으면 첫 flush 전에 멈췄을 때 비운 파일과 어긋나므로 바로 초기화
+            self._save_checkpoint()
+
+    def completed(self, query):
+        """이미 파일에 기록된 페이지"""
+        return self._completed.get(query, set())
+
+    def add_page(self, query, page, items):
+        """한 페이지의 결과를 추가 (flush되어야 끝난 페이지로 기록됨)"""
+        for item in items:
+            record = {"query": query, "page": page, "item": item}
+            self._lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._pending_pages.append((query, page))
+        if len(self._lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            self._file.write(''.join(self._lines).encode('utf-8'))
+            self.written += len(self._lines)
+            self._lines = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        for query, page in self._pending_pages:
+            self._completed.setdefault(query, set()).add(page)
+        self._pending_pages = []
+        self._save_checkpoint()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _save_checkpoint(self):
+        checkpoint = {
+            "bytes": self._file.tell(),
+            "queries": {query: sorted(pages) for query, pages in self._completed.items()},
+        }
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def export_json(jsonl_path, json_path):
+    """
+    JSONL을 기존 형식(들여쓰기 4칸 JSON)으로 변환
+
+    검색어가 하나면 결과 목록, 여러 개면 검색어 -> 결과 목록으로 저장하고,
+    페이지가 끝난 순서와 상관없이 검색어/페이지 순서로 정렬한다.
+    전체 결과를 메모리에 올리지 않도록 줄 위치만 정렬한 뒤 한 건씩 읽어 쓴다.
+
+    Returns:
+        변환한 결과 개수
+    """
+    index = []  # (검색어, 페이지, 줄 순서, 줄 시작 위치)
+    with open(jsonl_path, 'rb') as src:
+        offset = 0
+        for line_no, line in enumerate(src):
+            record = json.loads(line)
+            index.append((record['query'], record['page'], line_no, offset))
+            offset += len(line)
+    index.sort()
+    groups = [(query, list(entries)) for query, entries in itertools.groupby(index, key=lambda entry: entry[0])]
+
+    def dump_item(src, offset, indent):
+        src.seek(offset)
+        item = json.loads(src.readline())['item']
+        return textwrap.indent(json.dumps(item, ensure_ascii=False, indent=4), ' ' * indent)
+
+    with open(jsonl_path, 'rb') as src, open(json_path, 'w', encoding='utf-8') as dst:
+        if len(groups) <= 1:
+            # json.dump(list, indent=4)와 같은 모양
+            dst.write('[\n' if index else '[]')
+            for i, (_, _, _, offset) in enumerate(index):
+                dst.write((',\n' if i else '') + dump_item(src, offset, 4))
+            if index:
+                dst.write('\n]')
+        else:
+            dst.write('{\n')
+            for q, (query, entries) in enumerate(groups):
+                dst.write((',\n' if q else '') + f'    {json.dumps(query, ensure_ascii=False)}: [\n')
+                for i, (_, _, _, offset) in enumerate(entries):
+                    dst.write((',\n' if i else '') + dump_item(src, offset, 8))
+                dst.write('\n    ]')
+            dst.write('\n}')
+    return len(index)
@@ -0,0 +1,274 @@
+# 공공데이터 API 응답을 SQLite 파일에 저장해 두고 다시 실행할 때 재사용
+# 키는 API 키를 뺀 정규화된 URL, 엔드포인트별 유효 시간(TTL), ETag/Last-Modified 재검증,
+# 파일 크기 한도(오래 안 쓴 응답부터 삭제), 오프라인 재생(네트워크 없이 캐시만 사용)
+# API 키 오류, 결과 코드가 실패인 응답 등 API 오류 응답은 저장하지 않음
+#
+# 사용 예
+#   with ResponseCache(ttls={'bigdata.kepco.co.kr/openapi/v1/EVcharge.do': 24 * 3600}) as cache, \
+#           HttpClient(cache=cache) as client:
+#       ...
+#
+# 서울 열린데이터처럼 API 키가 경로에 들어가는 경우 redact로 키 값을 넘기면 캐시 키와 저장된 URL에서 ***로 바뀜
+# (키를 바꿔도 같은 캐시를 쓰고, 파일에 키가 남지 않음, ttls 앞부분도 *** 기준)
+#   ResponseCache(redact=[SEOUL_API_KEY], ttls={'openapi.seoul.go.kr:8088/***/xml/': 24 * 3600})
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+# 캐시 파일 경로
+HTTP_CACHE_PATH = os.environ.get('HTTP_CACHE_PATH', '.http_cache.sqlite')
+
+# 기본 유효 시간 (초, 엔드포인트별로 지정하지 않은 경우)
+HTTP_CACHE_TTL = int(os.environ.get('HTTP_CACHE_TTL', str(60 * 60)))
+
+# 캐시 파일 최대 크기 (바이트, 넘으면 오래 안 쓴 응답부터 삭제)
+HTTP_CACHE_MAX_BYTES = int(os.environ.get('HTTP_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+
+# 1이면 네트워크 없이 캐시된 응답만 사용 (유효 시간이 지나도 사용, 없으면 CacheMissError)
+HTTP_CACHE_OFFLINE = os.environ.get('HTTP_CACHE_OFFLINE', '0') == '1'
+
+# 캐시 키에서 뺄 인증 파라미터 (소문자로 비교)
+SECRET_PARAMS = {
+    'servicekey', 'apikey', 'api_key', 'key', 'authkey', 'access_token', 'client_id', 'client_secret',
+}
+
+# redact로 지정한 값 대신 넣는 문자열
+REDACTED = '***'
+
+# 성공을 뜻하는 결과 코드 (공공데이터포털 '00'/'0000', 서울 열린데이터 'INFO-000' 등)
+SUCCESS_CODES = {'00', '0', '0000', 'INFO-000'}
+
+# 오류 응답에만 나오는 표시 (공공데이터포털 인증 오류 등)
+ERROR_MARKERS = (b'returnAuthMsg', b'SERVICE_KEY_IS_NOT_REGISTERED')
+
+# 응답 본문은 압축을 푼 상태로 저장하므로 저장하지 않는 헤더
+_SKIP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class CacheMissError(Exception):
+    """오프라인 모드에서 캐시에 없는 요청"""
+
+
+def normalize_url(url, redact=()) -> str:
+    """
+    호스트를 소문자로, 쿼리 파라미터를 정렬하고 인증 파라미터를 뺀 URL
+
+    Args:
+        url: 요청 URL
+        redact: 경로나 다른 파라미터에 들어가는 API 키 등 URL에서 ***로 바꿀 값
+    """
+    parts = urlsplit(str(url))
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name.lower() not in SECRET_PARAMS)
+    normalized = f"{parts.scheme}://{parts.netloc.lower()}{parts.path}" + (f"?{urlencode(query)}" if query else '')
+    for value in redact:
+        if value:
+            normalized = normalized.replace(value, REDACTED)
+    return normalized
+
+
+def _code_ok(code) -> bool:
+    return code is None or str(code).strip() in SUCCESS_CODES
+
+
+def is_valid_response(response: httpx.Response) -> bool:
+    """
+    저장해도 되는 응답인지 확인 (ResponseCache의 기본 validate)
+
+    HTTP 200이어도 본문이 API 오류인 응답은 저장하지 않는다.
+    - 인증 오류 표시(returnAuthMsg, SERVICE_KEY_IS_NOT_REGISTERED)
+    - JSON: 최상위, header, response.header의 resultCode나 RESULT.CODE가 성공이 아님, errMsg/errCd가 있음
+    - XML: 최상위, header 아래 resultCode나 RESULT 아래 CODE가 성공이 아님
+    """
+    content = response.content
+    if any(marker in content for marker in ERROR_MARKERS):
+        return False
+    head = content.lstrip()[:1]
+    if head in (b'{', b'['):
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return False
+        if not isinstance(data, dict):
+            return True
+        if 'errMsg' in data or 'errCd' in data:
+            return False
+        holders = [data, data.get('header'), (data.get('response') or {}).get('header')]
+        # 서울 열린데이터는 {서비스명: {RESULT: ...}} 또는 오류일 때 {RESULT: ...}
+        results = [data.get('RESULT')] + [value.get('RESULT') for value in data.values() if isinstance(value, dict)]
+        return (all(_code_ok(holder.get('resultCode')) for holder in holders if isinstance(holder, dict))
+                and all(_code_ok(result.get('CODE')) for result in results if isinstance(result, dict)))
+    if head == b'<':
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError:
+            return False
+        codes = root.findall('resultCode') + root.findall('header/resultCode') + root.findall('RESULT/CODE')
+        if root.tag == 'RESULT':
+            codes += root.findall('CODE')
+        return all(_code_ok(elem.text) for elem in codes)
+    return True
+
+
+class CachedResponse:
+    """캐시에 저장된 응답 하나"""
+
+    def __init__(self, status, headers, content, expires_at, etag, last_modified):
+        self.status = status
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict:
+        """조건부 요청 헤더 (서버가 ETag/Last-Modified를 준 경우)"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self, url) -> httpx.Response:
+        return httpx.Response(
+            self.status, headers=self.headers, content=self.content, request=httpx.Request('GET', url),
+        )
+
+
+class ResponseCache:
+    """
+    GET 응답을 SQLite에 저장하는 캐시 (HttpClient/AsyncHttpClient의 cache 인자로 사용)
+
+    같은 파일을 여러 프로세스가 같이 써도 되도록 WAL 모드로 열고, 연결 하나를 잠금으로 보호해 스레드에서도 쓸 수 있다.
+
+    Args:
+        path: 캐시 파일 경로
+        ttl: 기본 유효 시간 (초)
+        ttls: 엔드포인트('호스트/경로' 앞부분) -> 유효 시간, 가장 길게 일치하는 항목을 사용 (0이면 저장 안 함)
+        max_bytes: 저장할 응답 본문 크기 합계의 한도
+        offline: True면 캐시된 응답만 사용
+        validate: 응답을 저장해도 되는지 확인하는 함수 (response -> bool, None이면 is_valid_response)
+        redact: URL 경로 등에 들어가 캐시 키와 저장된 URL에서 ***로 바꿀 값 (API 키 등)
+    """
+
+    def __init__(self, path: str = None, ttl: int = None, ttls: dict = None, max_bytes: int = None,
+                 offline: bool = None, validate=None, redact=()):
+        self.path = path or HTTP_CACHE_PATH
+        self.ttl = HTTP_CACHE_TTL if ttl is None else ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.offline = HTTP_CACHE_OFFLINE if offline is None else offline
+        self.validate = validate or is_valid_response
+        self.redact = tuple(redact)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT
+                )
+            ''')
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+            # 저장할 때마다 합계를 다시 구하지 않도록 크기 합계를 따로 유지 (한도를 넘으면 다시 계산)
+            self._total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def normalize(self, url) -> str:
+        """캐시 키와 로그에 쓰는 URL (인증 파라미터와 redact 값 제외)"""
+        return normalize_url(url, self.redact)
+
+    def key_for(self, url) -> str:
+        return hashlib.sha256(self.normalize(url).encode('utf-8')).hexdigest()
+
+    def ttl_for(self, url) -> int:
+        parts = urlsplit(self.normalize(url))
+        endpoint = f"{parts.netloc.lower()}{parts.path}"
+        matches = [prefix for prefix in self.ttls if endpoint.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else self.ttl
+
+    def lookup(self, key: str):
+        """저장된 응답 (없으면 None, 유효 시간이 지났어도 재검증/오프라인용으로 반환)"""
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT status, headers, body, expires_at, etag, last_modified FROM responses WHERE key = ?', (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        status, headers, body, expires_at, etag, last_modified = row
+        return CachedResponse(status, json.loads(headers), body, expires_at, etag, last_modified)
+
+    def store(self, key: str, url, response: httpx.Response):
+        """응답 저장 (유효 시간이 0이거나 validate를 통과하지 못한 API 오류 응답은 저장 안 함)"""
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or not self.validate(response):
+            return
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _SKIP_HEADERS]
+        now = time.time()
+        with self._lock, self._db:
+            old = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, self.normalize(url), response.status_code, json.dumps(headers), response.content,
+                 len(response.content), now, now + ttl, now,
+                 response.headers.get('ETag'), response.headers.get('Last-Modified')),
+            )
+            self._total += len(response.content) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str, url):
+        """304 Not Modified를 받은 응답의 유효 시간을 다시 시작"""
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                'UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?', (now + self.ttl_for(url), now, key),
+            )
+
+    def _evict(self):
+        # 다른 프로세스가 쓴 응답까지 포함해 합계를 다시 구하고, 한도를 넘으면 오래 안 쓴 응답부터 삭제 (잠금 안에서 호출)
+        self._total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if self._total <= self.max_bytes:
+            return
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._total -= size
+            if self._total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM responses')
+            self._total = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
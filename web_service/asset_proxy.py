@@ -0,0 +1,173 @@
+from playwright.async_api import Error as PlaywrightError
+import asyncio
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# 가로챌 요청 (data:, blob: 등은 브라우저가 직접 처리)
+REMOTE_URL_PATTERN = re.compile(r'^https?://')
+
+
+class AssetMissingError(Exception):
+    """오프라인 모드에서 캐시에 없는 외부 리소스가 요청됨"""
+
+    def __init__(self, urls: list):
+        self.urls = sorted(urls)
+        super().__init__(
+            f"오프라인 모드: 캐시에 없는 외부 리소스 {len(self.urls)}개 ({', '.join(self.urls[:10])})"
+        )
+
+
+class AssetProxy:
+    """
+    렌더링 중 외부 리소스(CDN 스크립트, 웹 폰트, 이미지 등)를 디스크 캐시에서 제공
+
+    BrowserContext의 요청을 가로채 URL별로 ContentStore에 저장된 응답을 돌려주고,
+    캐시에 없으면 원래 서버에서 받아 저장한 뒤 돌려준다.
+    offline=True이면 네트워크를 전혀 사용하지 않고, 캐시에 없는 요청은 즉시 실패시킨 뒤
+    check()에서 누락된 URL 목록과 함께 AssetMissingError를 발생시킨다.
+    """
+
+    def __init__(self, store, offline: bool = False, max_asset_bytes: int = 20 * 1024 * 1024):
+        """
+        Args:
+            store: 응답을 저장할 ContentStore
+            offline: 네트워크 없이 캐시만 사용할지 여부
+            max_asset_bytes: 캐시에 저장할 응답 하나의 최대 크기 (바이트)
+        """
+        self.store = store
+        self.offline = offline
+        self.max_asset_bytes = max_asset_bytes
+        self.fetched = 0
+
+    async def attach(self, context, missing: set):
+        """
+        컨텍스트의 http(s) 요청을 이 프록시로 연결
+
+        Args:
+            context: Playwright BrowserContext
+            missing: 오프라인 모드에서 캐시에 없던 URL을 기록할 집합
+        """
+        async def handle(route, request):
+            await self._handle(route, request, missing)
+        await context.route(REMOTE_URL_PATTERN, handle)
+
+    def check(self, missing: set):
+        """오프라인 모드에서 누락된 리소스가 있으면 AssetMissingError 발생"""
+        if missing:
+            raise AssetMissingError(missing)
+
+    def load(self, url: str):
+        """
+        캐시된 응답 조회
+
+        Returns:
+            (메타데이터, 본문) 또는 None
+        """
+        path = self.store.get(self.store.make_key(url))
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        header, _, body = data.partition(b'\n')
+        return json.loads(header), body
+
+    def save(self, url: str, status: int, headers: dict, body: bytes):
+        """응답을 캐시에 저장 (메타데이터 JSON 한 줄 + 본문)"""
+        meta = {
+            "url": url,
+            "status": status,
+            "content_type": headers.get('content-type', 'application/octet-stream'),
+        }
+        header = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        self.store.put_bytes(self.store.make_key(url), header + b'\n' + body)
+
+    def stats(self) -> dict:
+        return {
+            "offline": self.offline,
+            "fetched": self.fetched,
+            **self.store.stats(),
+        }
+
+    async def _handle(self, route, request, missing: set):
+        url = request.url
+        if request.method != 'GET':
+            if self.offline:
+                missing.add(url)
+                await route.abort('internetdisconnected')
+            else:
+                await route.continue_()
+            return
+
+        cached = self.load(url)
+        if cached is not None:
+            meta, body = cached
+            await route.fulfill(
+                status=meta['status'],
+                headers={
+                    "content-type": meta['content_type'],
+                    "access-control-allow-origin": "*",
+                },
+                body=body,
+            )
+            return
+
+        if self.offline:
+            missing.add(url)
+            logger.warning("오프라인 모드: 캐시에 없는 리소스 %s", url)
+            await route.abort('internetdisconnected')
+            return
+
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except PlaywrightError as e:
+            logger.warning("외부 리소스 요청 실패 %s: %s", url, e)
+            await route.abort('failed')
+            return
+
+        self.fetched += 1
+        if response.status == 200 and len(body) <= self.max_asset_bytes:
+            await asyncio.to_thread(self.save, url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+
+async def warm(html_content: str, proxy: AssetProxy, engine: str = None):
+    """
+    덱을 한 번 렌더링해 필요한 외부 리소스를 캐시에 채움 (오프라인 노드 배포 전 사전 준비용)
+
+    Returns:
+        새로 받아 온 리소스 개수
+    """
+    # pdf_converter가 이 모듈을 사용하므로 순환 import를 피해 함수 안에서 import
+    from pdf_converter import render_html_to_pdf_bytes
+    before = proxy.fetched
+    await render_html_to_pdf_bytes(html_content, engine=engine, asset_proxy=proxy)
+    return proxy.fetched - before
+
+
+if __name__ == "__main__":
+    # 사용법: python asset_proxy.py <캐시 디렉토리> <HTML 파일>...
+    # 만들어진 캐시 디렉토리를 오프라인 노드의 ASSET_CACHE_DIR로 복사해 사용
+    import asyncio
+    import sys
+    from content_store import ContentStore
+
+    if len(sys.argv) < 3:
+        print("사용법: python asset_proxy.py <캐시 디렉토리> <HTML 파일>...")
+        sys.exit(1)
+
+    logging.basicConfig(level=logging.INFO)
+    max_bytes = int(os.environ.get('ASSET_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+    proxy = AssetProxy(ContentStore(sys.argv[1], max_bytes, suffix='.asset'))
+    for html_path in sys.argv[2:]:
+        with open(html_path, 'r', encoding='utf-8') as f:
+            count = asyncio.run(warm(f.read(), proxy))
+        print(f"{html_path}: 리소스 {count}개 저장")
+    print(json.dumps(proxy.stats(), ensure_ascii=False, indent=2))
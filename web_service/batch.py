@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+import asyncio
+import io
+import json
+import logging
+import time
+import zipfile
+from pathlib import PurePosixPath
+
+logger = logging.getLogger(__name__)
+
+
+class BatchError(Exception):
+    """배치 요청 자체가 잘못됨 (파일 개수 초과, 손상된 zip 등)"""
+
+
+@dataclass
+class BatchItem:
+    """배치에 포함된 HTML 파일 하나"""
+    filename: str
+    data: bytes = None
+    error: str = None
+
+
+def expand_upload(filename: str, data: bytes, max_files: int = None, max_file_bytes: int = None,
+                  max_total_bytes: int = None) -> list:
+    """
+    업로드 하나를 배치 항목 목록으로 펼침
+
+    .html 파일은 그대로, .zip 파일은 안에 있는 .html 파일들로 펼친다.
+    그 외 파일은 실패 항목으로 남겨 보고서에 기록한다.
+    zip은 압축을 풀기 전에 파일 개수와 헤더의 크기로 제한을 확인하고,
+    헤더보다 큰 내용은 읽는 도중에 거절한다 (압축 폭탄 방지).
+
+    Args:
+        filename: 업로드 파일 이름
+        data: 업로드 내용
+        max_files: zip 안의 HTML 파일 최대 개수 (None이면 제한 없음)
+        max_file_bytes: zip 안의 HTML 파일 하나의 최대 크기 (압축 해제 후)
+        max_total_bytes: zip 안의 HTML 파일 크기 합계 최대값 (압축 해제 후)
+
+    Raises:
+        BatchError: zip 파일을 열 수 없거나 제한을 넘는 경우
+    """
+    lower = filename.lower()
+    if lower.endswith('.html') or lower.endswith('.htm'):
+        return [BatchItem(filename, data)]
+    if not lower.endswith('.zip'):
+        return [BatchItem(filename, error="HTML 또는 zip 파일만 변환할 수 있습니다.")]
+
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile:
+        raise BatchError(f"zip 파일을 열 수 없습니다: {filename}")
+
+    items = []
+    with archive:
+        members = [
+            info for info in archive.infolist()
+            if not info.is_dir() and not info.filename.startswith('__MACOSX/')
+            and info.filename.lower().endswith(('.html', '.htm'))
+        ]
+        if max_files is not None and len(members) > max_files:
+            raise BatchError(f"zip 파일 안의 HTML 파일이 너무 많습니다: {filename} ({len(members)}개, 최대 {max_files}개)")
+        for info in members:
+            if max_file_bytes is not None and info.file_size > max_file_bytes:
+                raise BatchError(f"zip 안의 파일이 너무 큽니다: {info.filename} (최대 {max_file_bytes}바이트)")
+        total = sum(info.file_size for info in members)
+        if max_total_bytes is not None and total > max_total_bytes:
+            raise BatchError(f"zip 파일의 압축을 푼 크기가 너무 큽니다: {filename} (최대 {max_total_bytes}바이트)")
+
+        for info in members:
+            # 헤더의 크기를 믿지 않고 제한보다 1바이트 더 읽어 확인
+            limit = info.file_size if max_file_bytes is None else min(info.file_size, max_file_bytes)
+            try:
+                with archive.open(info) as member:
+                    content = member.read(limit + 1)
+            except zipfile.BadZipFile as e:
+                raise BatchError(f"zip 안의 파일을 읽을 수 없습니다: {info.filename} ({e})")
+            if len(content) > limit:
+                raise BatchError(f"zip 안의 파일 크기가 헤더와 다릅니다: {info.filename}")
+            items.append(BatchItem(info.filename, content))
+    if not items:
+        return [BatchItem(filename, error="zip 파일에 HTML 파일이 없습니다.")]
+    return items
+
+
+class ZipChunks:
+    """ZipFile이 쓰는 내용을 모아 두었다가 청크로 꺼내는 쓰기 전용 버퍼 (seek 불가 스트림)"""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def _unique_name(name: str, used: set) -> str:
+    stem, suffix = name.rsplit('.', 1)
+    candidate = name
+    counter = 2
+    while candidate in used:
+        candidate = f"{stem}_{counter}.{suffix}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+async def stream_batch_zip(items: list, convert, concurrency: int):
+    """
+    배치 항목들을 최대 concurrency개씩 변환하며 끝나는 순서대로 zip으로 스트리밍
+
+    한 파일이 실패해도 배치는 계속 진행하고, 마지막에 파일별 결과를 report.json으로 넣는다.
+
+    Args:
+        items: BatchItem 목록
+        convert: async 함수 convert(item) -> (PDF 바이트, 추가 정보 dict)
+        concurrency: 동시에 변환할 파일 개수
+
+    Yields:
+        zip 스트림 청크
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(index: int, item: BatchItem):
+        started = time.perf_counter()
+        if item.error is not None:
+            return index, None, {"status": "failed", "error": item.error}
+        async with semaphore:
+            try:
+                pdf_bytes, info = await convert(item)
+            except Exception as e:
+                logger.warning("배치 변환 실패 %s: %s", item.filename, e)
+                return index, None, {"status": "failed", "error": str(e)}
+        return index, pdf_bytes, {
+            "status": "done",
+            "elapsed_ms": round((time.perf_counter() - started) * 1000),
+            **info,
+        }
+
+    buffer = ZipChunks()
+    archive = zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED)
+    used_names = set()
+    report = [None] * len(items)
+    tasks = [asyncio.create_task(run(index, item)) for index, item in enumerate(items)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            index, pdf_bytes, result = await finished
+            entry = {"filename": items[index].filename, **result}
+            if pdf_bytes is not None:
+                name = f"{PurePosixPath(items[index].filename).stem}_merged.pdf"
+                entry["output"] = _unique_name(name, used_names)
+                entry["bytes"] = len(pdf_bytes)
+                # PDF는 이미 압축되어 있으므로 다시 압축하지 않고 저장
+                archive.writestr(entry["output"], pdf_bytes)
+                yield buffer.take()
+            report[index] = entry
+
+        summary = {
+            "total": len(items),
+            "succeeded": sum(1 for entry in report if entry["status"] == "done"),
+            "failed": sum(1 for entry in report if entry["status"] == "failed"),
+            "files": report,
+        }
+        archive.writestr('report.json', json.dumps(summary, ensure_ascii=False, indent=2))
+        archive.close()
+        yield buffer.take()
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 변환 취소 (convert가 CancelledError를 받아 대기 중인 작업을 정리)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,580 @@
+"""
+HTML → PDF 변환 파이프라인 벤치마크
+
+합성 슬라이드 덱(섹션 수, 이미지, Tailwind 여부 조합)을 만들어
+convert_html_to_pdf 직접 호출 또는 실행 중인 서버의 /convert 엔드포인트로 변환하고,
+지연 시간(p50/p95/p99), 초당 슬라이드 수, 최대 RSS, Chromium 프로세스 수,
+임시 디스크 사용량, 출력 크기를 JSON으로 기록한다.
+저장해 둔 기준 결과(--baseline)와 비교해 임계값을 넘는 성능 저하가 있으면 종료 코드 1을 반환한다.
+
+외부 네트워크는 사용하지 않는다: 이미지는 data URI로 넣고, Tailwind 런타임은
+--tailwind-js로 받은 로컬 파일을 오프라인 리소스 캐시에 넣어 제공한다.
+
+사용법:
+    python benchmark.py --sections 1,10,50 --images both --output results.json
+    python benchmark.py --tailwind-js tailwind.js --tailwind both --baseline baseline.json
+    python benchmark.py --mode endpoint --url http://127.0.0.1:8000 --server-pid 12345
+    python benchmark.py --check-slicer ../wow.html ../figma_import_version.html
+"""
+from asset_proxy import AssetProxy
+from browser_pool import BrowserPool
+from content_store import ContentStore
+from html_slicer import SliceError, compare_deck_parts, parse_deck, parse_deck_soup, slice_deck
+from pdf_converter import convert_html_to_pdf, RENDER_ENGINES
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+import zlib
+
+TAILWIND_CDN_URL = "https://cdn.tailwindcss.com"
+
+# 섹션 하나에 들어가는 본문 (Tailwind 유틸리티 클래스 사용)
+SECTION_TEMPLATE = """
+            <section class="slide {active}" data-index="{index}">
+                <div class="p-12 flex flex-col h-full bg-soft-white">
+                    <h1 class="text-5xl font-bold text-dark-gray mb-6">슬라이드 {number}: 합성 벤치마크</h1>
+                    <ul class="text-2xl text-dark-gray space-y-3 list-disc pl-8">
+                        <li>항목 {number}-1: 렌더링 성능 측정을 위한 텍스트</li>
+                        <li>항목 {number}-2: <span class="text-coral-red font-semibold">강조 텍스트</span></li>
+                        <li>항목 {number}-3: The quick brown fox jumps over the lazy dog.</li>
+                    </ul>
+                    {image}
+                </div>
+            </section>"""
+
+BASE_STYLE = """
+    <style>
+        body { margin: 0; background-color: #202124; font-family: sans-serif; }
+        #presentation-container { width: 1280px; height: 720px; position: relative; }
+        .slide { position: absolute; top: 0; left: 0; width: 100%; height: 100%; opacity: 0; visibility: hidden; }
+        .slide.active { opacity: 1; visibility: visible; }
+        .bg-soft-white { background-color: #F9F8F6; }
+        .p-12 { padding: 3rem; }
+        .text-5xl { font-size: 3rem; }
+        .text-2xl { font-size: 1.5rem; }
+        .font-bold { font-weight: 700; }
+        .text-coral-red { color: #FF6B6B; }
+        .bench-image { margin-top: 1.5rem; width: 480px; height: 270px; object-fit: cover; }
+    </style>"""
+
+TAILWIND_HEAD = f"""
+    <script src="{TAILWIND_CDN_URL}"></script>
+    <script>
+        tailwind.config = {{
+            theme: {{
+                extend: {{
+                    colors: {{
+                        'soft-white': '#F9F8F6',
+                        'dark-gray': '#333333',
+                        'coral-red': '#FF6B6B',
+                    }}
+                }}
+            }}
+        }}
+    </script>"""
+
+
+def _png_data_uri(width: int, height: int, seed: int) -> str:
+    """압축이 잘 되지 않는 노이즈 PNG를 data URI로 생성 (실제 사진과 비슷한 디코딩 비용)"""
+    rng = random.Random(seed)
+    rows = b''.join(b'\x00' + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    png = (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(rows, 6))
+        + chunk(b'IEND', b'')
+    )
+    return 'data:image/png;base64,' + base64.b64encode(png).decode('ascii')
+
+
+def generate_deck(sections: int, images: bool = False, tailwind: bool = False,
+                  image_size=(320, 180), distinct_images: int = 8) -> str:
+    """
+    합성 슬라이드 덱 HTML 생성 (같은 인자면 항상 같은 결과)
+
+    Args:
+        sections: 섹션(슬라이드) 개수
+        images: 슬라이드마다 data URI 이미지를 넣을지 여부
+        tailwind: Tailwind CDN 런타임과 설정을 head에 넣을지 여부
+        image_size: 이미지 크기 (가로, 세로)
+        distinct_images: 서로 다른 이미지 개수 (슬라이드들이 돌아가며 사용)
+    """
+    image_uris = [_png_data_uri(*image_size, seed) for seed in range(distinct_images)] if images else []
+    body = []
+    for index in range(sections):
+        image = ''
+        if images:
+            image = f'<img class="bench-image" src="{image_uris[index % len(image_uris)]}" alt="image {index + 1}">'
+        body.append(SECTION_TEMPLATE.format(
+            active='active' if index == 0 else '', index=index, number=index + 1, image=image
+        ))
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>Benchmark deck ({sections} slides)</title>{TAILWIND_HEAD if tailwind else ''}{BASE_STYLE}
+</head>
+<body class="flex items-center justify-center min-h-screen">
+    <div id="presentation-container" class="overflow-hidden">
+        <div id="slides-wrapper" class="w-full h-full relative">{''.join(body)}
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def percentile(values: list, q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return total
+
+
+def _process_table() -> dict:
+    """pid -> (ppid, RSS 바이트, 이름) (/proc 기반, Linux 전용)"""
+    table = {}
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+            with open(f'/proc/{entry}/statm', 'r') as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        name = stat[stat.find('(') + 1:stat.rfind(')')]
+        ppid = int(stat[stat.rfind(')') + 2:].split()[1])
+        table[int(entry)] = (ppid, rss_pages * page_size, name)
+    return table
+
+
+class ResourceSampler:
+    """
+    벤치마크 중 주기적으로 자원 사용량을 측정해 최댓값을 기록
+
+    - RSS: root_pid와 모든 하위 프로세스(Chromium 포함)의 RSS 합
+    - Chromium 프로세스 수: 하위 프로세스 중 이름에 'chrom' 또는 'headless'가 들어간 것
+    - 임시 디스크 사용량: watch_dirs 크기 합
+    """
+
+    def __init__(self, root_pid: int, watch_dirs: list, interval: float = 0.1):
+        self.root_pid = root_pid
+        self.watch_dirs = watch_dirs
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_chromium = 0
+        self.peak_disk = 0
+        self._task = None
+        self._supported = os.path.isdir('/proc')
+
+    def sample(self):
+        if self._supported:
+            table = _process_table()
+            children = {}
+            for pid, (ppid, _, _) in table.items():
+                children.setdefault(ppid, []).append(pid)
+            tree, stack = [], [self.root_pid]
+            while stack:
+                pid = stack.pop()
+                if pid in table:
+                    tree.append(pid)
+                stack.extend(children.get(pid, []))
+            self.peak_rss = max(self.peak_rss, sum(table[pid][1] for pid in tree))
+            chromium = sum(
+                1 for pid in tree
+                if 'chrom' in table[pid][2].lower() or 'headless' in table[pid][2].lower()
+            )
+            self.peak_chromium = max(self.peak_chromium, chromium)
+        disk = sum(_directory_size(path) for path in self.watch_dirs if os.path.isdir(path))
+        self.peak_disk = max(self.peak_disk, disk)
+
+    async def _run(self):
+        while True:
+            await asyncio.to_thread(self.sample)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self.sample()
+
+    def result(self) -> dict:
+        return {
+            "peak_rss_mb": round(self.peak_rss / (1024 * 1024), 1) if self._supported else None,
+            "peak_chromium_processes": self.peak_chromium if self._supported else None,
+            "peak_temp_bytes": self.peak_disk,
+        }
+
+
+def _multipart_body(filename: str, content: bytes):
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: text/html\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def _post_convert(url: str, html: str, engine: str, render_concurrency: int):
+    """/convert 엔드포인트 호출 (스레드에서 실행) -> (PDF 크기, X-Cache)"""
+    body, content_type = _multipart_body('bench.html', html.encode('utf-8'))
+    query = f"?engine={engine}&concurrency={render_concurrency}"
+    request = urllib.request.Request(
+        url.rstrip('/') + '/convert' + query, data=body, method='POST',
+        headers={'Content-Type': content_type}
+    )
+    with urllib.request.urlopen(request, timeout=3600) as response:
+        return len(response.read()), response.headers.get('X-Cache')
+
+
+async def run_scenario(scenario: dict, args, pool=None, asset_proxy=None) -> dict:
+    """
+    시나리오 하나를 repeat번 (동시에 args.concurrency개씩) 변환하고 측정 결과 반환
+    """
+    html = generate_deck(scenario['sections'], scenario['images'], scenario['tailwind'])
+    output_dir = tempfile.mkdtemp(prefix='bench_')
+    if args.mode == 'endpoint':
+        root_pid = args.server_pid or os.getpid()
+        watch_dirs = [args.server_temp_dir]
+    else:
+        root_pid = os.getpid()
+        watch_dirs = [output_dir]
+    sampler = ResourceSampler(root_pid, watch_dirs)
+
+    latencies, output_sizes, cache_headers, errors = [], [], {}, []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def convert_once():
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if args.mode == 'endpoint':
+                    size, cache = await asyncio.to_thread(
+                        _post_convert, args.url, html, scenario['engine'], args.render_concurrency
+                    )
+                    cache_headers[cache] = cache_headers.get(cache, 0) + 1
+                else:
+                    pdf_path = await convert_html_to_pdf(
+                        html, output_dir=output_dir, pool=pool, concurrency=args.render_concurrency,
+                        engine=scenario['engine'], asset_proxy=asset_proxy
+                    )
+                    size = os.path.getsize(pdf_path)
+            except Exception as e:
+                errors.append(str(e))
+                return
+            latencies.append((time.perf_counter() - started) * 1000)
+            output_sizes.append(size)
+
+    sampler.start()
+    wall_started = time.perf_counter()
+    try:
+        await asyncio.gather(*(convert_once() for _ in range(args.repeat)))
+    finally:
+        wall = time.perf_counter() - wall_started
+        await sampler.stop()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {
+        **scenario,
+        "html_bytes": len(html.encode('utf-8')),
+        "runs": len(latencies),
+        "errors": errors[:5],
+        "latency_ms": {
+            "p50": _round(percentile(latencies, 50)),
+            "p95": _round(percentile(latencies, 95)),
+            "p99": _round(percentile(latencies, 99)),
+            "mean": _round(sum(latencies) / len(latencies)) if latencies else None,
+        },
+        "slides_per_sec": round(scenario['sections'] * len(latencies) / wall, 3) if wall > 0 else None,
+        "output_bytes": max(output_sizes) if output_sizes else None,
+        "x_cache": cache_headers or None,
+        **sampler.result(),
+    }
+
+
+def _round(value):
+    return round(value, 1) if value is not None else None
+
+
+def _scenario_name(scenario: dict) -> str:
+    return (
+        f"{scenario['mode']}/{scenario['engine']}/{scenario['sections']}s"
+        f"{'/img' if scenario['images'] else ''}{'/tw' if scenario['tailwind'] else ''}"
+    )
+
+
+def build_scenarios(args) -> list:
+    flags = {'off': [False], 'on': [True], 'both': [False, True]}
+    if args.tailwind != 'off' and not args.tailwind_js:
+        print("--tailwind-js가 없어 Tailwind 시나리오는 건너뜁니다 (외부 네트워크를 사용하지 않음).", file=sys.stderr)
+    scenarios = []
+    for engine in args.engines:
+        for sections in args.sections:
+            for images in flags[args.images]:
+                for tailwind in flags[args.tailwind]:
+                    if tailwind and not args.tailwind_js:
+                        continue
+                    scenario = {
+                        "mode": args.mode,
+                        "engine": engine,
+                        "sections": sections,
+                        "images": images,
+                        "tailwind": tailwind,
+                    }
+                    scenario["name"] = _scenario_name(scenario)
+                    scenarios.append(scenario)
+    return scenarios
+
+
+def _offline_asset_proxy(args, cache_dir: str) -> AssetProxy:
+    """로컬 Tailwind 런타임만 들어 있는 오프라인 리소스 캐시 (그 외 외부 요청은 즉시 실패)"""
+    proxy = AssetProxy(ContentStore(cache_dir, 256 * 1024 * 1024, suffix='.asset'), offline=True)
+    if args.tailwind_js:
+        with open(args.tailwind_js, 'rb') as f:
+            proxy.save(TAILWIND_CDN_URL, 200, {'content-type': 'application/javascript'}, f.read())
+    return proxy
+
+
+async def run_benchmark(args) -> dict:
+    scenarios = build_scenarios(args)
+    results = []
+    cache_dir = tempfile.mkdtemp(prefix='bench_assets_')
+    pool = None
+    try:
+        asset_proxy = _offline_asset_proxy(args, cache_dir)
+        if args.mode == 'direct':
+            pool = BrowserPool(size=args.pool_size, contexts_per_browser=max(4, args.render_concurrency))
+            await pool.start()
+        for scenario in scenarios:
+            print(f"실행 중: {scenario['name']} x{args.repeat} (동시 {args.concurrency})", file=sys.stderr)
+            result = await run_scenario(scenario, args, pool=pool, asset_proxy=asset_proxy)
+            results.append(result)
+            print(
+                f"  p50 {result['latency_ms']['p50']}ms, p95 {result['latency_ms']['p95']}ms, "
+                f"{result['slides_per_sec']} slides/s, RSS {result['peak_rss_mb']}MB",
+                file=sys.stderr
+            )
+    finally:
+        if pool is not None:
+            await pool.stop()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mode": args.mode,
+            "repeat": args.repeat,
+            "concurrency": args.concurrency,
+            "render_concurrency": args.render_concurrency,
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(current: dict, baseline: dict, threshold: float, memory_threshold: float) -> list:
+    """
+    기준 결과와 비교해 임계값을 넘은 성능 저하 목록 반환
+
+    - 지연 시간(p50, p95)과 최대 RSS는 증가, 초당 슬라이드 수는 감소를 저하로 본다
+    """
+    previous = {result['name']: result for result in baseline.get('results', [])}
+    regressions = []
+    for result in current['results']:
+        before = previous.get(result['name'])
+        if before is None:
+            continue
+        checks = [
+            ("latency p50", result['latency_ms']['p50'], before['latency_ms']['p50'], threshold, True),
+            ("latency p95", result['latency_ms']['p95'], before['latency_ms']['p95'], threshold, True),
+            ("slides/sec", result['slides_per_sec'], before['slides_per_sec'], threshold, False),
+            ("peak RSS", result['peak_rss_mb'], before['peak_rss_mb'], memory_threshold, True),
+        ]
+        for metric, now, then, limit, higher_is_worse in checks:
+            if not now or not then:
+                continue
+            change = (now - then) / then
+            if (change if higher_is_worse else -change) > limit:
+                regressions.append({
+                    "scenario": result['name'],
+                    "metric": metric,
+                    "baseline": then,
+                    "current": now,
+                    "change": round(change, 4),
+                })
+    return regressions
+
+
+# 동등성 검사용 경계 사례 (속성 따옴표, 중첩 section, script 안의 태그, 주석, 엔티티 등)
+SLICER_EDGE_CASES = {
+    "unquoted-attributes": (
+        '<html><head><title>t</title></head><body class=" a  b ">'
+        '<div id=presentation-container class=x><div id="slides-wrapper" style="width: 10px;&amp;">'
+        '<section class=foo data-x="a>b">one<br>two <img src=x></section></div></div></body></html>'
+    ),
+    "nested-sections": (
+        '<body><section>out<section class="active in">nested</section></section>'
+        "<section class='q'><p>&amp; &lt;</section></body>"
+    ),
+    "tags-in-script-and-comments": (
+        '<head><script>var s = "<section>not a slide</section>";</script>'
+        '<style>.a::after { content: "<section>"; }</style></head>'
+        '<body><!-- <section>commented</section> --><SECTION CLASS="Upper">x</SECTION></body>'
+    ),
+    "no-head-no-wrapper": '<section>only</section><section class="">empty class</section>',
+    "unclosed-head": (
+        '<html><head><style>.a { color: red; }</style><script>tailwind.config = {};</script>'
+        '<body class="b"><section class="s">one</section></body></html>'
+    ),
+}
+
+
+def check_slicer(paths: list) -> list:
+    """
+    html_slicer.parse_deck과 BeautifulSoup 기반 추출 결과가 같은지 검사하고 추출 시간 비교
+
+    합성 덱, 경계 사례, 주어진 HTML 파일들을 검사한다.
+
+    Returns:
+        문서별 결과 목록 (differences가 비어 있으면 동등, fallback이면 slice_deck 대신 BeautifulSoup 경로 사용)
+    """
+    documents = dict(SLICER_EDGE_CASES)
+    for sections in (1, 50):
+        for images in (False, True):
+            documents[f"synthetic-{sections}{'-img' if images else ''}"] = generate_deck(
+                sections, images=images, tailwind=True
+            )
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            documents[path] = f.read()
+
+    results = []
+    for name, html in documents.items():
+        try:
+            slice_deck(html)
+            fallback = False
+        except SliceError:
+            fallback = True
+        timings = {}
+        for label, extract in (("slicer_ms", parse_deck), ("soup_ms", parse_deck_soup)):
+            started = time.perf_counter()
+            extract(html)
+            timings[label] = _round((time.perf_counter() - started) * 1000)
+        results.append({
+            "document": name, "differences": compare_deck_parts(html), "fallback": fallback, **timings
+        })
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HTML → PDF 변환 벤치마크")
+    parser.add_argument('--mode', choices=('direct', 'endpoint'), default='direct',
+                        help="direct: convert_html_to_pdf 직접 호출, endpoint: 실행 중인 서버의 /convert 호출")
+    parser.add_argument('--sections', default='1,10,50',
+                        help="덱 섹션 수 목록 (쉼표 구분, 1~500)")
+    parser.add_argument('--images', choices=('off', 'on', 'both'), default='both')
+    parser.add_argument('--tailwind', choices=('off', 'on', 'both'), default='off')
+    parser.add_argument('--tailwind-js', help="Tailwind CDN 런타임 로컬 사본 (Tailwind 시나리오에 필요)")
+    parser.add_argument('--engines', default=','.join(RENDER_ENGINES), help="렌더링 엔진 목록 (쉼표 구분)")
+    parser.add_argument('--repeat', type=int, default=5, help="시나리오별 변환 횟수")
+    parser.add_argument('--concurrency', type=int, default=1, help="동시에 실행할 변환 개수")
+    parser.add_argument('--render-concurrency', type=int, default=1, help="변환 하나에서 동시에 렌더링할 슬라이드 개수")
+    parser.add_argument('--pool-size', type=int, default=1, help="direct 모드 브라우저 풀 크기")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="endpoint 모드 서버 주소")
+    parser.add_argument('--server-pid', type=int, help="endpoint 모드에서 RSS/Chromium 수를 측정할 서버 PID")
+    parser.add_argument('--server-temp-dir', default=os.path.join(os.path.dirname(__file__), 'temp'),
+                        help="endpoint 모드에서 디스크 사용량을 측정할 서버 임시 디렉토리")
+    parser.add_argument('--check-slicer', nargs='*', metavar='HTML',
+                        help="렌더링 대신 section 추출기 동등성 검사만 실행 (추가로 검사할 HTML 파일)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON")
+    parser.add_argument('--threshold', type=float, default=0.10, help="지연 시간/처리량 허용 저하 비율")
+    parser.add_argument('--memory-threshold', type=float, default=0.20, help="최대 RSS 허용 증가 비율")
+    args = parser.parse_args(argv)
+
+    args.sections = [int(value) for value in args.sections.split(',') if value.strip()]
+    if any(not 1 <= value <= 500 for value in args.sections):
+        parser.error("--sections 값은 1~500 사이여야 합니다.")
+    args.engines = [value.strip() for value in args.engines.split(',') if value.strip()]
+    for engine in args.engines:
+        if engine not in RENDER_ENGINES:
+            parser.error(f"지원하지 않는 렌더링 엔진입니다: {engine}")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.check_slicer is not None:
+        results = check_slicer(args.check_slicer)
+        failed = [result for result in results if result['differences']]
+        for result in failed:
+            print(f"추출 결과 불일치: {result['document']} {result['differences']}", file=sys.stderr)
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return 1 if failed else 0
+
+    report = asyncio.run(run_benchmark(args))
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.threshold, args.memory_threshold)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(
+                f"성능 저하: {regression['scenario']} {regression['metric']} "
+                f"{regression['baseline']} -> {regression['current']} ({regression['change']:+.1%})",
+                file=sys.stderr
+            )
+        if regressions:
+            exit_code = 1
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright, Error as PlaywrightError
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _BrowserSlot:
+    """풀 안의 브라우저 하나와 그 사용 현황"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.browser = None
+        self.active_contexts = 0
+        self.render_count = 0
+        self.launch_count = 0
+        self.crashed = False
+        self.launching = False  # 재시작 중 (잠금 밖에서 띄우는 동안 다른 대여에서 제외)
+
+    def is_healthy(self) -> bool:
+        return self.browser is not None and not self.crashed and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    앱 전체에서 공유하는 Chromium 브라우저 풀
+
+    브라우저는 앱 시작 시 한 번 띄워 두고, 변환 요청마다 격리된 BrowserContext를 빌려준다.
+    max_renders_per_browser 횟수만큼 사용했거나 크래시가 감지된 브라우저는 새로 띄운다.
+    """
+
+    def __init__(self, size: int = 2, contexts_per_browser: int = 4,
+                 max_renders_per_browser: int = 200, launch_options: dict = None):
+        """
+        Args:
+            size: 유지할 브라우저 프로세스 개수
+            contexts_per_browser: 브라우저 하나에서 동시에 빌려줄 수 있는 컨텍스트 개수
+            max_renders_per_browser: 이 횟수만큼 렌더링한 브라우저는 재시작 (메모리 누수 방지)
+            launch_options: chromium.launch()에 전달할 옵션
+        """
+        if size < 1:
+            raise ValueError("브라우저 풀 크기는 1 이상이어야 합니다.")
+        self.size = size
+        self.contexts_per_browser = contexts_per_browser
+        self.max_renders_per_browser = max_renders_per_browser
+        self.launch_options = launch_options or {}
+
+        self._playwright = None
+        self._slots = [_BrowserSlot(i) for i in range(size)]
+        self._lock = asyncio.Lock()
+        self._slot_released = asyncio.Condition(self._lock)
+        self._started = False
+
+    @property
+    def capacity(self) -> int:
+        """동시에 빌려줄 수 있는 최대 컨텍스트 개수"""
+        return self.size * self.contexts_per_browser
+
+    async def start(self):
+        """Playwright를 시작하고 브라우저를 미리 띄운다"""
+        if self._started:
+            return
+        self._playwright = await async_playwright().start()
+        for slot in self._slots:
+            await self._launch(slot)
+        self._started = True
+        logger.info("브라우저 풀 시작: 브라우저 %d개, 최대 컨텍스트 %d개", self.size, self.capacity)
+
+    async def stop(self):
+        """모든 브라우저와 Playwright를 종료한다"""
+        async with self._lock:
+            for slot in self._slots:
+                await self._close_browser(slot)
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+            self._started = False
+
+    @asynccontextmanager
+    async def context(self, **context_options):
+        """
+        격리된 BrowserContext를 빌려주는 컨텍스트 매니저
+
+        Args:
+            context_options: browser.new_context()에 전달할 옵션
+
+        Yields:
+            새 BrowserContext (블록이 끝나면 자동으로 닫힘)
+        """
+        if not self._started:
+            raise RuntimeError("브라우저 풀이 시작되지 않았습니다.")
+
+        slot = await self._acquire_slot()
+        browser = slot.browser
+        context = None
+        try:
+            context = await browser.new_context(**context_options)
+            yield context
+            slot.render_count += 1
+        except PlaywrightError:
+            # 브라우저 연결이 끊겼다면 크래시로 보고 다음 대여 전에 재시작
+            if not browser.is_connected():
+                self._on_disconnected(slot, browser)
+            raise
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except PlaywrightError:
+                    self._on_disconnected(slot, browser)
+            await self._release_slot(slot)
+
+    def stats(self) -> dict:
+        """헬스 체크용 풀 상태"""
+        return {
+            "size": self.size,
+            "capacity": self.capacity,
+            "browsers": [
+                {
+                    "index": slot.index,
+                    "healthy": slot.is_healthy(),
+                    "active_contexts": slot.active_contexts,
+                    "render_count": slot.render_count,
+                    "launch_count": slot.launch_count,
+                }
+                for slot in self._slots
+            ],
+        }
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        # 잠금 안에서는 슬롯만 예약하고, 브라우저 재시작은 잠금 밖에서 (그동안 다른 슬롯 대여가 막히지 않도록)
+        async with self._slot_released:
+            while True:
+                slot = self._pick_slot()
+                if slot is not None:
+                    break
+                await self._slot_released.wait()
+            slot.active_contexts += 1
+            relaunch = not slot.is_healthy()
+            if relaunch:
+                slot.launching = True
+
+        if relaunch:
+            logger.warning("브라우저 %d 비정상 상태 감지, 재시작합니다.", slot.index)
+            try:
+                await self._relaunch(slot)
+            except BaseException:
+                async with self._slot_released:
+                    slot.active_contexts -= 1
+                    slot.launching = False
+                    self._slot_released.notify_all()
+                raise
+            async with self._slot_released:
+                slot.launching = False
+                self._slot_released.notify_all()
+        return slot
+
+    def _pick_slot(self):
+        """가장 한가한 브라우저 선택 (재활용 대기 중인 브라우저는 제외)"""
+        candidates = []
+        for slot in self._slots:
+            if slot.launching or slot.active_contexts >= self.contexts_per_browser:
+                continue
+            if slot.render_count >= self.max_renders_per_browser and slot.active_contexts > 0:
+                # 진행 중인 작업이 끝나면 재시작되므로 새 작업은 받지 않음
+                continue
+            candidates.append(slot)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda s: s.active_contexts)
+
+    async def _release_slot(self, slot: _BrowserSlot):
+        async with self._slot_released:
+            slot.active_contexts -= 1
+            recycle = (slot.active_contexts == 0 and not slot.launching
+                       and slot.render_count >= self.max_renders_per_browser)
+            if recycle:
+                slot.launching = True
+            else:
+                self._slot_released.notify_all()
+                return
+
+        logger.info("브라우저 %d 렌더링 %d회 도달, 재시작합니다.", slot.index, slot.render_count)
+        try:
+            await self._relaunch(slot)
+        except Exception:
+            # 브라우저가 없는 슬롯은 다음 대여 때 다시 띄움
+            logger.exception("브라우저 %d 재시작 실패", slot.index)
+        finally:
+            # 재시작이 실패해도 기다리는 대여가 멈추지 않도록 항상 깨움
+            async with self._slot_released:
+                slot.launching = False
+                self._slot_released.notify_all()
+
+    async def _relaunch(self, slot: _BrowserSlot):
+        await self._close_browser(slot)
+        await self._launch(slot)
+
+    async def _launch(self, slot: _BrowserSlot):
+        slot.browser = await self._playwright.chromium.launch(**self.launch_options)
+        slot.render_count = 0
+        slot.crashed = False
+        slot.launch_count += 1
+        slot.browser.on("disconnected", lambda browser: self._on_disconnected(slot, browser))
+
+    def _on_disconnected(self, slot: _BrowserSlot, browser):
+        # 재시작으로 교체된 이전 브라우저의 종료 이벤트는 무시
+        if slot.browser is browser:
+            slot.crashed = True
+
+    async def _close_browser(self, slot: _BrowserSlot):
+        if slot.browser is None:
+            return
+        try:
+            if slot.browser.is_connected():
+                await slot.browser.close()
+        except PlaywrightError:
+            pass
+        slot.browser = None
@@ -0,0 +1,231 @@
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 다른 프로세스의 변경을 반영하려고 디렉토리를 다시 읽는 최소 간격 (초)
+RESCAN_INTERVAL = 5.0
+
+
+class ContentStore:
+    """
+    디스크 용량 제한이 있는 content-addressed 파일 저장소
+
+    키(내용 해시)별로 파일 하나를 저장하고, 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 지운다 (LRU).
+    사용 시각은 파일 mtime에 기록하므로 서버를 재시작해도 순서가 유지된다.
+    여러 프로세스가 같은 디렉토리를 쓸 수 있도록, 저장할 때 용량을 넘었거나 RESCAN_INTERVAL이 지났으면
+    디렉토리를 다시 읽어 전체 크기와 mtime 순서로 정리하고, 다른 프로세스가 저장한 항목도 조회한다.
+    저장(put_*)은 파일 쓰기와 디렉토리 읽기가 있으므로 async 코드에서는 asyncio.to_thread로 호출한다
+    (인덱스는 잠금으로 보호하고, 디렉토리 읽기는 잠금 밖에서 해서 조회가 기다리지 않음).
+    """
+
+    def __init__(self, root: str, max_bytes: int, suffix: str = ''):
+        """
+        Args:
+            root: 저장 디렉토리
+            max_bytes: 최대 디스크 사용량 (바이트)
+            suffix: 저장 파일 확장자 (예: '.pdf')
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._index = OrderedDict()  # key -> 파일 크기 (오래된 순)
+        self._total_bytes = 0
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        내용과 설정으로 저장소 키 생성
+
+        Args:
+            parts: bytes, str 또는 JSON 직렬화 가능한 값 (dict 등)
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, bytes):
+                data = part
+            elif isinstance(part, str):
+                data = part.encode('utf-8')
+            else:
+                data = json.dumps(part, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            # 경계가 섞이지 않도록 길이를 함께 넣는다
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + self.suffix)
+
+    def get(self, key: str):
+        """
+        저장된 파일 경로 조회
+
+        Returns:
+            파일 경로 (없으면 None)
+        """
+        path = self.path_for(key)
+        with self._lock:
+            if os.path.exists(path):
+                if key not in self._index:
+                    # 다른 프로세스가 저장한 항목
+                    try:
+                        self._index[key] = os.path.getsize(path)
+                        self._total_bytes += self._index[key]
+                    except FileNotFoundError:
+                        self.misses += 1
+                        return None
+                self._touch(key, path)
+                self.hits += 1
+                return path
+            if key in self._index:
+                # 다른 프로세스나 외부에서 지워진 경우
+                self._forget(key)
+            self.misses += 1
+            return None
+
+    def read_bytes(self, key: str):
+        """
+        저장된 파일 내용 조회
+
+        경로를 돌려주면 응답을 보내는 동안 다른 요청의 정리로 파일이 지워질 수 있으므로,
+        응답에 바로 쓰는 작은 파일은 내용을 메모리로 읽어 반환한다.
+
+        Returns:
+            파일 내용 (없으면 None)
+        """
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            # 조회 직후 다른 요청이 삭제한 경우
+            with self._lock:
+                self._forget(key)
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+    def put_file(self, key: str, src_path: str) -> str:
+        """파일을 복사해 저장하고 저장된 경로 반환"""
+        with open(src_path, 'rb') as src:
+            return self._write(key, lambda dst: shutil.copyfileobj(src, dst))
+
+    def put_bytes(self, key: str, data: bytes) -> str:
+        """바이트를 저장하고 저장된 경로 반환"""
+        return self._write(key, lambda dst: dst.write(data))
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def _write(self, key: str, writer) -> str:
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 rename으로 교체해 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                writer(dst)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        size = os.path.getsize(path)
+        with self._lock:
+            self._forget(key)
+            self._index[key] = size
+            self._total_bytes += size
+            rescan = self._total_bytes > self.max_bytes or time.monotonic() - self._scanned_at > RESCAN_INTERVAL
+            if rescan:
+                # 다른 스레드가 같은 간격에 또 읽지 않도록 먼저 기록
+                self._scanned_at = time.monotonic()
+        if rescan:
+            # 다른 프로세스가 저장하거나 지운 항목까지 반영한 크기로 정리
+            self._scan()
+        with self._lock:
+            self._evict(keep=key)
+        return path
+
+    def _touch(self, key: str, path: str):
+        self._index.move_to_end(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _forget(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self, keep: str = None):
+        """용량 초과 시 오래된 항목부터 삭제 (방금 저장한 항목은 유지, 잠금 안에서 호출)"""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key = next(iter(self._index))
+            if key == keep:
+                self._index.move_to_end(key)
+                key = next(iter(self._index))
+            self._forget(key)
+            try:
+                os.remove(self.path_for(key))
+            except FileNotFoundError:
+                pass
+            self.evictions += 1
+            logger.debug("저장소 %s에서 %s 삭제", self.root, key)
+
+    def _scan(self):
+        """디스크에 있는 항목을 사용 시각(mtime) 순으로 읽어 인덱스 재구성 (디렉토리 읽기는 잠금 밖에서)"""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith(self.suffix) or filename.endswith('.tmp'):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except FileNotFoundError:
+                    # 읽는 사이 다른 프로세스가 지운 경우
+                    continue
+                key = filename[:len(filename) - len(self.suffix)] if self.suffix else filename
+                entries.append((stat.st_mtime, key, stat.st_size))
+        index = OrderedDict()
+        for _, key, size in sorted(entries):
+            index[key] = size
+        with self._lock:
+            self._index = index
+            self._total_bytes = sum(index.values())
+            self._scanned_at = time.monotonic()
+
+    def _load_index(self):
+        self._scan()
+        with self._lock:
+            self._evict()
@@ -0,0 +1,260 @@
+from bs4 import BeautifulSoup
+from dataclasses import dataclass, field
+import html
+import re
+
+# 태그 하나 (속성 값 안의 '>'도 처리), 주석, DOCTYPE 등
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<![^>]*>'
+    r'|<\?[^>]*>'
+    r'|<(/?)([A-Za-z][^\s/>]*)((?:\s*[^\s/>"\'=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+))?|\s*/(?!>))*)\s*(/?)>',
+    re.DOTALL
+)
+
+ATTRIBUTE_PATTERN = re.compile(
+    r'([^\s/>"\'=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?'
+)
+
+# 내용을 태그로 해석하지 않는 요소 (html.parser와 같은 규칙)
+RAW_TEXT_TAGS = ('script', 'style')
+RAW_TEXT_END_PATTERNS = {
+    tag: re.compile(rf'</{tag}\s*>', re.IGNORECASE) for tag in RAW_TEXT_TAGS
+}
+
+DEFAULT_WRAPPER_CLASS = 'w-full h-full relative'
+
+
+class SliceError(Exception):
+    """오프셋 기반 추출로 처리할 수 없는 문서 (닫히지 않은 section 등)"""
+
+
+@dataclass
+class DeckParts:
+    """슬라이드 렌더링에 필요한 덱 구성 요소"""
+    head: str = ''
+    body_class: str = ''
+    container_class: str = ''
+    wrapper_class: str = DEFAULT_WRAPPER_CLASS
+    wrapper_style: str = ''
+    sections: list = field(default_factory=list)  # active 클래스가 추가된 section 마크업
+    classes: set = field(default_factory=set)  # 문서에서 사용하는 모든 클래스 (active 포함)
+    style_texts: list = field(default_factory=list)  # <style> 요소 내용
+
+
+def _parse_attributes(attr_text: str) -> dict:
+    """
+    속성 문자열 -> {이름(소문자): (값, 속성 문자열에서의 시작, 끝, 따옴표)}
+
+    같은 이름이 여러 번 나오면 브라우저처럼 앞의 값을 사용한다 (section 마크업은 원본 그대로 렌더링되므로).
+    """
+    attributes = {}
+    for match in ATTRIBUTE_PATTERN.finditer(attr_text):
+        name = match.group(1).lower()
+        if name in attributes:
+            continue
+        for group, quote in ((2, '"'), (3, "'"), (4, '')):
+            if match.group(group) is not None:
+                attributes[name] = (html.unescape(match.group(group)), match.start(), match.end(), quote)
+                break
+        else:
+            attributes[name] = ('', match.start(), match.end(), None)
+    return attributes
+
+
+def _class_string(value: str) -> str:
+    return ' '.join(value.split())
+
+
+def _inject_active(tag_text: str, name_end: int, attr_offset: int, attributes: dict) -> str:
+    """section 여는 태그에 active 클래스를 최소한으로 추가"""
+    if 'class' not in attributes:
+        return tag_text[:name_end] + ' class="active"' + tag_text[name_end:]
+
+    value, start, end, quote = attributes['class']
+    if 'active' in value.split():
+        return tag_text
+    start += attr_offset
+    end += attr_offset
+    if quote:
+        # 닫는 따옴표 바로 앞에 추가
+        return tag_text[:end - 1] + ' active' + tag_text[end - 1:]
+    raw = tag_text[start:end].split('=', 1)
+    raw_value = raw[1].strip() if len(raw) == 2 else ''
+    new_value = f'{raw_value} active' if raw_value else 'active'
+    return tag_text[:start] + f'class="{new_value}"' + tag_text[end:]
+
+
+def slice_deck(html_content: str) -> DeckParts:
+    """
+    문서를 한 번 훑으며 head, body/container/wrapper 속성, 각 section 구간을 찾아
+    원본 문자열을 잘라 DeckParts를 만든다 (트리 생성과 재직렬화 없음)
+
+    section 마크업은 원본 그대로이고, 여는 태그에 active 클래스만 추가된다.
+
+    Raises:
+        SliceError: section이 제대로 닫히지 않았거나, <head>를 열고 </head>를 생략한 경우
+    """
+    parts = DeckParts()
+    head_start = None
+    body_found = container_found = wrapper_found = False
+    open_sections = []  # 열려 있는 section의 시작 오프셋
+    spans = []  # (시작, 끝) 오프셋
+    injections = []  # (여는 태그 시작, 끝, active를 추가한 여는 태그)
+    pos = 0
+
+    while True:
+        match = TOKEN_PATTERN.search(html_content, pos)
+        if match is None:
+            break
+        pos = match.end()
+        tag = match.group(2)
+        if tag is None:
+            continue
+        tag = tag.lower()
+        closing = match.group(1) == '/'
+
+        if closing:
+            if tag == 'head' and head_start is not None and not parts.head:
+                parts.head = html_content[head_start:match.end()]
+            elif tag == 'section':
+                if not open_sections:
+                    raise SliceError("짝이 맞지 않는 </section>")
+                spans.append((open_sections.pop(), match.end()))
+            continue
+
+        attr_text = match.group(3)
+        attributes = _parse_attributes(attr_text) if attr_text.strip() else {}
+        if 'class' in attributes:
+            parts.classes.update(attributes['class'][0].split())
+
+        if tag == 'head' and head_start is None:
+            head_start = match.start()
+        elif tag == 'body' and not body_found:
+            body_found = True
+            parts.body_class = _class_string(attributes.get('class', ('',))[0])
+        elif tag == 'div' and 'id' in attributes:
+            element_id = attributes['id'][0]
+            if element_id == 'presentation-container' and not container_found:
+                container_found = True
+                parts.container_class = _class_string(attributes.get('class', ('',))[0])
+            elif element_id == 'slides-wrapper' and not wrapper_found:
+                wrapper_found = True
+                wrapper_class = _class_string(attributes.get('class', ('',))[0])
+                parts.wrapper_class = wrapper_class or DEFAULT_WRAPPER_CLASS
+                parts.wrapper_style = attributes.get('style', ('',))[0]
+        elif tag == 'section':
+            if match.group(4):
+                raise SliceError("자체 종료된 <section/>")
+            tag_text = match.group(0)
+            name_end = 1 + len(match.group(2))
+            attr_offset = match.start(3) - match.start()
+            open_sections.append(match.start())
+            injections.append((match.start(), match.end(), _inject_active(tag_text, name_end, attr_offset, attributes)))
+            parts.classes.add('active')
+        elif tag in RAW_TEXT_TAGS:
+            # script/style 내용은 태그로 해석하지 않고 닫는 태그까지 건너뜀
+            end_match = RAW_TEXT_END_PATTERNS[tag].search(html_content, pos)
+            content_end = end_match.start() if end_match else len(html_content)
+            if tag == 'style':
+                parts.style_texts.append(html_content[pos:content_end])
+            pos = end_match.end() if end_match else len(html_content)
+
+    if open_sections:
+        raise SliceError("닫히지 않은 <section>")
+    if head_start is not None and not parts.head:
+        # </head> 생략은 올바른 HTML이지만 head 끝을 오프셋으로 알 수 없음
+        raise SliceError("닫히지 않은 <head>")
+    parts.sections = [_splice(html_content, start, end, injections) for start, end in sorted(spans)]
+    return parts
+
+
+def _splice(html_content: str, start: int, end: int, injections: list) -> str:
+    """[start, end) 구간을 자르면서 안에 있는 section 여는 태그를 active가 추가된 태그로 교체"""
+    pieces = []
+    pos = start
+    for tag_start, tag_end, tag_text in injections:
+        if tag_start < start:
+            continue
+        if tag_start >= end:
+            break
+        pieces.append(html_content[pos:tag_start])
+        pieces.append(tag_text)
+        pos = tag_end
+    pieces.append(html_content[pos:end])
+    return ''.join(pieces)
+
+
+def parse_deck_soup(html_content: str) -> DeckParts:
+    """
+    BeautifulSoup으로 DeckParts 생성 (기존 방식, slice_deck의 비교 기준 및 대체 경로)
+    """
+    soup = BeautifulSoup(html_content, 'html.parser')
+    parts = DeckParts()
+
+    # 원본 head 부분을 포맷팅 유지하며 추출
+    head_match = re.search(r'<head[^>]*>.*?</head>', html_content, re.DOTALL | re.IGNORECASE)
+    if head_match:
+        parts.head = head_match.group(0)
+    else:
+        head_tag = soup.find('head')
+        parts.head = str(head_tag) if head_tag else ''
+
+    body_tag = soup.find('body')
+    parts.body_class = ' '.join(body_tag.get('class', [])) if body_tag else ''
+
+    presentation_container = soup.find('div', id='presentation-container')
+    if presentation_container:
+        parts.container_class = ' '.join(presentation_container.get('class', []))
+
+    slides_wrapper = soup.find('div', id='slides-wrapper')
+    if slides_wrapper:
+        parts.wrapper_class = ' '.join(slides_wrapper.get('class', [])) or DEFAULT_WRAPPER_CLASS
+        parts.wrapper_style = slides_wrapper.get('style', '')
+
+    # section에 active 클래스 추가
+    slides = soup.find_all('section')
+    for slide in slides:
+        slide_classes = slide.get('class', [])
+        if 'active' not in slide_classes:
+            slide_classes.append('active')
+        slide['class'] = slide_classes
+    parts.sections = [str(slide) for slide in slides]
+
+    for tag in soup.find_all(class_=True):
+        parts.classes.update(tag.get('class', []))
+    parts.style_texts = [style.get_text() for style in soup.find_all('style')]
+    return parts
+
+
+def parse_deck(html_content: str) -> DeckParts:
+    """오프셋 기반으로 추출하고, 처리할 수 없는 문서는 BeautifulSoup으로 대신 파싱"""
+    try:
+        return slice_deck(html_content)
+    except SliceError:
+        return parse_deck_soup(html_content)
+
+
+def compare_deck_parts(html_content: str) -> list:
+    """
+    parse_deck과 parse_deck_soup 결과 비교 (벤치마크의 동등성 검사용)
+
+    section은 두 결과를 각각 html.parser로 다시 직렬화해 DOM이 같은지 비교한다.
+    slice_deck이 처리하지 못하는 문서는 parse_deck이 BeautifulSoup으로 대신 파싱한 결과와 비교한다.
+
+    Returns:
+        차이 목록 (같으면 빈 목록)
+    """
+    sliced = parse_deck(html_content)
+    expected = parse_deck_soup(html_content)
+    differences = []
+    for name in ('head', 'body_class', 'container_class', 'wrapper_class', 'wrapper_style', 'classes', 'style_texts'):
+        if getattr(sliced, name) != getattr(expected, name):
+            differences.append(name)
+    if len(sliced.sections) != len(expected.sections):
+        differences.append(f"sections: {len(sliced.sections)}개 != {len(expected.sections)}개")
+    else:
+        for index, (markup, reference) in enumerate(zip(sliced.sections, expected.sections)):
+            if str(BeautifulSoup(markup, 'html.parser')) != str(BeautifulSoup(reference, 'html.parser')):
+                differences.append(f"sections[{index}]")
+    return differences
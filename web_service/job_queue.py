@@ -0,0 +1,292 @@
+from dataclasses import dataclass, field
+import asyncio
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("변환 대기열이 가득 찼습니다.")
+        self.retry_after = retry_after
+
+
+@dataclass
+class ConversionJob:
+    """변환 작업 하나의 상태"""
+    filename: str
+    payload: dict
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = 'queued'  # queued, running, done, failed
+    total_slides: int = None
+    completed_slides: int = 0
+    error: str = None
+    result: object = None  # PDF 바이트 또는 작업 디렉토리에 저장된 PDF 경로
+    exception: Exception = field(default=None, repr=False)  # 실패 원인 (오류 종류별 응답 코드 결정용)
+    handler: object = field(default=None, repr=False)  # 이 작업만 처리할 함수 (없으면 대기열 기본 handler)
+    workspace: object = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float = None
+    finished_at: float = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def report_progress(self, completed: int, total: int):
+        """렌더링 진행 상황 갱신 (슬라이드 하나가 끝날 때마다 호출)"""
+        self.completed_slides = completed
+        self.total_slides = total
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "total_slides": self.total_slides,
+            "completed_slides": self.completed_slides,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class WorkerSlot:
+    """
+    JobQueue.reserve()로 잡아 둔 워커 하나
+
+    스트리밍 응답처럼 handler 밖에서 브라우저를 쓰는 작업이 release()할 때까지 워커를 차지한다.
+    """
+
+    def __init__(self, queue: 'JobQueue', filename: str):
+        self._queue = queue
+        self._started = asyncio.Event()
+        self._released = asyncio.Event()
+        self.job = queue.submit(filename, None, handler=self._hold)
+
+    async def _hold(self, job: ConversionJob):
+        self._started.set()
+        await self._released.wait()
+
+    async def wait(self):
+        """워커가 이 작업 차례가 될 때까지 대기"""
+        await self._started.wait()
+
+    def release(self):
+        """워커를 돌려준다 (여러 번 호출해도 됨, 차례가 오기 전이면 바로 건너뜀)"""
+        if not self._released.is_set():
+            self._released.set()
+            self._queue.discard(self.job.id)
+
+
+class JobQueue:
+    """
+    크기가 제한된 프로세스 내 변환 작업 대기열
+
+    workers개의 워커가 대기열에서 작업을 꺼내 handler(job)를 실행한다.
+    대기열이 가득 차면 submit()이 QueueFullError를 발생시켜 요청을 바로 거절한다.
+    """
+
+    def __init__(self, handler, maxsize: int = 16, workers: int = 2, result_ttl: int = 600,
+                 on_expire=None, on_update=None):
+        """
+        Args:
+            handler: 작업을 처리하는 async 함수 (job -> 결과)
+            maxsize: 대기 중인 작업 최대 개수
+            workers: 동시에 처리할 작업 개수
+            result_ttl: 완료된 작업 결과를 보관하는 시간 (초)
+            on_expire: 작업이 목록에서 제거될 때 호출할 함수 (결과 파일 정리 등)
+            on_update: 작업이 시작되거나 끝날 때 호출할 함수 (다른 프로세스와 상태 공유 등)
+        """
+        self.handler = handler
+        self.on_expire = on_expire
+        self.on_update = on_update
+        self.maxsize = maxsize
+        self.workers = workers
+        self.result_ttl = result_ttl
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._jobs = {}
+        self._tasks = []
+        self._recent_durations = []
+
+    async def start(self):
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, filename: str, payload: dict, handler=None) -> ConversionJob:
+        """
+        작업을 대기열에 넣는다
+
+        Args:
+            filename: 작업 이름 (원본 파일명)
+            payload: handler에 전달할 입력
+            handler: 이 작업만 처리할 async 함수 (PPTX 변환 등, None이면 대기열 기본 handler)
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        self._prune()
+        job = ConversionJob(filename=filename, payload=payload, handler=handler)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(self.retry_after())
+        self._jobs[job.id] = job
+        return job
+
+    async def submit_wait(self, filename: str, payload: dict) -> ConversionJob:
+        """
+        대기열에 자리가 날 때까지 기다렸다가 작업을 넣는다
+
+        이미 받아들인 요청의 나머지 항목(배치 등)용이며, 새 요청은 submit()으로 바로 거절한다.
+        """
+        self._prune()
+        job = ConversionJob(filename=filename, payload=payload)
+        await self._queue.put(job)
+        self._jobs[job.id] = job
+        return job
+
+    def reserve(self, filename: str) -> WorkerSlot:
+        """
+        워커 하나를 release()할 때까지 차지하는 작업을 대기열에 넣는다
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        return WorkerSlot(self, filename)
+
+    async def wait(self, job: ConversionJob) -> ConversionJob:
+        """
+        작업이 끝날 때까지 기다린 뒤 목록에서 제거 (결과를 바로 응답으로 보내는 요청용)
+
+        기다리던 요청이 취소되면(클라이언트 연결 끊김 등) 아직 시작하지 않은 작업도 취소한다.
+        """
+        try:
+            await job.done.wait()
+        except asyncio.CancelledError:
+            self.cancel(job.id)
+            raise
+        finally:
+            self.discard(job.id)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        아직 시작하지 않은 작업을 취소 (워커가 꺼낼 때 건너뜀)
+
+        Returns:
+            취소했으면 True (이미 실행 중이거나 끝난 작업이면 False)
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.status != 'queued':
+            return False
+        job.status = 'failed'
+        job.error = "취소된 작업입니다."
+        job.finished_at = time.time()
+        job.payload = None
+        job.handler = None
+        job.done.set()
+        return True
+
+    def is_full(self) -> bool:
+        return self._queue.full()
+
+    def add_finished(self, filename: str, result, workspace=None) -> ConversionJob:
+        """처리할 필요가 없는 작업(캐시 적중 등)을 완료 상태로 등록"""
+        self._prune()
+        job = ConversionJob(filename=filename, payload=None, status='done', result=result, workspace=workspace)
+        job.started_at = job.finished_at = time.time()
+        job.done.set()
+        self._jobs[job.id] = job
+        return job
+
+    def discard(self, job_id: str):
+        """결과를 이미 전달한 작업을 목록에서 제거"""
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            self._expire(job)
+
+    def get(self, job_id: str):
+        self._prune()
+        return self._jobs.get(job_id)
+
+    def retry_after(self) -> int:
+        """대기열이 빌 때까지 걸릴 시간 추정 (초, Retry-After 헤더용)"""
+        if self._recent_durations:
+            average = sum(self._recent_durations) / len(self._recent_durations)
+        else:
+            average = 10.0
+        return max(1, int(average * self._queue.qsize() / max(1, self.workers)))
+
+    def stats(self) -> dict:
+        running = sum(1 for job in self._jobs.values() if job.status == 'running')
+        return {
+            "queued": self._queue.qsize(),
+            "running": running,
+            "max_queued": self.maxsize,
+            "workers": self.workers,
+            "tracked_jobs": len(self._jobs),
+        }
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            if job.status != 'queued':
+                # 대기 중에 취소된 작업
+                self._queue.task_done()
+                continue
+            job.status = 'running'
+            job.started_at = time.time()
+            self._notify(job)
+            try:
+                job.result = await (job.handler or self.handler)(job)
+                job.status = 'done'
+            except asyncio.CancelledError:
+                job.status = 'failed'
+                job.error = "서버 종료로 작업이 취소되었습니다."
+                raise
+            except Exception as e:
+                logger.exception("변환 작업 %s 실패", job.id)
+                job.status = 'failed'
+                job.error = str(e)
+                job.exception = e
+            finally:
+                job.finished_at = time.time()
+                job.payload = None
+                job.handler = None
+                self._notify(job)
+                job.done.set()
+                self._queue.task_done()
+                self._recent_durations = (self._recent_durations + [job.finished_at - job.started_at])[-20:]
+
+    def _prune(self):
+        """보관 시간이 지난 완료 작업 정리"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl
+        ]
+        for job_id in expired:
+            self._expire(self._jobs.pop(job_id))
+
+    def _expire(self, job: ConversionJob):
+        if self.on_expire is not None:
+            try:
+                self.on_expire(job)
+            except Exception:
+                logger.exception("작업 %s 정리 실패", job.id)
+
+    def _notify(self, job: ConversionJob):
+        if self.on_update is not None:
+            try:
+                self.on_update(job)
+            except Exception:
+                logger.exception("작업 %s 상태 기록 실패", job.id)
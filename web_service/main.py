@@ -1,13 +1,65 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
+import codecs
+import hashlib
+import json
 import os
 import tempfile
-import shutil
 from pathlib import Path
-from pdf_converter import convert_html_to_pdf
+from pdf_converter import render_html_to_pdf_bytes, render_settings, RENDER_ENGINES
+from pptx_converter import render_pptx_bytes, PPTX_LAYOUT, PPTX_LAYOUT_MODES, PPTX_MEDIA_TYPE
+from raster_converter import stream_slide_images, RASTER_FORMATS
+from browser_pool import BrowserPool
+from content_store import ContentStore
+from asset_proxy import AssetProxy
+from job_queue import JobQueue, QueueFullError
+from workspace import WorkspaceManager
+from batch import BatchError, expand_upload, stream_batch_zip
 
-app = FastAPI(title="HTML to PDF Converter", version="1.0.0")
+# 브라우저 풀 설정 (환경 변수로 조정 가능)
+BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', '2'))
+CONTEXTS_PER_BROWSER = int(os.environ.get('CONTEXTS_PER_BROWSER', '4'))
+MAX_RENDERS_PER_BROWSER = int(os.environ.get('MAX_RENDERS_PER_BROWSER', '200'))
+
+browser_pool = BrowserPool(
+    size=BROWSER_POOL_SIZE,
+    contexts_per_browser=CONTEXTS_PER_BROWSER,
+    max_renders_per_browser=MAX_RENDERS_PER_BROWSER,
+)
+
+# 변환 작업 대기열 설정 (동시에 처리할 변환 개수와 대기 가능한 변환 개수)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', str(BROWSER_POOL_SIZE)))
+JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', '16'))
+JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', '600'))
+
+# 배치 변환 설정 (한 요청에 담을 수 있는 HTML 파일 개수와 zip 압축 해제 크기, 동시에 변환할 파일 개수)
+BATCH_MAX_FILES = int(os.environ.get('BATCH_MAX_FILES', '100'))
+BATCH_MAX_FILE_BYTES = int(os.environ.get('BATCH_MAX_FILE_BYTES', str(20 * 1024 * 1024)))
+BATCH_MAX_TOTAL_BYTES = int(os.environ.get('BATCH_MAX_TOTAL_BYTES', str(200 * 1024 * 1024)))
+BATCH_CONCURRENCY = int(os.environ.get('BATCH_CONCURRENCY', str(JOB_WORKERS)))
+
+# /convert에서 지원하는 출력 형식
+OUTPUT_FORMATS = ('pdf', 'pptx') + RASTER_FORMATS
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 시 브라우저 풀, 작업 워커, 작업 디렉토리 정리를 시작하고 종료 시 정리"""
+    await workspaces.start()
+    await browser_pool.start()
+    await job_queue.start()
+    try:
+        yield
+    finally:
+        await job_queue.stop()
+        await browser_pool.stop()
+        await workspaces.stop()
+
+
+app = FastAPI(title="HTML to PDF Converter", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정 (프론트엔드에서 접근 가능하도록)
 app.add_middleware(
@@ -18,10 +70,247 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 임시 파일 저장 디렉토리
+# 임시 파일 저장 디렉토리 (요청별 작업 디렉토리가 이 아래에 만들어짐)
 TEMP_DIR = os.path.join(os.path.dirname(__file__), 'temp')
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# 작업 디렉토리 정리 설정 (전체 용량 제한, 보관 시간, 정리 주기)
+WORKSPACE_QUOTA_BYTES = int(os.environ.get('WORKSPACE_QUOTA_BYTES', str(2 * 1024 * 1024 * 1024)))
+WORKSPACE_TTL = int(os.environ.get('WORKSPACE_TTL', '3600'))
+WORKSPACE_JANITOR_INTERVAL = int(os.environ.get('WORKSPACE_JANITOR_INTERVAL', '60'))
+
+workspaces = WorkspaceManager(
+    TEMP_DIR,
+    quota_bytes=WORKSPACE_QUOTA_BYTES,
+    ttl_seconds=WORKSPACE_TTL,
+    janitor_interval=WORKSPACE_JANITOR_INTERVAL,
+)
+
+# 변환 결과 PDF 캐시 (같은 HTML + 같은 렌더링 설정이면 Playwright 없이 바로 응답)
+PDF_CACHE_ENABLED = os.environ.get('PDF_CACHE_ENABLED', '1') == '1'
+PDF_CACHE_DIR = os.environ.get('PDF_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'pdf'))
+PDF_CACHE_MAX_BYTES = int(os.environ.get('PDF_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+
+pdf_cache = ContentStore(PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES, suffix='.pdf') if PDF_CACHE_ENABLED else None
+
+# 슬라이드별 PDF 캐시 (수정된 슬라이드만 다시 렌더링)
+SLIDE_CACHE_ENABLED = os.environ.get('SLIDE_CACHE_ENABLED', '1') == '1'
+SLIDE_CACHE_DIR = os.environ.get('SLIDE_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'slides'))
+SLIDE_CACHE_MAX_BYTES = int(os.environ.get('SLIDE_CACHE_MAX_BYTES', str(2 * 1024 * 1024 * 1024)))
+
+slide_cache = ContentStore(SLIDE_CACHE_DIR, SLIDE_CACHE_MAX_BYTES, suffix='.pdf') if SLIDE_CACHE_ENABLED else None
+
+# 외부 리소스(CDN 스크립트, 웹 폰트, 이미지) 캐시
+# ASSET_OFFLINE=1이면 네트워크 없이 캐시만 사용하고, 캐시에 없는 리소스가 있으면 바로 실패
+ASSET_CACHE_ENABLED = os.environ.get('ASSET_CACHE_ENABLED', '1') == '1'
+ASSET_CACHE_DIR = os.environ.get('ASSET_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'assets'))
+ASSET_CACHE_MAX_BYTES = int(os.environ.get('ASSET_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+ASSET_MAX_BYTES = int(os.environ.get('ASSET_MAX_BYTES', str(20 * 1024 * 1024)))
+ASSET_OFFLINE = os.environ.get('ASSET_OFFLINE', '0') == '1'
+
+asset_proxy = AssetProxy(
+    ContentStore(ASSET_CACHE_DIR, ASSET_CACHE_MAX_BYTES, suffix='.asset'),
+    offline=ASSET_OFFLINE,
+    max_asset_bytes=ASSET_MAX_BYTES,
+) if ASSET_CACHE_ENABLED else None
+
+# 덱별 Tailwind 정적 CSS 캐시 (Tailwind 런타임/설정 + 클래스 집합 해시 기준)
+TAILWIND_CACHE_ENABLED = os.environ.get('TAILWIND_CACHE_ENABLED', '1') == '1'
+TAILWIND_CACHE_DIR = os.environ.get('TAILWIND_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'tailwind'))
+TAILWIND_CACHE_MAX_BYTES = int(os.environ.get('TAILWIND_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+tailwind_cache = ContentStore(TAILWIND_CACHE_DIR, TAILWIND_CACHE_MAX_BYTES, suffix='.css') if TAILWIND_CACHE_ENABLED else None
+
+# /jobs 작업 디렉토리에 기록하는 상태 파일과 결과 PDF 파일 이름
+JOB_RECORD_FILE = 'job.json'
+JOB_RESULT_FILE = 'merged.pdf'
+
+# 업로드를 읽는 단위와 PDF 응답을 내보내는 단위
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+
+async def _hash_upload(file: UploadFile) -> str:
+    """업로드를 청크 단위로 읽으며 SHA-256 계산 (캐시 키용)"""
+    digest = hashlib.sha256()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest()
+
+
+async def _read_upload_text(file: UploadFile) -> str:
+    """
+    업로드를 청크 단위로 UTF-8 디코딩
+
+    큰 업로드는 Starlette가 임시 파일로 스풀해 두므로
+    원본 바이트 전체와 디코딩된 문자열을 동시에 메모리에 들고 있지 않는다.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = []
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts)
+
+
+def _pdf_stream_response(pdf_bytes: bytes, pdf_filename: str, headers: dict = None,
+                         media_type: str = 'application/pdf') -> StreamingResponse:
+    """메모리에 있는 PDF(또는 PPTX)를 파일로 쓰지 않고 청크 단위로 스트리밍"""
+    def chunks():
+        view = memoryview(pdf_bytes)
+        for start in range(0, len(view), RESPONSE_CHUNK_SIZE):
+            yield bytes(view[start:start + RESPONSE_CHUNK_SIZE])
+    
+    return StreamingResponse(
+        chunks(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={pdf_filename}",
+            "Content-Length": str(len(pdf_bytes)),
+            **(headers or {}),
+        }
+    )
+
+
+async def _render(html_content: str, concurrency: int, engine: str, progress=None) -> bytes:
+    """공유 브라우저 풀과 캐시들을 사용해 HTML을 PDF 바이트로 변환"""
+    return await render_html_to_pdf_bytes(
+        html_content, pool=browser_pool, concurrency=concurrency, engine=engine,
+        slide_cache=slide_cache, progress=progress,
+        asset_proxy=asset_proxy, tailwind_cache=tailwind_cache
+    )
+
+
+async def _run_conversion_job(job):
+    """
+    작업 대기열 워커가 실행하는 변환 (진행 상황을 작업에 기록)
+
+    Returns:
+        PDF 바이트 (/convert), 또는 작업 디렉토리에 저장한 PDF 경로 (/jobs)
+    """
+    payload = job.payload
+    
+    def progress(completed: int, total: int):
+        job.report_progress(completed, total)
+        _publish_job(job)
+    
+    pdf_bytes = await _render(payload['html'], payload['concurrency'], payload['engine'], progress=progress)
+    if payload['cache_key'] is not None:
+        await asyncio.to_thread(pdf_cache.put_bytes, payload['cache_key'], pdf_bytes)
+    if not payload['persist']:
+        return pdf_bytes
+    
+    # 나중에 결과를 받아 갈 작업은 요청별 작업 디렉토리에 저장 (TTL이 지나면 정리됨)
+    return job.workspace.write_bytes(JOB_RESULT_FILE, pdf_bytes)
+
+
+def _publish_job(job):
+    """
+    작업 상태를 작업 디렉토리에 기록
+
+    여러 서버 프로세스로 실행할 때 상태 조회와 결과 다운로드 요청이
+    작업을 등록한 프로세스가 아닌 다른 프로세스로 가도 응답할 수 있도록 한다.
+    """
+    if job.workspace is not None:
+        job.workspace.write_json(JOB_RECORD_FILE, job.to_dict())
+
+
+def _on_job_update(job):
+    _publish_job(job)
+    if job.workspace is not None and job.status in ('done', 'failed'):
+        job.workspace.finish()
+
+
+def _release_job_workspace(job):
+    if job.workspace is not None:
+        job.workspace.release()
+
+
+job_queue = JobQueue(
+    _run_conversion_job,
+    maxsize=JOB_QUEUE_SIZE,
+    workers=JOB_WORKERS,
+    result_ttl=JOB_RESULT_TTL,
+    on_expire=_release_job_workspace,
+    on_update=_on_job_update,
+)
+
+
+def _lookup_job(job_id: str):
+    """
+    이 프로세스의 작업, 또는 다른 서버 프로세스가 작업 디렉토리에 기록한 작업 조회
+
+    Returns:
+        (상태 dict, 결과 PDF 경로 또는 None), 작업이 없으면 None
+    """
+    job = job_queue.get(job_id)
+    if job is not None:
+        return job.to_dict(), job.result if job.status == 'done' else None
+    
+    workspace = workspaces.open(job_id)
+    if workspace is None:
+        return None
+    try:
+        with open(workspace.file(JOB_RECORD_FILE), 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return record, workspace.file(JOB_RESULT_FILE) if record['status'] == 'done' else None
+
+
+def _validate_request(file: UploadFile, engine: str):
+    # 파일 확장자 확인
+    if not file.filename.endswith('.html'):
+        raise HTTPException(status_code=400, detail="HTML 파일만 업로드 가능합니다.")
+    if engine is not None and engine not in RENDER_ENGINES:
+        raise HTTPException(status_code=400, detail=f"engine은 {', '.join(RENDER_ENGINES)} 중 하나여야 합니다.")
+
+
+async def _cache_key(file: UploadFile, engine: str):
+    """같은 HTML + 같은 렌더링 설정이면 같은 PDF 캐시 키 (캐시를 끈 경우 None)"""
+    if pdf_cache is None:
+        return None
+    return pdf_cache.make_key(await _hash_upload(file), render_settings(engine))
+
+
+def _queue_full(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="변환 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+async def _submit_job(file: UploadFile, cache_key: str, concurrency: int, engine: str, persist: bool):
+    """업로드를 읽어 변환 대기열에 넣는다 (가득 차면 429)"""
+    try:
+        html_content_str = await _read_upload_text(file)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="HTML 파일은 UTF-8 인코딩이어야 합니다.")
+    
+    try:
+        job = job_queue.submit(file.filename, {
+            "html": html_content_str,
+            "cache_key": cache_key,
+            "concurrency": concurrency,
+            "engine": engine,
+            "persist": persist,
+        })
+    except QueueFullError as e:
+        raise _queue_full(e.retry_after)
+    if persist:
+        # 작업 ID 이름의 작업 디렉토리에 상태와 결과를 기록 (다른 서버 프로세스에서도 조회 가능)
+        job.workspace = workspaces.create(job.id)
+        _publish_job(job)
+    return job
+
 
 @app.get("/")
 async def root():
@@ -31,6 +320,10 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /convert": "HTML 파일을 업로드하여 PDF로 변환",
+            "POST /jobs": "HTML 파일을 업로드하여 변환 작업 등록 (작업 ID 반환)",
+            "POST /convert/batch": "여러 HTML 파일 또는 zip을 업로드하여 PDF zip으로 변환",
+            "GET /jobs/{job_id}": "변환 작업 상태 및 슬라이드별 진행 상황 확인",
+            "GET /jobs/{job_id}/result": "완료된 변환 작업의 PDF 다운로드",
             "GET /health": "서버 상태 확인"
         }
     }
@@ -39,52 +332,343 @@ async def root():
 @app.get("/health")
 async def health_check():
     """서버 상태 확인"""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "pid": os.getpid(),
+        "browser_pool": browser_pool.stats(),
+        "pdf_cache": pdf_cache.stats() if pdf_cache else None,
+        "slide_cache": slide_cache.stats() if slide_cache else None,
+        "jobs": job_queue.stats(),
+        "workspaces": workspaces.stats(),
+        "assets": asset_proxy.stats() if asset_proxy else None,
+        "tailwind_cache": tailwind_cache.stats() if tailwind_cache else None,
+    }
+
+
+async def _run_pptx_job(job) -> bytes:
+    """대기열 워커에서 실행되는 computed 배치 PPTX 변환"""
+    return await render_pptx_bytes(
+        job.payload["html"], pool=browser_pool, layout='computed', asset_proxy=asset_proxy
+    )
+
+
+async def _convert_to_pptx(file: UploadFile, layout: str) -> StreamingResponse:
+    """
+    업로드된 HTML을 편집 가능한 PPTX로 변환
+
+    heuristic 배치는 덱 파싱 결과만으로 만들어지므로 브라우저 렌더링이나 PDF 파이프라인을 거치지 않고,
+    computed 배치는 공유 브라우저 풀에서 문서를 한 번 로드해 슬라이드마다 한 번씩 측정한다.
+    computed 배치는 브라우저를 쓰므로 PDF 변환과 같은 변환 대기열을 거친다 (가득 차면 429).
+    """
+    try:
+        html_content_str = await _read_upload_text(file)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="HTML 파일은 UTF-8 인코딩이어야 합니다.")
+    
+    layout = layout or PPTX_LAYOUT
+    try:
+        if layout == 'computed':
+            try:
+                job = job_queue.submit(file.filename, {"html": html_content_str}, handler=_run_pptx_job)
+            except QueueFullError as e:
+                raise _queue_full(e.retry_after)
+            await job_queue.wait(job)
+            if job.status != 'done':
+                raise job.exception or RuntimeError(job.error)
+            pptx_bytes = job.result
+        else:
+            pptx_bytes = await render_pptx_bytes(html_content_str, layout=layout)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"PPTX 변환 중 오류 발생: {str(e)}")
+    
+    pptx_filename = f"{Path(file.filename).stem}_merged.pptx"
+    return _pdf_stream_response(pptx_bytes, pptx_filename, media_type=PPTX_MEDIA_TYPE)
+
+
+async def _convert_to_images(file: UploadFile, image_format: str, scale: float,
+                             thumbnail_width: int, concurrency: int) -> StreamingResponse:
+    """
+    업로드된 HTML의 슬라이드를 이미지(PNG/WebP)와 썸네일로 캡처해 zip으로 스트리밍
+
+    첫 슬라이드가 준비될 때까지 기다렸다가 응답을 시작하므로,
+    section이 없거나 첫 캡처에서 실패하면 일반 오류 응답을 돌려준다.
+    캡처는 응답이 끝날 때까지 변환 대기열의 워커 하나를 차지한다 (가득 차면 429).
+    """
+    try:
+        html_content_str = await _read_upload_text(file)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="HTML 파일은 UTF-8 인코딩이어야 합니다.")
+    
+    try:
+        slot = job_queue.reserve(file.filename)
+    except QueueFullError as e:
+        raise _queue_full(e.retry_after)
+    
+    streaming = False
+    try:
+        await slot.wait()
+        chunks = stream_slide_images(
+            html_content_str, pool=browser_pool, image_format=image_format, scale=scale,
+            thumbnail_width=thumbnail_width, concurrency=concurrency, asset_proxy=asset_proxy
+        )
+        try:
+            first_chunk = await anext(chunks)
+        except ValueError as e:
+            await chunks.aclose()
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            await chunks.aclose()
+            raise HTTPException(status_code=500, detail=f"이미지 변환 중 오류 발생: {str(e)}")
+        streaming = True
+    finally:
+        if not streaming:
+            slot.release()
+    
+    async def body():
+        try:
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            slot.release()
+    
+    zip_filename = f"{Path(file.filename).stem}_{image_format}.zip"
+    return StreamingResponse(
+        body(),
+        media_type='application/zip',
+        headers={"Content-Disposition": f"attachment; filename={zip_filename}"}
+    )
 
 
 @app.post("/convert")
-async def convert_html_to_pdf_endpoint(file: UploadFile = File(...)):
+async def convert_html_to_pdf_endpoint(
+    file: UploadFile = File(...),
+    concurrency: int = Query(None, ge=1, description="동시에 렌더링할 슬라이드 개수"),
+    engine: str = Query(None, description="렌더링 엔진 (per-slide, single-load, single-print)"),
+    format: str = Query('pdf', description="출력 형식 (pdf, pptx, png, webp)"),
+    layout: str = Query(None, description="PPTX 배치 방식 (heuristic, computed)"),
+    scale: float = Query(1.0, gt=0, le=4, description="이미지 출력의 기기 픽셀 비율"),
+    thumbnail_width: int = Query(None, ge=0, description="이미지 출력의 썸네일 너비 (0이면 썸네일 없음)"),
+):
     """
-    HTML 파일을 업로드받아 PDF로 변환하는 엔드포인트
+    HTML 파일을 업로드받아 PDF(또는 편집 가능한 PPTX, 슬라이드 이미지)로 변환하는 엔드포인트
     
     Args:
         file: 업로드된 HTML 파일
+        concurrency: 동시에 렌더링할 슬라이드 개수 (없으면 RENDER_CONCURRENCY, 풀 용량으로 제한)
+        engine: 렌더링 엔진 (없으면 RENDER_ENGINE)
+        format: 출력 형식 ('pdf', 'pptx', 'png', 'webp')
+        layout: PPTX 배치 방식 (없으면 PPTX_LAYOUT)
+        scale: 이미지 출력의 기기 픽셀 비율 (2이면 2배 해상도)
+        thumbnail_width: 이미지 출력의 썸네일 너비 (없으면 THUMBNAIL_WIDTH)
     
     Returns:
-        생성된 PDF 파일 (다운로드)
+        생성된 PDF 또는 PPTX 파일, 이미지 출력은 슬라이드 이미지와 썸네일이 든 zip (다운로드)
     """
-    # 파일 확장자 확인
-    if not file.filename.endswith('.html'):
-        raise HTTPException(status_code=400, detail="HTML 파일만 업로드 가능합니다.")
+    _validate_request(file, engine)
+    if format not in OUTPUT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(OUTPUT_FORMATS)} 중 하나여야 합니다.")
+    if format == 'pptx':
+        if layout is not None and layout not in PPTX_LAYOUT_MODES:
+            raise HTTPException(status_code=400, detail=f"layout은 {', '.join(PPTX_LAYOUT_MODES)} 중 하나여야 합니다.")
+        return await _convert_to_pptx(file, layout)
+    if format in RASTER_FORMATS:
+        return await _convert_to_images(file, format, scale, thumbnail_width, concurrency)
     
     try:
-        # 업로드된 파일 내용 읽기
-        html_content = await file.read()
-        html_content_str = html_content.decode('utf-8')
-        
-        # PDF 변환 (async 함수이므로 await 필요)
-        pdf_path = await convert_html_to_pdf(html_content_str, TEMP_DIR)
-        
         # PDF 파일명 생성
         original_filename = Path(file.filename).stem
         pdf_filename = f"{original_filename}_merged.pdf"
         
-        # 임시 디렉토리에 최종 파일 복사 (다운로드용)
-        final_pdf_path = os.path.join(TEMP_DIR, pdf_filename)
-        shutil.copy2(pdf_path, final_pdf_path)
+        # 캐시 적중 시 저장된 PDF를 그대로 반환
+        # (응답 중 캐시 정리로 파일이 지워지지 않도록 경로 대신 읽어 둔 내용을 보냄)
+        cache_key = await _cache_key(file, engine)
+        cached_pdf = pdf_cache.read_bytes(cache_key) if cache_key is not None else None
+        if cached_pdf is not None:
+            return _pdf_stream_response(cached_pdf, pdf_filename, {"X-Cache": "HIT"})
         
-        # 파일 응답 반환
-        return FileResponse(
-            path=final_pdf_path,
-            filename=pdf_filename,
-            media_type='application/pdf',
-            headers={"Content-Disposition": f"attachment; filename={pdf_filename}"}
-        )
+        # 변환 대기열을 거쳐 PDF 변환 (동시 변환 개수 제한)
+        job = await _submit_job(file, cache_key, concurrency, engine, persist=False)
+        await job_queue.wait(job)
+        if job.status != 'done':
+            raise job.exception or RuntimeError(job.error)
+        
+        # 스트리밍 응답 반환
+        return _pdf_stream_response(job.result, pdf_filename, {"X-Cache": "MISS" if cache_key else "BYPASS"})
         
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # section이 없는 문서 등 잘못된 입력
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF 변환 중 오류 발생: {str(e)}")
 
 
+async def _convert_batch_item(item, concurrency: int, engine: str):
+    """
+    배치 항목 하나 변환 (PDF 캐시 적용)
+
+    렌더링은 /convert, /jobs와 같은 변환 대기열을 거치므로 배치가 여러 개 들어와도
+    동시에 렌더링하는 변환은 JOB_WORKERS개로 제한된다.
+    """
+    try:
+        html_content_str = item.data.decode('utf-8')
+    except UnicodeDecodeError:
+        raise ValueError("HTML 파일은 UTF-8 인코딩이어야 합니다.")
+    
+    cache_key = None
+    if pdf_cache is not None:
+        cache_key = pdf_cache.make_key(hashlib.sha256(item.data).hexdigest(), render_settings(engine))
+        cached_pdf = pdf_cache.read_bytes(cache_key)
+        if cached_pdf is not None:
+            return cached_pdf, {"cache": "HIT"}
+    
+    # 대기열 워커가 변환하고 PDF 캐시에 저장
+    job = await job_queue.submit_wait(item.filename, {
+        "html": html_content_str,
+        "cache_key": cache_key,
+        "concurrency": concurrency,
+        "engine": engine,
+        "persist": False,
+    })
+    # 배치가 취소되면(클라이언트 연결 끊김) 아직 시작하지 않은 작업은 대기열에서 빠짐
+    await job_queue.wait(job)
+    if job.status != 'done':
+        raise RuntimeError(job.error)
+    return job.result, {"cache": "MISS" if cache_key else "BYPASS"}
+
+
+@app.post("/convert/batch")
+async def convert_batch_endpoint(
+    files: list[UploadFile] = File(...),
+    file_concurrency: int = Query(None, ge=1, description="동시에 변환할 파일 개수"),
+    concurrency: int = Query(None, ge=1, description="파일마다 동시에 렌더링할 슬라이드 개수"),
+    engine: str = Query(None, description="렌더링 엔진 (per-slide, single-load, single-print)"),
+):
+    """
+    여러 HTML 파일(또는 HTML 파일이 든 zip)을 한 번에 PDF로 변환하는 엔드포인트
+    
+    모든 파일은 변환 대기열을 거쳐 최대 file_concurrency개씩 변환되며,
+    끝나는 순서대로 PDF를 zip에 담아 스트리밍한다.
+    실패한 파일이 있어도 배치는 계속 진행되고, 파일별 결과는 zip 안의 report.json에 기록된다.
+    
+    Returns:
+        PDF 파일들과 report.json이 든 zip (스트리밍)
+    """
+    if engine is not None and engine not in RENDER_ENGINES:
+        raise HTTPException(status_code=400, detail=f"engine은 {', '.join(RENDER_ENGINES)} 중 하나여야 합니다.")
+    
+    items = []
+    try:
+        for file in files:
+            # zip 안의 파일도 남은 개수와 크기 안에서만 압축을 풂
+            items.extend(expand_upload(
+                file.filename, await file.read(),
+                max_files=BATCH_MAX_FILES - len(items),
+                max_file_bytes=BATCH_MAX_FILE_BYTES,
+                max_total_bytes=BATCH_MAX_TOTAL_BYTES - sum(len(item.data or b'') for item in items),
+            ))
+    except BatchError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(items) > BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BATCH_MAX_FILES}개 파일까지 변환할 수 있습니다.")
+    if job_queue.is_full():
+        # 받아들인 배치의 항목은 대기열에 자리가 날 때까지 기다리므로 시작 전에만 거절
+        raise _queue_full(job_queue.retry_after())
+    
+    async def convert(item):
+        return await _convert_batch_item(item, concurrency, engine)
+    
+    return StreamingResponse(
+        stream_batch_zip(items, convert, file_concurrency or BATCH_CONCURRENCY),
+        media_type='application/zip',
+        headers={"Content-Disposition": "attachment; filename=converted_slides.zip"}
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job_endpoint(
+    file: UploadFile = File(...),
+    concurrency: int = Query(None, ge=1, description="동시에 렌더링할 슬라이드 개수"),
+    engine: str = Query(None, description="렌더링 엔진 (per-slide, single-load, single-print)"),
+):
+    """
+    HTML 파일을 업로드받아 변환 작업을 등록하는 엔드포인트
+    
+    변환이 끝날 때까지 연결을 붙잡지 않고 작업 ID를 바로 반환한다.
+    대기열이 가득 차면 429와 Retry-After 헤더를 반환한다.
+    
+    Returns:
+        작업 ID와 상태/결과 조회 URL
+    """
+    _validate_request(file, engine)
+    
+    cache_key = await _cache_key(file, engine)
+    cached_pdf_path = pdf_cache.get(cache_key) if cache_key is not None else None
+    job = None
+    if cached_pdf_path is not None:
+        # 캐시가 정리되어도 결과가 남도록 작업 디렉토리로 가져옴 (하드 링크)
+        job = job_queue.add_finished(file.filename, None)
+        job.workspace = workspaces.create(job.id)
+        try:
+            job.result = job.workspace.adopt(cached_pdf_path, JOB_RESULT_FILE)
+            _on_job_update(job)
+        except FileNotFoundError:
+            # 조회 직후 캐시 정리로 지워진 경우 새로 변환
+            job_queue.discard(job.id)
+            job = None
+    if job is None:
+        job = await _submit_job(file, cache_key, concurrency, engine, persist=True)
+    
+    return JSONResponse(
+        status_code=202,
+        content={
+            **job.to_dict(),
+            "status_url": f"/jobs/{job.id}",
+            "result_url": f"/jobs/{job.id}/result",
+        }
+    )
+
+
+@app.get("/jobs/{job_id}")
+async def job_status_endpoint(job_id: str):
+    """변환 작업 상태와 슬라이드별 진행 상황 조회"""
+    found = _lookup_job(job_id)
+    if found is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return found[0]
+
+
+@app.get("/jobs/{job_id}/result")
+async def job_result_endpoint(job_id: str):
+    """완료된 변환 작업의 PDF 다운로드"""
+    found = _lookup_job(job_id)
+    if found is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    record, pdf_path = found
+    if record['status'] == 'failed':
+        raise HTTPException(status_code=500, detail=f"PDF 변환 중 오류 발생: {record['error']}")
+    if record['status'] != 'done':
+        raise HTTPException(status_code=409, detail=f"작업이 아직 끝나지 않았습니다. (상태: {record['status']})")
+    
+    # 작업 디렉토리의 파일을 복사 없이 그대로 전송
+    pdf_filename = f"{Path(record['filename']).stem}_merged.pdf"
+    if not os.path.exists(pdf_path):
+        raise HTTPException(status_code=410, detail="결과 보관 기간이 지나 삭제되었습니다.")
+    return FileResponse(
+        path=pdf_path,
+        filename=pdf_filename,
+        media_type='application/pdf',
+        headers={"Content-Disposition": f"attachment; filename={pdf_filename}"}
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,246 +1,614 @@
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
-from pypdf import PdfWriter
+from pypdf import PdfReader, PdfWriter
+from contextlib import asynccontextmanager
+from browser_pool import BrowserPool
+from render_readiness import wait_for_render_ready, READINESS_TIMEOUT_MS
+from html_slicer import parse_deck
+from tailwind_precompile import (
+    TAILWIND_PRECOMPILE, detect_tailwind, strip_tailwind_runtime, tailwind_cache_key, extract_tailwind_css
+)
+import asyncio
+import io
+import logging
 import os
-import re
 import uuid
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
 
-async def convert_html_to_pdf(html_content: str, output_dir: str = None) -> str:
+# 한 번의 변환에서 동시에 렌더링할 슬라이드 개수 기본값
+RENDER_CONCURRENCY = int(os.environ.get('RENDER_CONCURRENCY', '1'))
+
+# 렌더링 엔진
+# - per-slide: 슬라이드마다 head를 복사한 HTML 파일을 만들어 각각 로드
+# - single-load: 원본 문서를 한 번만 로드하고 section을 바꿔 끼우며 인쇄
+# - single-print: 원본 문서를 한 번만 로드하고 모든 section을 페이지로 나눠 page.pdf() 한 번으로 인쇄
+#   (슬라이드 크기가 서로 다르거나 결과 페이지가 맞지 않으면 single-load 방식으로 대체)
+RENDER_ENGINES = ('per-slide', 'single-load', 'single-print')
+RENDER_ENGINE = os.environ.get('RENDER_ENGINE', 'per-slide')
+
+# 병합 시 슬라이드 PDF들 사이에서 내용이 같은 객체(폰트, 이미지, XObject, 그래픽 상태 등)를 한 번만 저장
+MERGE_DEDUPLICATE = os.environ.get('MERGE_DEDUPLICATE', '1') == '1'
+
+# 렌더링 결과가 달라지는 변경을 하면 올려서 기존 캐시를 무효화
+RENDERER_VERSION = 1
+
+# 개별 슬라이드 렌더링용 CSS 오버라이드
+SLIDE_OVERRIDE_CSS = """
+    /* 개별 슬라이드일 때 position: absolute가 레이아웃을 깨뜨리므로 relative로 변경 */
+    .slide {
+        position: relative !important;
+        opacity: 1 !important;
+        visibility: visible !important;
+        width: 100% !important;
+        height: 100% !important;
+    }
+    /* slides-wrapper도 relative로 확실히 설정 */
+    #slides-wrapper {
+        position: relative !important;
+        width: 100% !important;
+        height: 100% !important;
+        overflow: hidden !important;
+    }
+    /* presentation-container가 화면 전체를 차지하도록 */
+    #presentation-container {
+        width: 100% !important;
+        height: 100% !important;
+        max-width: none !important;
+        box-shadow: none !important;
+        border-radius: 0 !important;
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    /* body도 화면 전체를 차지하고 여백 제거 */
+    body {
+        margin: 0 !important;
+        padding: 0 !important;
+        width: 100% !important;
+        height: 100% !important;
+        overflow: hidden !important;
+    }
+    /* html도 화면 전체를 차지 */
+    html {
+        margin: 0 !important;
+        padding: 0 !important;
+        width: 100% !important;
+        height: 100% !important;
+    }
+"""
+
+slide_specific_css = f"""
+    <style>{SLIDE_OVERRIDE_CSS}    </style>
+    """
+
+# single-load 엔진: 원본 문서를 개별 슬라이드 문서와 같은
+# body > presentation-container > slides-wrapper 구조로 재구성하고 section들을 보관
+DECK_SETUP_SCRIPT = """
+(layout) => {
+    const sections = Array.from(document.querySelectorAll('section'));
+    const container = document.createElement('div');
+    container.id = 'presentation-container';
+    container.className = layout.container_class;
+    const wrapper = document.createElement('div');
+    wrapper.id = 'slides-wrapper';
+    wrapper.className = layout.wrapper_class;
+    wrapper.setAttribute('style', layout.wrapper_style);
+    container.appendChild(wrapper);
+    document.body.className = layout.body_class;
+    document.body.replaceChildren(container);
+    sections.forEach(section => section.classList.add('active'));
+    window.__deckSections = sections;
+    return sections.length;
+}
+"""
+
+# single-load 엔진: index번째 section만 slides-wrapper에 남긴다
+SHOW_SLIDE_SCRIPT = """
+(index) => {
+    document.getElementById('slides-wrapper').replaceChildren(window.__deckSections[index]);
+}
+"""
+
+# single-print 엔진: section을 하나씩 표시하며 presentation-container 크기 측정
+MEASURE_SECTIONS_SCRIPT = """
+() => {
+    const wrapper = document.getElementById('slides-wrapper');
+    const container = document.getElementById('presentation-container');
+    return window.__deckSections.map(section => {
+        wrapper.replaceChildren(section);
+        const rect = container.getBoundingClientRect();
+        return [Math.ceil(rect.width), Math.ceil(rect.height)];
+    });
+}
+"""
+
+# single-print 엔진: section마다 presentation-container > slides-wrapper를 복제해 한 페이지씩 배치하고
+# 이름 붙은 @page로 페이지 크기를 슬라이드 크기에 맞춘다
+# (id가 같은 복제본에도 원본 CSS의 #presentation-container, #slides-wrapper 규칙이 그대로 적용됨)
+PRINT_LAYOUT_SCRIPT = """
+(size) => {
+    const template = document.getElementById('presentation-container');
+    const wrapperTemplate = document.getElementById('slides-wrapper');
+    const pages = window.__deckSections.map(section => {
+        const container = template.cloneNode(false);
+        const wrapper = wrapperTemplate.cloneNode(false);
+        wrapper.appendChild(section);
+        container.appendChild(wrapper);
+        return container;
+    });
+    document.body.replaceChildren(...pages);
+
+    const style = document.createElement('style');
+    style.textContent = `
+        @page deck-slide { size: ${size.width}px ${size.height}px; margin: 0; }
+        html, body { height: auto !important; overflow: visible !important; }
+        #presentation-container {
+            page: deck-slide;
+            width: ${size.width}px !important;
+            height: ${size.height}px !important;
+            overflow: hidden !important;
+            break-after: page;
+        }
+        #presentation-container:last-child { break-after: auto; }
+    `;
+    document.head.appendChild(style);
+    return pages.length;
+}
+"""
+
+# presentation-container의 실제 크기 측정
+MEASURE_CONTAINER_SCRIPT = """
+() => {
+    const container = document.getElementById('presentation-container');
+    if (container) {
+        const rect = container.getBoundingClientRect();
+        return {
+            width: Math.ceil(rect.width),
+            height: Math.ceil(rect.height)
+        };
+    }
+    return { width: 1920, height: 1080 }; // 기본값
+}
+"""
+
+
+def render_settings(engine: str = None) -> dict:
+    """
+    출력 PDF에 영향을 주는 렌더링 설정 (캐시 키에 사용)
+
+    동시성처럼 결과물에 영향이 없는 설정은 포함하지 않는다.
+    """
+    return {
+        "version": RENDERER_VERSION,
+        "engine": engine or RENDER_ENGINE,
+        "readiness_timeout_ms": READINESS_TIMEOUT_MS,
+        "tailwind_precompile": TAILWIND_PRECOMPILE,
+        "merge_deduplicate": MERGE_DEDUPLICATE,
+    }
+
+
+@asynccontextmanager
+async def ensure_pool(pool=None, concurrency: int = 1):
+    """
+    렌더링에 사용할 BrowserPool을 얻는다
+
+    풀이 주어지면 그대로 사용하고,
+    없으면 (스크립트 단독 실행 등) 브라우저 하나짜리 풀을 띄웠다가 닫는다.
+    """
+    if pool is not None:
+        yield pool
+        return
+
+    pool = BrowserPool(size=1, contexts_per_browser=max(1, concurrency))
+    await pool.start()
+    try:
+        yield pool
+    finally:
+        await pool.stop()
+
+
+async def _print_slide(page, label: str) -> bytes:
+    """
+    현재 페이지에 표시된 슬라이드를 PDF로 인쇄
+
+    Returns:
+        PDF 바이트
+    """
+    # 폰트, 이미지, CSS 배경 이미지, 레이아웃이 안정될 때까지 대기 (고정 sleep 없음)
+    await wait_for_render_ready(page, label=label)
+    
+    # 슬라이드 요소가 완전히 렌더링될 때까지 대기
+    await page.wait_for_selector('.slide', state='visible', timeout=10000)
+    
+    # presentation-container의 실제 크기 측정
+    container_size = await page.evaluate(MEASURE_CONTAINER_SCRIPT)
+    
+    # PDF 생성 (원본 HTML의 실제 렌더링 크기에 맞춤, 파일 대신 바이트로 받음)
+    pdf_bytes = await page.pdf(
+        width=f"{container_size['width']}px",
+        height=f"{container_size['height']}px",
+        print_background=True,
+        margin={"top": "0", "right": "0", "bottom": "0", "left": "0"}
+    )
+    
+    # PDF가 제대로 생성되었는지 확인
+    if not pdf_bytes:
+        raise ValueError(f"PDF 생성 실패: {label}")
+    return pdf_bytes
+
+
+def _page_boxes_match(pdf_bytes: bytes, count: int, width: int, height: int) -> bool:
+    """인쇄 결과가 슬라이드 수만큼의 페이지이고 모든 페이지가 슬라이드 크기인지 확인"""
+    try:
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        if len(reader.pages) != count:
+            logger.info("한 번에 인쇄한 페이지 수가 다릅니다: %d != %d", len(reader.pages), count)
+            return False
+        # CSS px -> PDF pt (1px = 0.75pt), 반올림 오차 1pt 허용
+        for page in reader.pages:
+            box = page.mediabox
+            if abs(float(box.width) - width * 0.75) > 1 or abs(float(box.height) - height * 0.75) > 1:
+                logger.info("한 번에 인쇄한 페이지 크기가 다릅니다: %sx%s", box.width, box.height)
+                return False
+    except Exception as e:
+        logger.warning("인쇄 결과 확인 실패: %s", e)
+        return False
+    return True
+
+
+async def _print_deck_once(pool, prepare_page, count: int):
+    """
+    덱 전체를 page.pdf() 한 번으로 인쇄 (single-print 엔진)
+
+    Returns:
+        PDF 바이트 (슬라이드 크기가 서로 다르거나 결과 확인에 실패하면 None)
+    """
+    async with pool.context() as context:
+        page = await context.new_page()
+        await prepare_page(page)
+        
+        sizes = {tuple(size) for size in await page.evaluate(MEASURE_SECTIONS_SCRIPT)}
+        if len(sizes) != 1:
+            logger.info("슬라이드 크기가 서로 달라 슬라이드별로 인쇄합니다: %s", sorted(sizes))
+            return None
+        width, height = sizes.pop()
+        
+        await page.evaluate(PRINT_LAYOUT_SCRIPT, {"width": width, "height": height})
+        await wait_for_render_ready(page, label='deck')
+        pdf_bytes = await page.pdf(
+            width=f"{width}px",
+            height=f"{height}px",
+            print_background=True,
+            prefer_css_page_size=True,
+            margin={"top": "0", "right": "0", "bottom": "0", "left": "0"}
+        )
+    
+    if not await asyncio.to_thread(_page_boxes_match, pdf_bytes, count, width, height):
+        return None
+    return pdf_bytes
+
+
+async def render_slides(slide_indices: list, pool, concurrency: int, prepare_page, render_slide,
+                         context_options: dict = None) -> dict:
+    """
+    슬라이드들을 최대 concurrency개의 페이지에서 동시에 렌더링
+
+    각 워커는 풀에서 자기 컨텍스트를 빌려 prepare_page(page)로 페이지를 준비한 뒤,
+    큐에 남은 슬라이드를 하나씩 가져가 render_slide(page, idx)로 렌더링한다.
+    context_options는 컨텍스트를 만들 때 그대로 전달된다 (device_scale_factor 등).
+
+    Returns:
+        슬라이드 인덱스 -> PDF 바이트
+    """
+    pdf_pages = {}
+    pending = asyncio.Queue()
+    for idx in slide_indices:
+        pending.put_nowait(idx)
+    
+    async def worker():
+        async with pool.context(**(context_options or {})) as context:
+            page = await context.new_page()
+            await prepare_page(page)
+            while True:
+                try:
+                    idx = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                pdf_pages[idx] = await render_slide(page, idx)
+    
+    worker_count = max(1, min(concurrency, len(slide_indices), pool.capacity))
+    try:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(worker_count):
+                group.create_task(worker())
+    except ExceptionGroup as eg:
+        # 나머지 워커는 취소되었으므로 첫 번째 실패 원인만 전달
+        raise eg.exceptions[0]
+    
+    return pdf_pages
+
+
+async def _precompile_tailwind(pool, html_content: str, head_content: str, deck,
+                               tailwind_cache=None, asset_proxy=None):
+    """
+    덱마다 한 번만 Tailwind 런타임을 실행해 필요한 CSS를 만든다
+
+    결과는 런타임/설정과 클래스 집합의 해시로 tailwind_cache에 저장해 같은 덱이면 브라우저 없이 재사용한다.
+
+    Returns:
+        정적 CSS (런타임이 CSS를 만들지 않았으면 None)
+    """
+    key = None
+    if tailwind_cache is not None:
+        key = tailwind_cache_key(head_content, deck)
+        cached_path = tailwind_cache.get(key)
+        if cached_path is not None:
+            try:
+                with open(cached_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except FileNotFoundError:
+                pass
+    
+    missing_assets = set()
+    async with pool.context() as context:
+        page = await context.new_page()
+        if asset_proxy is not None:
+            await asset_proxy.attach(context, missing_assets)
+        css = await extract_tailwind_css(page, html_content, deck)
+    if asset_proxy is not None:
+        asset_proxy.check(missing_assets)
+    
+    if css is None:
+        logger.warning("Tailwind 런타임이 만든 CSS를 찾지 못해 슬라이드마다 런타임을 그대로 실행합니다.")
+        return None
+    if tailwind_cache is not None:
+        await asyncio.to_thread(tailwind_cache.put_bytes, key, css.encode('utf-8'))
+    return css
+
+
+def merge_pdfs(pdf_pages: list, deduplicate: bool = None) -> bytes:
+    """
+    슬라이드 PDF 바이트들을 메모리에서 하나로 병합
+
+    Args:
+        pdf_pages: 슬라이드 순서대로의 PDF 바이트
+        deduplicate: 슬라이드마다 따로 들어 있는 같은 객체(폰트, 이미지, XObject 등)를
+            하나로 합칠지 여부 (None이면 MERGE_DEDUPLICATE)
+            내용 해시가 같은 객체만 합치므로 페이지 내용은 그대로 유지된다.
+
+    Returns:
+        병합된 PDF 바이트
+    """
+    if deduplicate is None:
+        deduplicate = MERGE_DEDUPLICATE
+    if not pdf_pages:
+        raise ValueError("생성된 PDF가 없습니다.")
+    
+    merger = PdfWriter()
+    for idx, pdf_bytes in enumerate(pdf_pages):
+        try:
+            merger.append(io.BytesIO(pdf_bytes))
+        except Exception as e:
+            raise ValueError(f"PDF 병합 실패 (slide_{idx+1}): {e}")
+    
+    if deduplicate:
+        # 같은 객체를 첫 번째 것으로 참조를 바꾸고, 더 이상 참조되지 않는 객체는 제거
+        merger.compress_identical_objects(remove_duplicates=True, remove_unreferenced=True)
+    
+    output = io.BytesIO()
+    merger.write(output)
+    merger.close()
+    return output.getvalue()
+
+
+async def render_html_to_pdf_bytes(html_content: str, pool=None, concurrency: int = None,
+                                   engine: str = None, slide_cache=None, progress=None,
+                                   asset_proxy=None, tailwind_cache=None) -> bytes:
     """
-    HTML 파일을 PDF로 변환하는 함수
+    HTML을 PDF로 변환해 바이트로 반환 (중간 파일 없음)
     
     Args:
         html_content: HTML 파일 내용 (문자열)
-        output_dir: 출력 디렉토리 (None이면 임시 디렉토리 사용)
+        pool: 공유 BrowserPool (None이면 변환마다 브라우저를 새로 띄움)
+        concurrency: 동시에 렌더링할 슬라이드 개수 (None이면 RENDER_CONCURRENCY)
+        engine: 렌더링 엔진 ('per-slide', 'single-load', 'single-print', None이면 RENDER_ENGINE)
+        slide_cache: 슬라이드별 PDF를 보관하는 ContentStore
+            (주어지면 내용이 바뀐 슬라이드만 다시 렌더링하고 나머지는 재사용)
+        progress: 진행 상황 콜백 progress(완료된 슬라이드 수, 전체 슬라이드 수)
+        asset_proxy: 외부 리소스를 디스크 캐시에서 제공하는 AssetProxy
+            (오프라인 모드에서 캐시에 없는 리소스가 있으면 AssetMissingError)
+        tailwind_cache: 덱별로 미리 만든 Tailwind CSS를 보관하는 ContentStore
     
     Returns:
-        생성된 PDF 파일 경로
+        병합된 PDF 바이트
     """
-    # 출력 디렉토리 설정
-    if output_dir is None:
-        output_dir = os.path.join(os.path.dirname(__file__), 'temp')
-    os.makedirs(output_dir, exist_ok=True)
+    if engine is None:
+        engine = RENDER_ENGINE
+    if engine not in RENDER_ENGINES:
+        raise ValueError(f"지원하지 않는 렌더링 엔진입니다: {engine}")
+    if concurrency is None:
+        concurrency = RENDER_CONCURRENCY
     
-    # 고유 ID 생성 (동시 요청 처리)
-    unique_id = str(uuid.uuid4())
-    work_dir = os.path.join(output_dir, unique_id)
-    os.makedirs(work_dir, exist_ok=True)
+    # head, body/container/wrapper 속성, section 구간을 한 번에 추출 (active 클래스 추가됨)
+    # 파싱과 병합은 CPU를 사용하므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    deck = await asyncio.to_thread(parse_deck, html_content)
+    head_content = deck.head
+    slides = deck.sections
     
-    try:
-        # HTML 파싱
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 원본 head 부분을 포맷팅 유지하며 추출
-        head_match = re.search(r'<head[^>]*>.*?</head>', html_content, re.DOTALL | re.IGNORECASE)
-        if head_match:
-            head_content = head_match.group(0)
-        else:
-            head_tag = soup.find('head')
-            head_content = str(head_tag) if head_tag else ''
-        
-        # 슬라이드 추출 (section 태그 기준)
-        slides = soup.find_all('section')
-        
-        if not slides:
-            raise ValueError("HTML에 <section> 태그가 없습니다.")
-        
-        # 원본 body 구조 확인
-        body_tag = soup.find('body')
-        body_classes = body_tag.get('class', []) if body_tag else []
-        body_class_str = ' '.join(body_classes) if body_classes else ''
-        
-        # 원본 presentation-container 구조 확인
-        presentation_container = soup.find('div', id='presentation-container')
-        presentation_container_classes = presentation_container.get('class', []) if presentation_container else []
-        presentation_container_class_str = ' '.join(presentation_container_classes) if presentation_container_classes else ''
+    if not slides:
+        raise ValueError("HTML에 <section> 태그가 없습니다.")
+    
+    body_class_str = deck.body_class
+    presentation_container_class_str = deck.container_class
+    slides_wrapper_class_str = deck.wrapper_class
+    slides_wrapper_style = deck.wrapper_style
+    
+    if engine == 'single-print':
+        # 덱 전체를 한 번에 인쇄하므로 슬라이드별 캐시는 사용하지 않음 (변환 결과 PDF 캐시는 그대로 적용)
+        slide_cache = None
+    
+    # 슬라이드별 지문: section 마크업 + 공유 head + 감싸는 요소 클래스 + 렌더링 설정
+    # 지문이 같은 슬라이드는 이전에 렌더링한 PDF를 그대로 재사용
+    pdf_pages = [None] * len(slides)
+    fingerprints = [None] * len(slides)
+    if slide_cache is not None:
+        shared_key = slide_cache.make_key(
+            head_content, body_class_str, presentation_container_class_str,
+            slides_wrapper_class_str, slides_wrapper_style, render_settings(engine)
+        )
+        for idx, slide in enumerate(slides):
+            fingerprints[idx] = slide_cache.make_key(shared_key, slide)
+            cached_path = slide_cache.get(fingerprints[idx])
+            if cached_path is not None:
+                try:
+                    with open(cached_path, 'rb') as f:
+                        pdf_pages[idx] = f.read()
+                except FileNotFoundError:
+                    # 조회 직후 다른 요청이 삭제한 경우 다시 렌더링
+                    pass
+    
+    slides_to_render = [idx for idx, pdf_bytes in enumerate(pdf_pages) if pdf_bytes is None]
+    logger.info("슬라이드 %d개 중 %d개 렌더링, %d개 재사용",
+                len(slides), len(slides_to_render), len(slides) - len(slides_to_render))
+    
+    completed = len(slides) - len(slides_to_render)
+    if progress is not None:
+        progress(completed, len(slides))
+    
+    # 오프라인 모드에서 캐시에 없던 외부 리소스 URL
+    missing_assets = set()
+    
+    async def load_content(page, html):
+        await page.set_content(html, wait_until='load')
+        if asset_proxy is not None:
+            # 누락된 리소스가 있으면 준비 대기 전에 바로 실패
+            asset_proxy.check(missing_assets)
+    
+    if engine in ('single-load', 'single-print'):
+        # 원본 문서를 한 번만 로드하고, 페이지 안에서 section을 바꿔 가며 인쇄
+        # (single-print가 한 번에 인쇄하지 못한 경우에도 이 방식으로 대체)
+        layout = {
+            "body_class": body_class_str,
+            "container_class": presentation_container_class_str,
+            "wrapper_class": slides_wrapper_class_str,
+            "wrapper_style": slides_wrapper_style,
+        }
         
-        # 원본 slides-wrapper 구조 확인
-        slides_wrapper = soup.find('div', id='slides-wrapper')
-        slides_wrapper_classes = slides_wrapper.get('class', []) if slides_wrapper else []
-        slides_wrapper_class_str = ' '.join(slides_wrapper_classes) if slides_wrapper_classes else 'w-full h-full relative'
-        slides_wrapper_style = slides_wrapper.get('style', '') if slides_wrapper else ''
+        async def setup_page(page):
+            await load_content(page, html_content)
+            await page.evaluate(DECK_SETUP_SCRIPT, layout)
+            await page.add_style_tag(content=SLIDE_OVERRIDE_CSS)
         
-        # 임시 슬라이드 html 저장 경로 리스트
-        slide_html_files = []
+        async def render_slide(page, idx):
+            await page.evaluate(SHOW_SLIDE_SCRIPT, idx)
+            return await _print_slide(page, f"slide_{idx+1}")
+    else:
+        # head에 개별 슬라이드용 CSS 오버라이드 추가
+        head_with_slide_css = head_content.replace('</head>', slide_specific_css + '</head>')
         
-        for idx, slide in enumerate(slides):
-            # section에 active 클래스 추가
-            slide_classes = slide.get('class', [])
-            if 'active' not in slide_classes:
-                slide_classes.append('active')
-            slide['class'] = slide_classes
-            
-            # 개별 슬라이드를 위한 CSS 오버라이드 추가
-            slide_specific_css = """
-    <style>
-        /* 개별 슬라이드일 때 position: absolute가 레이아웃을 깨뜨리므로 relative로 변경 */
-        .slide {
-            position: relative !important;
-            opacity: 1 !important;
-            visibility: visible !important;
-            width: 100% !important;
-            height: 100% !important;
-        }
-        /* slides-wrapper도 relative로 확실히 설정 */
-        #slides-wrapper {
-            position: relative !important;
-            width: 100% !important;
-            height: 100% !important;
-            overflow: hidden !important;
-        }
-        /* presentation-container가 화면 전체를 차지하도록 */
-        #presentation-container {
-            width: 100% !important;
-            height: 100% !important;
-            max-width: none !important;
-            box-shadow: none !important;
-            border-radius: 0 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        /* body도 화면 전체를 차지하고 여백 제거 */
-        body {
-            margin: 0 !important;
-            padding: 0 !important;
-            width: 100% !important;
-            height: 100% !important;
-            overflow: hidden !important;
-        }
-        /* html도 화면 전체를 차지 */
-        html {
-            margin: 0 !important;
-            padding: 0 !important;
-            width: 100% !important;
-            height: 100% !important;
-        }
-    </style>
-    """
-            
-            # head에 슬라이드별 CSS 추가
-            head_with_slide_css = head_content.replace('</head>', slide_specific_css + '</head>')
-            
+        def build_slide_html(idx):
             # 원본 구조 유지: body > presentation-container > slides-wrapper > section
-            slide_html = f"""<!DOCTYPE html>
+            return f"""<!DOCTYPE html>
 <html lang="ko">
 {head_with_slide_css}
 <body class="{body_class_str}">
     <div id="presentation-container" class="{presentation_container_class_str}">
         <div id="slides-wrapper" class="{slides_wrapper_class_str}" style="{slides_wrapper_style}">
-            {slide}
+            {slides[idx]}
         </div>
     </div>
 </body>
 </html>"""
-            
-            temp_html_path = os.path.join(work_dir, f"slide_{idx+1}.html")
-            with open(temp_html_path, 'w', encoding='utf-8') as tmp:
-                tmp.write(slide_html)
-            
-            slide_html_files.append(temp_html_path)
         
-        # Playwright를 이용한 PDF 생성 (Async API 사용)
-        pdf_paths = []
+        async def setup_page(page):
+            pass
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
-            
-            for idx, html_path in enumerate(slide_html_files):
-                file_url = f"file://{html_path}"
-                
-                await page.goto(file_url, wait_until='networkidle')
-                
-                # 모든 이미지와 외부 리소스가 완전히 로드될 때까지 대기
-                await page.wait_for_load_state('networkidle')
-                
-                # 배경 이미지가 로드될 때까지 추가 대기
-                await page.wait_for_timeout(3000)
-                
-                # 모든 이미지가 로드되었는지 확인
-                images_loaded = await page.evaluate("""
-                    () => {
-                        return Promise.all(
-                            Array.from(document.images).map(img => {
-                                if (img.complete) return Promise.resolve();
-                                return new Promise((resolve, reject) => {
-                                    img.onload = resolve;
-                                    img.onerror = resolve; // 에러가 나도 계속 진행
-                                    setTimeout(resolve, 5000); // 최대 5초 대기
-                                });
-                            })
-                        );
-                    }
-                """)
-                
-                # CSS 배경 이미지도 로드될 때까지 추가 대기
-                await page.wait_for_timeout(2000)
-                
-                # 슬라이드 요소가 완전히 렌더링될 때까지 대기
-                await page.wait_for_selector('.slide', state='visible', timeout=10000)
-                
-                # presentation-container의 실제 크기 측정
-                container_size = await page.evaluate("""
-                    () => {
-                        const container = document.getElementById('presentation-container');
-                        if (container) {
-                            const rect = container.getBoundingClientRect();
-                            return {
-                                width: Math.ceil(rect.width),
-                                height: Math.ceil(rect.height)
-                            };
-                        }
-                        return { width: 1920, height: 1080 }; // 기본값
-                    }
-                """)
-                
-                # PDF 저장 (원본 HTML의 실제 렌더링 크기에 맞춤)
-                pdf_path = os.path.join(work_dir, f"slide_{idx+1}.pdf")
-                
-                await page.pdf(
-                    path=pdf_path,
-                    width=f"{container_size['width']}px",
-                    height=f"{container_size['height']}px",
-                    print_background=True,
-                    margin={"top": "0", "right": "0", "bottom": "0", "left": "0"}
+        async def render_slide(page, idx):
+            # 슬라이드 HTML을 파일로 쓰지 않고 바로 페이지에 로드
+            await load_content(page, build_slide_html(idx))
+            return await _print_slide(page, f"slide_{idx+1}")
+    
+    async def prepare_page(page):
+        if asset_proxy is not None:
+            # 외부 리소스 요청을 캐시로 연결 (페이지 로드 전에 등록)
+            await asset_proxy.attach(page.context, missing_assets)
+        await setup_page(page)
+    
+    async def render_and_report(page, idx):
+        nonlocal completed
+        pdf_bytes = await render_slide(page, idx)
+        completed += 1
+        if progress is not None:
+            progress(completed, len(slides))
+        return pdf_bytes
+    
+    # Playwright를 이용한 PDF 생성 (Async API 사용) - 바뀐 슬라이드가 있을 때만
+    if slides_to_render:
+        async with ensure_pool(pool, concurrency) as render_pool:
+            if TAILWIND_PRECOMPILE and detect_tailwind(head_content):
+                # Tailwind 런타임을 슬라이드마다 실행하지 않도록 정적 CSS로 대체
+                css = await _precompile_tailwind(
+                    render_pool, html_content, head_content, deck, tailwind_cache, asset_proxy
                 )
-                
-                # PDF 파일이 제대로 생성되었는지 확인
-                if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
-                    pdf_paths.append(pdf_path)
-                else:
-                    raise ValueError(f"PDF 파일 생성 실패: slide_{idx+1}.pdf")
+                if css is not None:
+                    static_head = strip_tailwind_runtime(head_content, css)
+                    head_with_slide_css = static_head.replace('</head>', slide_specific_css + '</head>')
+                    html_content = html_content.replace(head_content, static_head, 1)
             
-            await browser.close()
-        
-        # 모든 PDF를 하나로 병합
-        if not pdf_paths:
-            raise ValueError("생성된 PDF 파일이 없습니다.")
-        
-        merger = PdfWriter()
-        
-        for pdf_path in pdf_paths:
-            # PDF 파일이 존재하고 유효한지 확인
-            if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
-                try:
-                    merger.append(pdf_path)
-                except Exception as e:
-                    raise ValueError(f"PDF 병합 실패 ({os.path.basename(pdf_path)}): {e}")
-            else:
-                raise ValueError(f"PDF 파일이 존재하지 않거나 비어있음: {os.path.basename(pdf_path)}")
-        
-        # 최종 병합된 PDF 저장
-        output_pdf = os.path.join(work_dir, "merged_slides.pdf")
-        merger.write(output_pdf)
-        merger.close()
-        
-        return output_pdf
+            if engine == 'single-print':
+                deck_pdf = await _print_deck_once(render_pool, prepare_page, len(slides))
+                if deck_pdf is not None:
+                    # 페이지가 이미 한 파일에 있으므로 병합 단계 없이 반환
+                    if progress is not None:
+                        progress(len(slides), len(slides))
+                    return deck_pdf
+            
+            rendered = await render_slides(slides_to_render, render_pool, concurrency, prepare_page, render_and_report)
         
-    except Exception as e:
-        # 에러 발생 시 임시 파일 정리
-        import shutil
-        if os.path.exists(work_dir):
-            shutil.rmtree(work_dir, ignore_errors=True)
-        raise e
+        for idx, pdf_bytes in rendered.items():
+            pdf_pages[idx] = pdf_bytes
+        if slide_cache is not None:
+            def save_slides():
+                for idx, pdf_bytes in rendered.items():
+                    slide_cache.put_bytes(fingerprints[idx], pdf_bytes)
+            
+            # 파일 쓰기와 용량 정리(디렉토리 읽기)는 스레드에서
+            await asyncio.to_thread(save_slides)
+    
+    # 모든 PDF를 메모리에서 하나로 병합
+    return await asyncio.to_thread(merge_pdfs, pdf_pages)
+
 
+async def convert_html_to_pdf(html_content: str, output_dir: str = None, pool=None,
+                              concurrency: int = None, engine: str = None, slide_cache=None,
+                              asset_proxy=None, tailwind_cache=None) -> str:
+    """
+    HTML 파일을 PDF로 변환하는 함수 (결과를 파일로 저장)
+    
+    Args:
+        html_content: HTML 파일 내용 (문자열)
+        output_dir: 출력 디렉토리 (None이면 임시 디렉토리 사용)
+        pool, concurrency, engine, slide_cache, asset_proxy, tailwind_cache: render_html_to_pdf_bytes 참고
+    
+    Returns:
+        생성된 PDF 파일 경로
+    """
+    # 출력 디렉토리 설정
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(__file__), 'temp')
+    
+    pdf_bytes = await render_html_to_pdf_bytes(
+        html_content, pool=pool, concurrency=concurrency, engine=engine,
+        slide_cache=slide_cache, asset_proxy=asset_proxy, tailwind_cache=tailwind_cache
+    )
+    
+    # 고유 ID 생성 (동시 요청 처리)
+    unique_id = str(uuid.uuid4())
+    work_dir = os.path.join(output_dir, unique_id)
+    os.makedirs(work_dir, exist_ok=True)
+    
+    # 최종 병합된 PDF 저장
+    output_pdf = os.path.join(work_dir, "merged_slides.pdf")
+    with open(output_pdf, 'wb') as f:
+        f.write(pdf_bytes)
+    
+    return output_pdf
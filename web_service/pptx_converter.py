@@ -0,0 +1,724 @@
+from bs4 import BeautifulSoup
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
+from pptx.dml.color import RGBColor
+from html_slicer import parse_deck
+from pdf_converter import DECK_SETUP_SCRIPT, SHOW_SLIDE_SCRIPT, SLIDE_OVERRIDE_CSS, ensure_pool
+from render_readiness import wait_for_render_ready
+from tailwind_precompile import TAILWIND_CONFIG_PATTERN
+import asyncio
+import io
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+PPTX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+# PPTX 배치 방식
+# heuristic: HTML 구조와 CSS 규칙으로 위치/크기를 추정 (브라우저 없음)
+# computed: 브라우저에서 슬라이드마다 한 번 측정한 위치와 계산된 스타일을 그대로 사용
+PPTX_LAYOUT_MODES = ('heuristic', 'computed')
+PPTX_LAYOUT = os.environ.get('PPTX_LAYOUT', 'heuristic')
+
+# 슬라이드 너비 (인치), 높이는 측정한 슬라이드 비율로 정함
+SLIDE_WIDTH_INCHES = 10
+
+# computed 배치: 현재 표시된 슬라이드의 배경, 배경색이 있는 요소, 텍스트 블록을 한 번에 측정
+# 텍스트 블록은 inline이 아닌 가장 가까운 조상 요소 단위로 묶고, 텍스트 노드마다 계산된 글꼴을 run으로 기록
+# 좌표는 presentation-container 기준 px
+MEASURE_LAYOUT_SCRIPT = """
+() => {
+    const container = document.getElementById('presentation-container');
+    const section = document.querySelector('#slides-wrapper > section');
+    const origin = container.getBoundingClientRect();
+    const transparent = color => !color || color === 'transparent' || /^rgba\\(.*,\\s*0\\)$/.test(color);
+    const hidden = style => style.display === 'none' || style.visibility === 'hidden' || parseFloat(style.opacity) === 0;
+    const relative = rect => ({
+        x: rect.left - origin.left, y: rect.top - origin.top, width: rect.width, height: rect.height
+    });
+
+    let background = null;
+    for (const element of [section, container, document.body]) {
+        const color = getComputedStyle(element).backgroundColor;
+        if (!transparent(color)) { background = color; break; }
+    }
+
+    const boxes = [];
+    for (const element of section.querySelectorAll('*')) {
+        const style = getComputedStyle(element);
+        if (transparent(style.backgroundColor) || hidden(style)) continue;
+        const rect = element.getBoundingClientRect();
+        if (!rect.width || !rect.height) continue;
+        boxes.push({
+            ...relative(rect),
+            color: style.backgroundColor,
+            radius: parseFloat(style.borderTopLeftRadius) || 0,
+        });
+    }
+
+    const blockOf = node => {
+        let element = node.parentElement;
+        while (element !== section && getComputedStyle(element).display.startsWith('inline')) {
+            element = element.parentElement;
+        }
+        return element;
+    };
+    const blocks = new Map();
+    const walker = document.createTreeWalker(section, NodeFilter.SHOW_TEXT);
+    const range = document.createRange();
+    while (walker.nextNode()) {
+        const node = walker.currentNode;
+        if (!node.textContent.trim()) continue;
+        const style = getComputedStyle(node.parentElement);
+        if (hidden(style) || node.parentElement.closest('script, style')) continue;
+        range.selectNodeContents(node);
+        const rects = Array.from(range.getClientRects()).filter(rect => rect.width && rect.height);
+        if (!rects.length) continue;
+
+        const block = blockOf(node);
+        let entry = blocks.get(block);
+        if (!entry) {
+            entry = {
+                left: Infinity, top: Infinity, right: -Infinity, bottom: -Infinity,
+                align: getComputedStyle(block).textAlign, runs: [],
+            };
+            blocks.set(block, entry);
+        }
+        for (const rect of rects) {
+            entry.left = Math.min(entry.left, rect.left);
+            entry.top = Math.min(entry.top, rect.top);
+            entry.right = Math.max(entry.right, rect.right);
+            entry.bottom = Math.max(entry.bottom, rect.bottom);
+        }
+        let text = node.textContent.replace(/\\s+/g, ' ');
+        if (style.textTransform === 'uppercase') text = text.toUpperCase();
+        entry.runs.push({
+            text,
+            font_size: parseFloat(style.fontSize),
+            font_weight: parseInt(style.fontWeight, 10) || 400,
+            italic: style.fontStyle === 'italic',
+            color: style.color,
+            font_family: style.fontFamily.split(',')[0].replace(/["']/g, '').trim(),
+        });
+    }
+
+    const texts = Array.from(blocks.values()).map(entry => ({
+        ...relative({
+            left: entry.left, top: entry.top,
+            width: entry.right - entry.left, height: entry.bottom - entry.top,
+        }),
+        align: entry.align,
+        runs: entry.runs,
+    }));
+    return { width: origin.width, height: origin.height, background, boxes, texts };
+}
+"""
+
+# CSS text-align -> PPTX 문단 정렬
+TEXT_ALIGNMENTS = {
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+    'end': PP_ALIGN.RIGHT,
+    'justify': PP_ALIGN.JUSTIFY,
+}
+
+# Tailwind 설정에서 색상을 찾지 못했을 때 사용하는 기본 색상
+DEFAULT_TAILWIND_COLORS = {
+    'soft-white': '#F9F8F6',
+    'dark-gray': '#333333',
+    'coral-red': '#FF6B6B',
+    'coral-dark': '#E05252',
+    'light-gray': '#EAEAEA',
+}
+
+
+def extract_css_rules(css_text: str) -> dict:
+    """
+    .class { prop: value; } 형식의 CSS 규칙 파싱 (간단한 버전)
+
+    Returns:
+        클래스 이름 -> {속성: 값}
+    """
+    css_rules = {}
+    for rule in re.finditer(r'\.(\w+)\s*\{([^}]+)\}', css_text):
+        class_name = rule.group(1)
+        properties = rule.group(2)
+        css_rules[class_name] = {}
+        for prop in re.finditer(r'([^:;]+):\s*([^;]+);', properties):
+            key = prop.group(1).strip()
+            value = prop.group(2).strip()
+            css_rules[class_name][key] = value
+    return css_rules
+
+
+def extract_tailwind_colors(head_content: str) -> dict:
+    """
+    head의 tailwind.config에서 'color-name': '#HEX' 형식의 색상 추출
+
+    Returns:
+        색상 이름 -> '#HEX' (찾지 못하면 DEFAULT_TAILWIND_COLORS)
+    """
+    tailwind_colors = {}
+    config_match = TAILWIND_CONFIG_PATTERN.search(head_content)
+    if config_match:
+        colors_match = re.search(r'colors:\s*\{([^}]+)\}', config_match.group(0), re.DOTALL)
+        if colors_match:
+            color_matches = re.finditer(r"['\"]([^'\"]+)['\"]:\s*['\"](#[0-9A-Fa-f]{6})['\"]", colors_match.group(1))
+            for match in color_matches:
+                tailwind_colors[match.group(1)] = match.group(2)
+    return tailwind_colors or dict(DEFAULT_TAILWIND_COLORS)
+
+
+def parse_color(color_str):
+    """색상 문자열을 RGBColor로 변환"""
+    if not color_str:
+        return None
+    
+    # #005A9C 형식
+    if color_str.startswith('#'):
+        try:
+            r = int(color_str[1:3], 16)
+            g = int(color_str[3:5], 16)
+            b = int(color_str[5:7], 16)
+            return RGBColor(r, g, b)
+        except:
+            pass
+    
+    # rgb() 형식
+    rgb_match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color_str)
+    if rgb_match:
+        return RGBColor(int(rgb_match.group(1)), int(rgb_match.group(2)), int(rgb_match.group(3)))
+    
+    # 색상 이름 매핑
+    color_map = {
+        'slide-blue': RGBColor(0, 90, 156),  # #005A9C
+        'slide-text': RGBColor(33, 37, 41),   # #212529
+        'slide-gray': RGBColor(108, 117, 125), # #6C757D
+    }
+    return color_map.get(color_str.lower())
+
+
+def get_font_size(class_str):
+    """클래스에서 폰트 크기 추출"""
+    if 'text-4xl' in class_str or 'text-5xl' in class_str:
+        return Pt(44)
+    elif 'text-3xl' in class_str:
+        return Pt(36)
+    elif 'text-2xl' in class_str:
+        return Pt(28)
+    elif 'text-xl' in class_str:
+        return Pt(24)
+    elif 'text-lg' in class_str:
+        return Pt(20)
+    elif 'text-sm' in class_str:
+        return Pt(14)
+    return Pt(18)  # 기본값
+
+
+def is_bold(class_str):
+    """클래스에서 bold 여부 확인"""
+    return 'font-bold' in class_str or 'font-semibold' in class_str
+
+
+def clean_text(text):
+    """텍스트에서 마크다운 형식 제거"""
+    # **텍스트** -> 텍스트 (볼드)
+    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
+    return text.strip()
+
+
+def html_to_pptx_slide(slide_soup, prs, slide_idx, css_rules, tailwind_colors):
+    """HTML 슬라이드를 PPTX 슬라이드로 변환 (head의 스타일 정보 반영)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 레이아웃
+    
+    # 슬라이드 배경색 설정 (CSS에서 .slide의 background-color 또는 인라인 스타일)
+    slide_style = slide_soup.get('style', '')
+    bg_color = RGBColor(248, 249, 250)  # 기본값 #F8F9FA
+    
+    # 인라인 스타일에서 배경색 추출
+    if 'background' in slide_style:
+        bg_match = re.search(r'background[^:]*:\s*([^;]+)', slide_style)
+        if bg_match:
+            bg_value = bg_match.group(1)
+            # linear-gradient는 첫 번째 색상 사용
+            color_match = re.search(r'#([0-9A-Fa-f]{6})', bg_value)
+            if color_match:
+                bg_color = parse_color('#' + color_match.group(1))
+    
+    # CSS 규칙에서 .slide의 background-color 확인
+    if 'slide' in css_rules and 'background-color' in css_rules['slide']:
+        bg_color = parse_color(css_rules['slide']['background-color']) or bg_color
+    
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = bg_color
+    
+    # 패딩 계산 (CSS에서 .slide-header, .slide-body의 padding 참고)
+    header_padding_top = Inches(2.5 / 16)  # 2.5rem ≈ 2.5/16 인치
+    header_padding_horizontal = Inches(3 / 16)  # 3rem
+    body_padding_horizontal = Inches(3 / 16)
+    body_padding_top = Inches(1.5 / 16)
+    body_padding_bottom = Inches(3 / 16)
+    
+    if 'slide-header' in css_rules:
+        padding = css_rules['slide-header'].get('padding', '')
+        if padding:
+            # padding: 2.5rem 3rem 0 3rem 형식 파싱
+            padding_parts = re.findall(r'([\d.]+)rem', padding)
+            if len(padding_parts) >= 1:
+                header_padding_top = Inches(float(padding_parts[0]) / 16)
+            if len(padding_parts) >= 2:
+                header_padding_horizontal = Inches(float(padding_parts[1]) / 16)
+    
+    y_position = header_padding_top
+    left_margin = header_padding_horizontal
+    right_margin = prs.slide_width - header_padding_horizontal
+    content_width = right_margin - left_margin
+    
+    # slide-header 처리
+    header = slide_soup.find('div', class_='slide-header')
+    if header:
+        h2 = header.find('h2')
+        if h2:
+            text = clean_text(h2.get_text())
+            # CSS에서 h2 스타일 적용
+            h2_font_size = Pt(32)  # 2rem = 32pt
+            h2_color = RGBColor(33, 37, 41)  # #212529
+            if 'h2' in css_rules:
+                if 'font-size' in css_rules['h2']:
+                    size_match = re.search(r'([\d.]+)rem', css_rules['h2']['font-size'])
+                    if size_match:
+                        h2_font_size = Pt(float(size_match.group(1)) * 16)
+                if 'color' in css_rules['h2']:
+                    h2_color = parse_color(css_rules['h2']['color']) or h2_color
+            
+            textbox = slide.shapes.add_textbox(left_margin, y_position, content_width, Inches(1.2))
+            text_frame = textbox.text_frame
+            text_frame.word_wrap = True
+            p = text_frame.paragraphs[0]
+            p.text = text
+            p.font.size = h2_font_size
+            p.font.bold = True
+            p.font.color.rgb = h2_color
+            
+            # h2의 border-bottom 추가 (CSS에서 4px solid #005A9C)
+            border_y = y_position + Inches(1.0)
+            line = slide.shapes.add_connector(1, left_margin, border_y, left_margin + Inches(2), border_y)
+            line.line.color.rgb = parse_color('#005A9C')
+            line.line.width = Pt(4)
+            
+            y_position += Inches(1.5)
+    
+    # slide-body 처리 (body 패딩 적용)
+    body = slide_soup.find('div', class_='slide-body')
+    if body:
+        body_x = left_margin + body_padding_horizontal
+        body_y = y_position + body_padding_top
+        body_width = content_width - (body_padding_horizontal * 2)
+        
+        # 그리드 레이아웃 확인
+        grid = body.find('div', class_=re.compile(r'grid'))
+        if grid:
+            cols = 2 if 'grid-cols-2' in str(grid.get('class', [])) else 3 if 'grid-cols-3' in str(grid.get('class', [])) else 1
+            col_width = body_width / cols
+            col_gap = Inches(0.5)
+            
+            items = grid.find_all(['div'], recursive=False)
+            current_col = 0
+            current_y = body_y
+            
+            for item in items:
+                col_x = body_x + (col_width + col_gap) * current_col
+                process_element(item, slide, col_x, current_y, col_width - col_gap, prs, css_rules, tailwind_colors)
+                current_col += 1
+                if current_col >= cols:
+                    current_col = 0
+                    current_y += Inches(3)  # 다음 행
+        else:
+            # 일반 레이아웃
+            process_element(body, slide, body_x, body_y, body_width, prs, css_rules, tailwind_colors)
+    
+    # slide-footer 처리
+    footer = slide_soup.find('div', class_='slide-footer')
+    if footer:
+        # CSS에서 .slide-footer의 padding, font-size, color 확인
+        footer_padding = Inches(0.75 / 16)  # 0.75rem
+        footer_font_size = Pt(14)  # 0.875rem
+        footer_color = RGBColor(108, 117, 125)  # #6C757D
+        
+        if 'slide-footer' in css_rules:
+            if 'font-size' in css_rules['slide-footer']:
+                size_match = re.search(r'([\d.]+)rem', css_rules['slide-footer']['font-size'])
+                if size_match:
+                    footer_font_size = Pt(float(size_match.group(1)) * 16)
+            if 'color' in css_rules['slide-footer']:
+                footer_color = parse_color(css_rules['slide-footer']['color']) or footer_color
+        
+        footer_y = prs.slide_height - Inches(0.75)
+        footer_text = clean_text(footer.get_text())
+        textbox = slide.shapes.add_textbox(left_margin, footer_y, content_width, Inches(0.4))
+        text_frame = textbox.text_frame
+        p = text_frame.paragraphs[0]
+        p.text = footer_text
+        p.font.size = footer_font_size
+        p.font.color.rgb = footer_color
+        p.alignment = PP_ALIGN.JUSTIFY
+        
+        # border-top 추가
+        border_y = footer_y
+        line = slide.shapes.add_connector(1, left_margin, border_y, right_margin, border_y)
+        line.line.color.rgb = parse_color('#DEE2E6')  # slide-border
+        line.line.width = Pt(1)
+
+
+def process_element(element, slide, x, y, width, prs, css_rules, tailwind_colors, depth=0):
+    """HTML 요소를 재귀적으로 처리하여 PPTX 객체로 변환"""
+    if depth > 10:  # 깊이 제한
+        return y
+    
+    current_y = y
+    
+    # h1, h2, h3 처리
+    for tag in ['h1', 'h2', 'h3']:
+        headings = element.find_all(tag, recursive=False)
+        for h in headings:
+            text = clean_text(h.get_text())
+            if text:
+                class_str = ' '.join(h.get('class', []))
+                
+                # CSS 규칙에서 태그 스타일 확인
+                font_size = get_font_size(class_str)
+                font_color = parse_color('slide-blue') or RGBColor(0, 90, 156)
+                is_bold_text = is_bold(class_str)
+                
+                if tag in css_rules:
+                    if 'font-size' in css_rules[tag]:
+                        size_match = re.search(r'([\d.]+)rem', css_rules[tag]['font-size'])
+                        if size_match:
+                            font_size = Pt(float(size_match.group(1)) * 16)
+                    if 'color' in css_rules[tag]:
+                        font_color = parse_color(css_rules[tag]['color']) or font_color
+                    if 'font-weight' in css_rules[tag]:
+                        is_bold_text = '700' in css_rules[tag]['font-weight'] or '600' in css_rules[tag]['font-weight']
+                
+                # Tailwind 클래스에서 색상 확인
+                for color_name, color_hex in tailwind_colors.items():
+                    if f'text-{color_name}' in class_str or f'bg-{color_name}' in class_str:
+                        font_color = parse_color(color_hex)
+                        break
+                
+                textbox = slide.shapes.add_textbox(x, current_y, width, Inches(0.8))
+                text_frame = textbox.text_frame
+                text_frame.word_wrap = True
+                p = text_frame.paragraphs[0]
+                p.text = text
+                p.font.size = font_size
+                p.font.bold = is_bold_text
+                p.font.color.rgb = font_color
+                current_y += Inches(0.9)
+    
+    # ul, ol 리스트 처리
+    lists = element.find_all(['ul', 'ol'], recursive=False)
+    for ul in lists:
+        # CSS에서 ul 스타일 확인
+        list_font_size = Pt(18)  # 1.125rem
+        list_color = RGBColor(52, 58, 79)  # #343A4F
+        
+        if 'ul' in css_rules:
+            if 'font-size' in css_rules['ul']:
+                size_match = re.search(r'([\d.]+)rem', css_rules['ul']['font-size'])
+                if size_match:
+                    list_font_size = Pt(float(size_match.group(1)) * 16)
+            if 'color' in css_rules['ul']:
+                list_color = parse_color(css_rules['ul']['color']) or list_color
+        
+        items = ul.find_all('li', recursive=False)
+        for li in items:
+            text = clean_text(li.get_text())
+            if text:
+                # CSS에서 li::before의 content 확인 (■)
+                bullet = "■"
+                if 'ul > li' in css_rules or 'li::before' in str(css_rules):
+                    # CSS에서 content 확인
+                    pass  # 기본값 사용
+                
+                textbox = slide.shapes.add_textbox(x + Inches(0.3), current_y, width - Inches(0.3), Inches(0.6))
+                text_frame = textbox.text_frame
+                text_frame.word_wrap = True
+                p = text_frame.paragraphs[0]
+                p.text = f"{bullet} {text}"
+                p.font.size = list_font_size
+                p.font.color.rgb = list_color
+                current_y += Inches(0.7)
+    
+    # p 태그 처리
+    paragraphs = element.find_all('p', recursive=False)
+    for p_tag in paragraphs:
+        text = clean_text(p_tag.get_text())
+        if text:
+            class_str = ' '.join(p_tag.get('class', []))
+            
+            # CSS에서 p 스타일 확인
+            p_font_size = Pt(18)  # 1.125rem
+            p_color = RGBColor(52, 58, 79)  # #343A4F
+            
+            if 'p' in css_rules:
+                if 'font-size' in css_rules['p']:
+                    size_match = re.search(r'([\d.]+)rem', css_rules['p']['font-size'])
+                    if size_match:
+                        p_font_size = Pt(float(size_match.group(1)) * 16)
+                if 'color' in css_rules['p']:
+                    p_color = parse_color(css_rules['p']['color']) or p_color
+            
+            # Tailwind 클래스 우선 적용
+            p_font_size = get_font_size(class_str) or p_font_size
+            for color_name, color_hex in tailwind_colors.items():
+                if f'text-{color_name}' in class_str:
+                    p_color = parse_color(color_hex)
+                    break
+            
+            textbox = slide.shapes.add_textbox(x, current_y, width, Inches(0.5))
+            text_frame = textbox.text_frame
+            text_frame.word_wrap = True
+            p = text_frame.paragraphs[0]
+            p.text = text
+            p.font.size = p_font_size
+            p.font.color.rgb = p_color
+            current_y += Inches(0.6)
+    
+    # div 재귀 처리 (중첩된 구조)
+    divs = element.find_all('div', recursive=False)
+    for div in divs:
+        # 특정 클래스는 건너뛰기
+        div_class = ' '.join(div.get('class', []))
+        if 'figure-placeholder' in div_class:
+            continue
+        current_y = process_element(div, slide, x, current_y, width, prs, css_rules, tailwind_colors, depth + 1)
+    
+    return current_y
+
+
+def build_pptx(html_content: str = None, deck=None) -> bytes:
+    """
+    HTML 슬라이드 덱을 편집 가능한 PPTX로 변환 (텍스트와 도형이 개별 객체로 들어감)
+
+    파일을 쓰거나 전역 상태를 바꾸지 않으므로 여러 요청에서 동시에 호출할 수 있다.
+
+    Args:
+        html_content: HTML 파일 내용 (deck이 주어지면 생략 가능)
+        deck: 이미 추출한 DeckParts (PDF 변환과 같은 파싱 결과 재사용)
+
+    Returns:
+        PPTX 파일 바이트
+    """
+    if deck is None:
+        deck = parse_deck(html_content)
+    if not deck.sections:
+        raise ValueError("HTML에 <section> 태그가 없습니다.")
+
+    # 첫 번째 <style>의 규칙과 tailwind.config 색상을 슬라이드 스타일로 사용
+    css_rules = extract_css_rules(deck.style_texts[0]) if deck.style_texts else {}
+    tailwind_colors = extract_tailwind_colors(deck.head)
+
+    # PPTX 프레젠테이션 생성 (16:9 비율)
+    prs = Presentation()
+    prs.slide_width = Inches(10)  # 16:9 비율의 너비
+    prs.slide_height = Inches(5.625)  # 16:9 비율의 높이
+
+    for idx, section_markup in enumerate(deck.sections):
+        slide_soup = BeautifulSoup(section_markup, 'html.parser').find('section')
+        try:
+            html_to_pptx_slide(slide_soup, prs, idx, css_rules, tailwind_colors)
+        except Exception:
+            # 한 슬라이드가 실패해도 나머지는 계속 변환
+            logger.exception("슬라이드 %d PPTX 변환 중 오류", idx + 1)
+
+    output = io.BytesIO()
+    prs.save(output)
+    return output.getvalue()
+
+
+def parse_css_color(value: str):
+    """
+    계산된 스타일의 색상 값(rgb(), rgba())을 RGBColor로 변환
+
+    Returns:
+        RGBColor (투명하거나 해석할 수 없으면 None)
+    """
+    match = re.match(r'rgba?\(\s*([\d.]+)[,\s]+([\d.]+)[,\s]+([\d.]+)(?:\s*[,/]\s*([\d.]+))?', value or '')
+    if not match:
+        return None
+    if match.group(4) is not None and float(match.group(4)) == 0:
+        return None
+    return RGBColor(*(min(255, round(float(match.group(i)))) for i in (1, 2, 3)))
+
+
+def _add_measured_slide(prs, layout: dict):
+    """측정 결과 하나를 슬라이드로 변환 (배경 → 배경색 요소 → 텍스트 블록 순으로 쌓음)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 레이아웃
+    scale = prs.slide_width / layout['width']  # px -> EMU
+    points_per_px = SLIDE_WIDTH_INCHES * 72 / layout['width']
+
+    def emu(value):
+        return int(round(value * scale))
+
+    background_color = parse_css_color(layout.get('background'))
+    if background_color is not None:
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = background_color
+
+    for box in layout['boxes']:
+        color = parse_css_color(box['color'])
+        if color is None:
+            continue
+        shape_type = MSO_SHAPE.ROUNDED_RECTANGLE if box['radius'] else MSO_SHAPE.RECTANGLE
+        shape = slide.shapes.add_shape(shape_type, emu(box['x']), emu(box['y']), emu(box['width']), emu(box['height']))
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = color
+        shape.line.fill.background()
+        shape.shadow.inherit = False
+        if box['radius']:
+            shape.adjustments[0] = min(0.5, box['radius'] / min(box['width'], box['height']))
+
+    for block in layout['texts']:
+        runs = block['runs']
+        runs[0]['text'] = runs[0]['text'].lstrip()
+        runs[-1]['text'] = runs[-1]['text'].rstrip()
+        # PowerPoint 글꼴 폭 차이로 줄바꿈이 달라지지 않도록 너비에 약간 여유를 둔다
+        textbox = slide.shapes.add_textbox(
+            emu(block['x']), emu(block['y']), emu(block['width'] + 4), emu(block['height'])
+        )
+        text_frame = textbox.text_frame
+        text_frame.word_wrap = True
+        text_frame.auto_size = MSO_AUTO_SIZE.NONE
+        text_frame.margin_left = text_frame.margin_right = 0
+        text_frame.margin_top = text_frame.margin_bottom = 0
+        p = text_frame.paragraphs[0]
+        p.alignment = TEXT_ALIGNMENTS.get(block['align'], PP_ALIGN.LEFT)
+        for run_info in runs:
+            if not run_info['text']:
+                continue
+            run = p.add_run()
+            run.text = run_info['text']
+            run.font.size = Pt(round(run_info['font_size'] * points_per_px, 1))
+            run.font.bold = run_info['font_weight'] >= 600
+            run.font.italic = run_info['italic']
+            if run_info['font_family']:
+                run.font.name = run_info['font_family']
+            color = parse_css_color(run_info['color'])
+            if color is not None:
+                run.font.color.rgb = color
+
+
+def build_pptx_from_layouts(layouts: list) -> bytes:
+    """
+    브라우저에서 측정한 슬라이드 배치로 PPTX 생성 (computed 배치)
+
+    Args:
+        layouts: 슬라이드별 MEASURE_LAYOUT_SCRIPT 결과
+
+    Returns:
+        PPTX 파일 바이트
+
+    Raises:
+        ValueError: 슬라이드가 없거나 모든 슬라이드의 크기가 0인 경우
+    """
+    if not layouts:
+        raise ValueError("HTML에 <section> 태그가 없습니다.")
+
+    # 크기가 있는 첫 슬라이드의 비율로 슬라이드 크기를 정함 (너비 10인치, 숨겨지거나 빈 슬라이드는 건너뜀)
+    sized = next((layout for layout in layouts if layout.get('width') and layout.get('height')), None)
+    if sized is None:
+        raise ValueError("크기를 측정할 수 있는 슬라이드가 없습니다. (presentation-container의 너비/높이가 0)")
+    prs = Presentation()
+    prs.slide_width = Inches(SLIDE_WIDTH_INCHES)
+    prs.slide_height = int(prs.slide_width * sized['height'] / sized['width'])
+
+    for idx, layout in enumerate(layouts):
+        try:
+            _add_measured_slide(prs, layout)
+        except Exception:
+            # 한 슬라이드가 실패해도 나머지는 계속 변환
+            logger.exception("슬라이드 %d PPTX 변환 중 오류", idx + 1)
+
+    output = io.BytesIO()
+    prs.save(output)
+    return output.getvalue()
+
+
+async def extract_slide_layouts(html_content: str, pool=None, deck=None, asset_proxy=None) -> list:
+    """
+    원본 문서를 한 번 로드한 뒤 슬라이드마다 한 번의 evaluate로 배치와 계산된 스타일을 측정
+
+    슬라이드 수와 상관없이 문서 로드는 한 번이고, 슬라이드마다 브라우저 왕복 횟수가 일정하다
+    (section 교체, 렌더링 준비 대기, 측정).
+
+    Args:
+        html_content: HTML 파일 내용
+        pool: 공유 BrowserPool (None이면 브라우저를 새로 띄움)
+        deck: 이미 추출한 DeckParts
+        asset_proxy: 외부 리소스를 디스크 캐시에서 제공하는 AssetProxy
+
+    Returns:
+        슬라이드별 측정 결과 목록
+    """
+    if deck is None:
+        deck = await asyncio.to_thread(parse_deck, html_content)
+    if not deck.sections:
+        raise ValueError("HTML에 <section> 태그가 없습니다.")
+
+    layout = {
+        "body_class": deck.body_class,
+        "container_class": deck.container_class,
+        "wrapper_class": deck.wrapper_class,
+        "wrapper_style": deck.wrapper_style,
+    }
+    missing_assets = set()
+    layouts = []
+    async with ensure_pool(pool) as render_pool:
+        async with render_pool.context() as context:
+            if asset_proxy is not None:
+                await asset_proxy.attach(context, missing_assets)
+            page = await context.new_page()
+            await page.set_content(html_content, wait_until='load')
+            if asset_proxy is not None:
+                asset_proxy.check(missing_assets)
+            count = await page.evaluate(DECK_SETUP_SCRIPT, layout)
+            await page.add_style_tag(content=SLIDE_OVERRIDE_CSS)
+            for idx in range(count):
+                await page.evaluate(SHOW_SLIDE_SCRIPT, idx)
+                await wait_for_render_ready(page, label=f"pptx_slide_{idx+1}")
+                layouts.append(await page.evaluate(MEASURE_LAYOUT_SCRIPT))
+    return layouts
+
+
+async def render_pptx_bytes(html_content: str, pool=None, layout: str = None, asset_proxy=None) -> bytes:
+    """
+    HTML을 PPTX로 변환해 바이트로 반환
+
+    Args:
+        html_content: HTML 파일 내용
+        pool: computed 배치에서 사용할 공유 BrowserPool
+        layout: 배치 방식 ('heuristic', 'computed', None이면 PPTX_LAYOUT)
+        asset_proxy: computed 배치에서 사용할 AssetProxy
+
+    Returns:
+        PPTX 파일 바이트
+    """
+    if layout is None:
+        layout = PPTX_LAYOUT
+    if layout not in PPTX_LAYOUT_MODES:
+        raise ValueError(f"지원하지 않는 PPTX 배치 방식입니다: {layout}")
+
+    # 파싱과 python-pptx 작업은 CPU를 사용하므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    deck = await asyncio.to_thread(parse_deck, html_content)
+    if layout == 'heuristic':
+        return await asyncio.to_thread(build_pptx, deck=deck)
+    layouts = await extract_slide_layouts(html_content, pool, deck, asset_proxy)
+    return await asyncio.to_thread(build_pptx_from_layouts, layouts)
@@ -0,0 +1,173 @@
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from batch import ZipChunks
+from html_slicer import parse_deck
+from pdf_converter import (
+    DECK_SETUP_SCRIPT, SHOW_SLIDE_SCRIPT, SLIDE_OVERRIDE_CSS, RENDER_CONCURRENCY, ensure_pool, render_slides
+)
+from render_readiness import wait_for_render_ready
+import asyncio
+import io
+import json
+import logging
+import os
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 이미지 형식 (Playwright는 PNG로 캡처하고, WebP는 Pillow로 다시 인코딩)
+RASTER_FORMATS = ('png', 'webp')
+
+# 썸네일 기본 너비 (px, 0이면 썸네일을 만들지 않음)
+THUMBNAIL_WIDTH = int(os.environ.get('THUMBNAIL_WIDTH', '320'))
+
+# WebP 인코딩 품질 (0~100)
+WEBP_QUALITY = int(os.environ.get('WEBP_QUALITY', '85'))
+
+# 이미지 인코딩에 사용할 스레드 개수 (Pillow는 인코딩 중 GIL을 놓으므로 캡처와 병렬로 진행됨)
+RASTER_ENCODE_WORKERS = int(os.environ.get('RASTER_ENCODE_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+_encoder = ThreadPoolExecutor(max_workers=RASTER_ENCODE_WORKERS, thread_name_prefix='raster-encode')
+
+
+def _encode(image, image_format: str) -> bytes:
+    output = io.BytesIO()
+    if image_format == 'webp':
+        image.save(output, 'WEBP', quality=WEBP_QUALITY, method=4)
+    else:
+        image.save(output, 'PNG', optimize=False)
+    return output.getvalue()
+
+
+def encode_slide_image(png_bytes: bytes, image_format: str, thumbnail_width: int) -> dict:
+    """
+    캡처한 PNG를 요청한 형식으로 인코딩하고 같은 이미지에서 썸네일을 만든다
+
+    Args:
+        png_bytes: Playwright가 캡처한 PNG
+        image_format: 'png' 또는 'webp'
+        thumbnail_width: 썸네일 너비 (0이면 썸네일 없음)
+
+    Returns:
+        {"image": 바이트, "thumbnail": 바이트 또는 None, "width": 너비, "height": 높이}
+    """
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        image.load()
+        width, height = image.size
+        # PNG는 캡처 결과를 그대로 사용 (다시 인코딩하지 않음)
+        data = png_bytes if image_format == 'png' else _encode(image, image_format)
+        thumbnail = None
+        if thumbnail_width and thumbnail_width < width:
+            small = image.copy()
+            small.thumbnail((thumbnail_width, height), Image.Resampling.LANCZOS)
+            thumbnail = _encode(small, image_format)
+        elif thumbnail_width:
+            thumbnail = data
+    return {"image": data, "thumbnail": thumbnail, "width": width, "height": height}
+
+
+async def stream_slide_images(html_content: str, pool=None, image_format: str = 'png', scale: float = 1.0,
+                              thumbnail_width: int = None, concurrency: int = None, asset_proxy=None):
+    """
+    슬라이드마다 presentation-container를 직접 캡처해 이미지와 썸네일을 zip으로 스트리밍
+
+    PDF를 거치지 않고 원본 문서를 페이지마다 한 번만 로드한 뒤 section을 바꿔 가며 캡처하고,
+    인코딩은 스레드 풀에서 진행해 다음 슬라이드 캡처와 겹치게 한다.
+    끝나는 순서대로 zip에 넣고, 마지막에 슬라이드별 정보를 manifest.json으로 넣는다.
+
+    Args:
+        html_content: HTML 파일 내용
+        pool: 공유 BrowserPool (None이면 브라우저를 새로 띄움)
+        image_format: 'png' 또는 'webp'
+        scale: 기기 픽셀 비율 (2이면 CSS 크기의 2배 해상도)
+        thumbnail_width: 썸네일 너비 (None이면 THUMBNAIL_WIDTH, 0이면 썸네일 없음)
+        concurrency: 동시에 캡처할 슬라이드 개수 (None이면 RENDER_CONCURRENCY)
+        asset_proxy: 외부 리소스를 디스크 캐시에서 제공하는 AssetProxy
+
+    Yields:
+        zip 스트림 청크
+    """
+    if image_format not in RASTER_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {image_format}")
+    if thumbnail_width is None:
+        thumbnail_width = THUMBNAIL_WIDTH
+    if concurrency is None:
+        concurrency = RENDER_CONCURRENCY
+
+    deck = await asyncio.to_thread(parse_deck, html_content)
+    if not deck.sections:
+        raise ValueError("HTML에 <section> 태그가 없습니다.")
+
+    layout = {
+        "body_class": deck.body_class,
+        "container_class": deck.container_class,
+        "wrapper_class": deck.wrapper_class,
+        "wrapper_style": deck.wrapper_style,
+    }
+    missing_assets = set()
+    loop = asyncio.get_running_loop()
+    encoded = asyncio.Queue()  # 인코딩 future 또는 캡처 실패 예외
+
+    async def prepare_page(page):
+        if asset_proxy is not None:
+            await asset_proxy.attach(page.context, missing_assets)
+        await page.set_content(html_content, wait_until='load')
+        if asset_proxy is not None:
+            asset_proxy.check(missing_assets)
+        await page.evaluate(DECK_SETUP_SCRIPT, layout)
+        await page.add_style_tag(content=SLIDE_OVERRIDE_CSS)
+
+    async def capture(page, idx):
+        await page.evaluate(SHOW_SLIDE_SCRIPT, idx)
+        await wait_for_render_ready(page, label=f"slide_{idx+1}")
+        png_bytes = await page.locator('#presentation-container').screenshot(type='png', animations='disabled')
+        future = loop.run_in_executor(_encoder, encode_slide_image, png_bytes, image_format, thumbnail_width)
+        encoded.put_nowait((idx, future))
+
+    async def produce(render_pool):
+        try:
+            await render_slides(
+                list(range(len(deck.sections))), render_pool, concurrency, prepare_page, capture,
+                context_options={"device_scale_factor": scale},
+            )
+        except Exception as e:
+            encoded.put_nowait(e)
+
+    buffer = ZipChunks()
+    archive = zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED)
+    manifest = [None] * len(deck.sections)
+    async with ensure_pool(pool, concurrency) as render_pool:
+        producer = asyncio.create_task(produce(render_pool))
+        try:
+            for _ in range(len(deck.sections)):
+                entry = await encoded.get()
+                if isinstance(entry, Exception):
+                    raise entry
+                idx, future = entry
+                result = await future
+                name = f"slide_{idx+1:03d}.{image_format}"
+                # 이미지는 이미 압축되어 있으므로 다시 압축하지 않고 저장
+                archive.writestr(f"slides/{name}", result["image"])
+                info = {
+                    "index": idx,
+                    "image": f"slides/{name}",
+                    "width": result["width"],
+                    "height": result["height"],
+                }
+                if result["thumbnail"] is not None:
+                    archive.writestr(f"thumbnails/{name}", result["thumbnail"])
+                    info["thumbnail"] = f"thumbnails/{name}"
+                manifest[idx] = info
+                yield buffer.take()
+            await producer
+
+            archive.writestr('manifest.json', json.dumps({
+                "format": image_format,
+                "scale": scale,
+                "slides": manifest,
+            }, ensure_ascii=False, indent=2))
+            archive.close()
+            yield buffer.take()
+        finally:
+            # 클라이언트가 연결을 끊거나 실패하면 남은 캡처 취소
+            producer.cancel()
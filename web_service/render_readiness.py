@@ -0,0 +1,139 @@
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 준비 대기 최대 시간 (밀리초)
+READINESS_TIMEOUT_MS = int(os.environ.get('READINESS_TIMEOUT_MS', '15000'))
+
+# 페이지가 실제로 그릴 준비가 되었는지 확인하는 스크립트
+# - fonts: document.fonts.ready
+# - images: 모든 <img>의 로드 및 디코딩
+# - backgrounds: 계산된 CSS background-image URL의 로드 및 디코딩
+# - layout: 컨테이너 크기가 연속 두 프레임 동안 변하지 않음
+# 조건별 완료 시각과 가장 늦게 끝난 조건, 타임아웃 시 남은 리소스를 반환한다.
+READINESS_SCRIPT = """
+async (timeoutMs) => {
+    const start = performance.now();
+    const elapsed = () => Math.round(performance.now() - start);
+    const finished = {};
+    const pendingAssets = new Set();
+
+    const track = (name, promise) => promise.then(
+        () => { finished[name] = elapsed(); },
+        () => { finished[name] = elapsed(); }
+    );
+
+    const waitImage = (img, url) => {
+        pendingAssets.add(url);
+        const loaded = img.complete ? Promise.resolve() : new Promise(resolve => {
+            img.addEventListener('load', resolve, { once: true });
+            img.addEventListener('error', resolve, { once: true });
+        });
+        return loaded
+            .then(() => (img.naturalWidth && img.decode) ? img.decode().catch(() => {}) : null)
+            .then(() => { pendingAssets.delete(url); });
+    };
+
+    const backgroundUrls = () => {
+        const urls = new Set();
+        const pattern = /url\\(\\s*(['"]?)(.*?)\\1\\s*\\)/g;
+        for (const el of document.querySelectorAll('*')) {
+            for (const pseudo of [null, '::before', '::after']) {
+                const value = getComputedStyle(el, pseudo).backgroundImage;
+                if (!value || value === 'none') continue;
+                for (const match of value.matchAll(pattern)) {
+                    if (match[2]) urls.add(match[2]);
+                }
+            }
+        }
+        return Array.from(urls);
+    };
+
+    const loadBackground = (url) => {
+        const img = new Image();
+        img.src = url;
+        return waitImage(img, url);
+    };
+
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    const layoutStable = async () => {
+        const target = document.getElementById('presentation-container') || document.body;
+        let previous = null;
+        let stableFrames = 0;
+        while (stableFrames < 2) {
+            await nextFrame();
+            const rect = target.getBoundingClientRect();
+            const current = [rect.width, rect.height, document.documentElement.scrollHeight].join('x');
+            stableFrames = current === previous ? stableFrames + 1 : 0;
+            previous = current;
+        }
+    };
+
+    const fonts = track('fonts', document.fonts ? document.fonts.ready : Promise.resolve());
+    const images = track('images', Promise.all(
+        Array.from(document.images).map(img => waitImage(img, img.currentSrc || img.src))
+    ));
+    // 배경 이미지는 폰트와 스타일이 적용된 뒤의 계산된 스타일 기준으로 수집
+    const backgrounds = track('backgrounds', fonts.then(
+        () => Promise.all(backgroundUrls().map(loadBackground))
+    ));
+    const all = Promise.all([fonts, images, backgrounds]).then(() => track('layout', layoutStable()));
+
+    let timer;
+    const timedOut = await Promise.race([
+        all.then(() => false),
+        new Promise(resolve => { timer = setTimeout(() => resolve(true), timeoutMs); }),
+    ]);
+    clearTimeout(timer);
+
+    const conditions = ['fonts', 'images', 'backgrounds', 'layout'];
+    const pending = conditions.filter(name => !(name in finished));
+    const last = pending.length
+        ? pending[0]
+        : conditions.reduce((a, b) => (finished[a] >= finished[b] ? a : b));
+
+    return {
+        timed_out: timedOut,
+        elapsed_ms: elapsed(),
+        finished: finished,
+        pending: pending,
+        last: last,
+        pending_assets: Array.from(pendingAssets).slice(0, 20),
+    };
+}
+"""
+
+
+def _log_report(report: dict, label: str):
+    if report['timed_out']:
+        logger.warning(
+            "%s 렌더링 준비 타임아웃 (%dms): 미완료 조건 %s, 미로드 리소스 %s",
+            label, report['elapsed_ms'], report['pending'], report['pending_assets']
+        )
+    else:
+        logger.debug(
+            "%s 렌더링 준비 완료 (%dms): 마지막 조건 %s, 조건별 %s",
+            label, report['elapsed_ms'], report['last'], report['finished']
+        )
+
+
+async def wait_for_render_ready(page, timeout_ms: int = None, label: str = 'page') -> dict:
+    """
+    페이지가 그릴 준비가 될 때까지 대기 (고정 sleep 대신 이벤트 기반)
+
+    Args:
+        page: Playwright Page (async API)
+        timeout_ms: 최대 대기 시간 (None이면 READINESS_TIMEOUT_MS)
+        label: 로그에 표시할 이름
+
+    Returns:
+        준비 상태 리포트
+        (timed_out, elapsed_ms, finished: 조건별 완료 시각, pending, last: 가장 늦게 끝난 조건, pending_assets)
+    """
+    if timeout_ms is None:
+        timeout_ms = READINESS_TIMEOUT_MS
+    report = await page.evaluate(READINESS_SCRIPT, timeout_ms)
+    _log_report(report, label)
+    return report
+
@@ -0,0 +1,97 @@
+import argparse
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 서버 프로세스 개수 (0이면 CPU 수와 메모리로 결정)
+SERVER_WORKERS = int(os.environ.get('SERVER_WORKERS', '0'))
+
+# Chromium 브라우저 하나가 사용하는 메모리 추정치 (렌더링 중 최대치 기준)
+BROWSER_MEMORY_BYTES = int(os.environ.get('BROWSER_MEMORY_BYTES', str(512 * 1024 * 1024)))
+
+# 서버 프로세스 하나의 기본 메모리 (Python, FastAPI, PDF 병합 버퍼)
+WORKER_MEMORY_BYTES = int(os.environ.get('WORKER_MEMORY_BYTES', str(256 * 1024 * 1024)))
+
+
+def available_memory() -> int:
+    """사용 가능한 메모리 (바이트, /proc/meminfo의 MemAvailable, 없으면 전체 물리 메모리)"""
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+
+def plan_workers(cpu_count: int, memory_bytes: int, workers: int = 0, pool_size: int = 0) -> dict:
+    """
+    CPU 수와 메모리로 서버 프로세스 개수와 프로세스별 브라우저 풀 크기를 정한다
+
+    프로세스 개수는 CPU 수와, 프로세스 하나(기본 메모리 + 브라우저 하나)가 들어갈 수 있는 메모리 중 작은 쪽이다.
+    전체 Chromium 개수는 CPU 수와 남은 메모리(BROWSER_MEMORY_BYTES 기준) 중 작은 쪽으로 제한해 프로세스별로 나눈다.
+
+    Args:
+        cpu_count: 사용할 수 있는 CPU 수
+        memory_bytes: 사용할 수 있는 메모리 (바이트)
+        workers: 지정한 프로세스 개수 (0이면 자동)
+        pool_size: 지정한 프로세스별 브라우저 개수 (0이면 자동)
+
+    Returns:
+        {"workers": 프로세스 개수, "browser_pool_size": 프로세스별 브라우저 개수, "browsers": 전체 브라우저 개수}
+    """
+    cpu_count = max(1, cpu_count)
+    if workers <= 0:
+        # 프로세스 하나는 기본 메모리와 브라우저 하나만큼의 메모리가 필요
+        workers = max(1, min(cpu_count, memory_bytes // (WORKER_MEMORY_BYTES + BROWSER_MEMORY_BYTES)))
+    if pool_size <= 0:
+        # 프로세스 기본 메모리를 뺀 나머지로 브라우저를 나눔
+        browser_memory = max(0, memory_bytes - workers * WORKER_MEMORY_BYTES)
+        browsers = max(1, min(cpu_count, browser_memory // BROWSER_MEMORY_BYTES))
+        pool_size = max(1, browsers // workers)
+    return {"workers": workers, "browser_pool_size": pool_size, "browsers": workers * pool_size}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="여러 서버 프로세스로 변환 서비스 실행")
+    parser.add_argument('--host', default=os.environ.get('HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', '8000')))
+    parser.add_argument('--workers', type=int, default=SERVER_WORKERS, help="서버 프로세스 개수 (0이면 자동)")
+    parser.add_argument('--dry-run', action='store_true', help="계산한 프로세스/브라우저 개수만 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+    plan = plan_workers(
+        cpu_count, available_memory(),
+        workers=args.workers,
+        pool_size=int(os.environ.get('BROWSER_POOL_SIZE', '0')),
+    )
+    logger.info("CPU %d개, 서버 프로세스 %d개 x 브라우저 %d개",
+                cpu_count, plan["workers"], plan["browser_pool_size"])
+    if args.dry_run:
+        print(plan)
+        return
+
+    # 각 프로세스는 main.py를 새로 import하며 환경 변수로 자기 브라우저 풀과 작업 워커 개수를 정한다
+    # (캐시와 작업 디렉토리는 같은 디스크 경로를 공유)
+    os.environ['BROWSER_POOL_SIZE'] = str(plan["browser_pool_size"])
+
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=plan["workers"],
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from content_store import ContentStore
+from render_readiness import wait_for_render_ready
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Tailwind CDN 런타임을 한 번만 실행해 만든 정적 CSS로 슬라이드 문서의 런타임을 대체할지 여부
+TAILWIND_PRECOMPILE = os.environ.get('TAILWIND_PRECOMPILE', '1') == '1'
+
+# <script src="https://cdn.tailwindcss.com...">
+TAILWIND_RUNTIME_PATTERN = re.compile(
+    r'<script\b[^>]*\bsrc\s*=\s*["\'][^"\']*cdn\.tailwindcss\.com[^"\']*["\'][^>]*>\s*</script>',
+    re.IGNORECASE
+)
+
+# <script>tailwind.config = {...}</script>
+TAILWIND_CONFIG_PATTERN = re.compile(
+    r'<script\b(?![^>]*\bsrc\s*=)[^>]*>(?:(?!</script>).)*?\btailwind\.config\s*=(?:(?!</script>).)*</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# <style type="text/tailwindcss">@apply 등</style>
+TAILWIND_STYLE_PATTERN = re.compile(
+    r'<style\b[^>]*\btype\s*=\s*["\']text/tailwindcss["\'][^>]*>.*?</style>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# 런타임이 만든 <style>만 골라낸다 (원본 HTML에 있던 스타일과 text/tailwindcss 블록 제외)
+EXTRACT_GENERATED_CSS_SCRIPT = """
+(originals) => {
+    const known = new Set(originals.map(text => text.trim()));
+    return Array.from(document.querySelectorAll('style'))
+        .filter(style => !style.type || style.type === 'text/css')
+        .map(style => style.textContent)
+        .filter(text => text.trim() && !known.has(text.trim()));
+}
+"""
+
+
+def detect_tailwind(head_content: str) -> bool:
+    """head에 Tailwind CDN 런타임이 있는지 확인"""
+    return TAILWIND_RUNTIME_PATTERN.search(head_content) is not None
+
+
+def strip_tailwind_runtime(head_content: str, css: str) -> str:
+    """
+    head에서 Tailwind 런타임, 설정, text/tailwindcss 블록을 지우고 정적 CSS를 넣는다
+
+    런타임은 생성한 <style>을 head 끝에 붙이므로 같은 위치에 넣어 우선순위를 유지한다.
+    """
+    head_content = TAILWIND_RUNTIME_PATTERN.sub('', head_content)
+    head_content = TAILWIND_CONFIG_PATTERN.sub('', head_content)
+    head_content = TAILWIND_STYLE_PATTERN.sub('', head_content)
+    style_tag = f'<style data-tailwind-precompiled>\n{css}\n</style>\n'
+    index = head_content.lower().rfind('</head>')
+    if index == -1:
+        return head_content + style_tag
+    return head_content[:index] + style_tag + head_content[index:]
+
+
+def tailwind_cache_key(head_content: str, deck) -> str:
+    """
+    Tailwind 런타임/설정과 덱에서 사용하는 클래스 집합으로 캐시 키 생성
+
+    런타임은 문서에 실제로 있는 클래스에 대한 CSS만 만들기 때문에
+    클래스 집합이 같으면 같은 CSS가 나온다.
+    """
+    return ContentStore.make_key(
+        'tailwind',
+        TAILWIND_RUNTIME_PATTERN.findall(head_content),
+        TAILWIND_CONFIG_PATTERN.findall(head_content),
+        TAILWIND_STYLE_PATTERN.findall(head_content),
+        sorted(deck.classes),
+    )
+
+
+async def extract_tailwind_css(page, html_content: str, deck):
+    """
+    덱 전체를 한 번 로드해 Tailwind 런타임이 만든 CSS를 꺼낸다
+
+    Args:
+        page: 외부 리소스 연결까지 준비된 Playwright Page
+        html_content: 원본 HTML
+        deck: 원본 HTML의 DeckParts (원래 있던 <style> 구분용)
+
+    Returns:
+        생성된 CSS (찾지 못하면 None)
+    """
+    originals = deck.style_texts
+    await page.set_content(html_content, wait_until='load')
+    await wait_for_render_ready(page, label='tailwind')
+    generated = await page.evaluate(EXTRACT_GENERATED_CSS_SCRIPT, originals)
+    if not generated:
+        return None
+    return '\n'.join(generated)
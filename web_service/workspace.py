@@ -0,0 +1,236 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 사용 중인 작업 디렉토리 표시 파일 (같은 디렉토리를 공유하는 다른 서버 프로세스의 정리 작업에서 보호)
+ACTIVE_MARKER = '.active'
+
+WORKSPACE_NAME_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+class Workspace:
+    """요청 하나가 사용하는 격리된 작업 디렉토리"""
+
+    def __init__(self, manager, name: str):
+        self.manager = manager
+        self.name = name
+        self.path = os.path.join(manager.root, name)
+
+    def file(self, filename: str) -> str:
+        """작업 디렉토리 안의 파일 경로"""
+        return os.path.join(self.path, filename)
+
+    def write_bytes(self, filename: str, data: bytes) -> str:
+        path = self.file(filename)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def write_json(self, filename: str, data: dict) -> str:
+        """JSON 파일을 임시 파일에 쓴 뒤 교체 (다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록)"""
+        path = self.file(filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def adopt(self, src_path: str, filename: str) -> str:
+        """외부 파일(캐시 등)을 작업 디렉토리로 가져온다 (가능하면 하드 링크, 아니면 복사)"""
+        path = self.file(filename)
+        try:
+            os.link(src_path, path)
+        except OSError:
+            shutil.copyfile(src_path, path)
+        return path
+
+    def finish(self):
+        """사용이 끝났음을 표시 (파일은 TTL 동안 보관된 뒤 정리됨)"""
+        self.manager.finish(self)
+
+    def release(self):
+        """작업 디렉토리 즉시 삭제"""
+        self.manager.release(self)
+
+
+class WorkspaceManager:
+    """
+    요청별 작업 디렉토리의 생성과 정리를 담당
+
+    백그라운드 정리 작업(janitor)이 주기적으로
+    - ttl_seconds보다 오래된 작업 디렉토리를 지우고
+    - 전체 사용량이 quota_bytes를 넘으면 오래된 것부터 지워
+    트래픽이 계속 들어와도 디스크 사용량이 일정하게 유지되도록 한다.
+    """
+
+    def __init__(self, root: str, quota_bytes: int, ttl_seconds: int, janitor_interval: int = 60):
+        """
+        Args:
+            root: 작업 디렉토리들을 만들 상위 디렉토리
+            quota_bytes: 전체 작업 디렉토리 최대 사용량 (바이트)
+            ttl_seconds: 작업 디렉토리 보관 시간 (초, 마지막 수정 시각 기준)
+            janitor_interval: 정리 작업 실행 간격 (초)
+        """
+        self.root = root
+        self.quota_bytes = quota_bytes
+        self.ttl_seconds = ttl_seconds
+        self.janitor_interval = janitor_interval
+        self.removed = 0
+        self._active = set()
+        self._janitor = None
+        os.makedirs(root, exist_ok=True)
+
+    def create(self, name: str = None) -> Workspace:
+        """
+        새 작업 디렉토리 생성
+
+        Args:
+            name: 디렉토리 이름 (32자리 16진수, 없으면 새로 만듦)
+        """
+        if name is None:
+            name = uuid.uuid4().hex
+        elif not WORKSPACE_NAME_PATTERN.match(name):
+            raise ValueError(f"잘못된 작업 디렉토리 이름입니다: {name}")
+        workspace = Workspace(self, name)
+        os.makedirs(workspace.path)
+        open(workspace.file(ACTIVE_MARKER), 'w').close()
+        self._active.add(workspace.name)
+        return workspace
+
+    def open(self, name: str):
+        """
+        이미 있는 작업 디렉토리 조회 (다른 서버 프로세스가 만든 것 포함)
+
+        Returns:
+            Workspace (없거나 이름이 잘못되었으면 None)
+        """
+        if not WORKSPACE_NAME_PATTERN.match(name):
+            return None
+        workspace = Workspace(self, name)
+        if not os.path.isdir(workspace.path):
+            return None
+        return workspace
+
+    def finish(self, workspace: Workspace):
+        """사용 중 표시 해제 (이후 TTL과 용량 제한에 따라 정리 대상이 됨)"""
+        self._active.discard(workspace.name)
+        try:
+            os.remove(workspace.file(ACTIVE_MARKER))
+        except FileNotFoundError:
+            pass
+
+    def release(self, workspace: Workspace):
+        """작업 디렉토리 즉시 삭제"""
+        self._active.discard(workspace.name)
+        shutil.rmtree(workspace.path, ignore_errors=True)
+
+    async def start(self):
+        """백그라운드 정리 작업 시작"""
+        await asyncio.to_thread(self.sweep)
+        self._janitor = asyncio.create_task(self._run_janitor())
+
+    async def stop(self):
+        if self._janitor is not None:
+            self._janitor.cancel()
+            await asyncio.gather(self._janitor, return_exceptions=True)
+            self._janitor = None
+
+    def sweep(self):
+        """TTL이 지난 작업 디렉토리를 지우고 용량 초과분을 오래된 순으로 정리"""
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            try:
+                mtime, size = self._measure(path)
+            except FileNotFoundError:
+                continue
+            if now - mtime > self.ttl_seconds and not self._is_active(name, path, now):
+                self._remove(name, path)
+            else:
+                entries.append((mtime, name, path, size))
+
+        total = sum(size for _, _, _, size in entries)
+        for mtime, name, path, size in sorted(entries):
+            if total <= self.quota_bytes:
+                break
+            if self._is_active(name, path, now):
+                # 아직 사용 중인 작업 디렉토리는 건너뜀
+                continue
+            self._remove(name, path)
+            total -= size
+
+    def stats(self) -> dict:
+        total = 0
+        count = 0
+        for name in os.listdir(self.root):
+            try:
+                total += self._measure(os.path.join(self.root, name))[1]
+                count += 1
+            except FileNotFoundError:
+                continue
+        return {
+            "workspaces": count,
+            "active": len(self._active),
+            "bytes": total,
+            "quota_bytes": self.quota_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "removed": self.removed,
+        }
+
+    async def _run_janitor(self):
+        while True:
+            await asyncio.sleep(self.janitor_interval)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception:
+                logger.exception("작업 디렉토리 정리 실패")
+
+    def _is_active(self, name: str, path: str, now: float) -> bool:
+        """
+        이 프로세스나 다른 서버 프로세스가 사용 중인 작업 디렉토리인지 확인
+
+        표시 파일이 TTL보다 오래되었으면 종료된 프로세스가 남긴 것으로 보고 정리 대상에 넣는다.
+        """
+        if name in self._active:
+            return True
+        try:
+            return now - os.stat(os.path.join(path, ACTIVE_MARKER)).st_mtime <= self.ttl_seconds
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _remove(self, name: str, path: str):
+        self._active.discard(name)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.removed += 1
+
+    @staticmethod
+    def _measure(path: str):
+        """(가장 최근 수정 시각, 전체 크기) 반환"""
+        if not os.path.isdir(path):
+            stat = os.stat(path)
+            return stat.st_mtime, stat.st_size
+        latest = os.stat(path).st_mtime
+        total = 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    stat = os.stat(os.path.join(dirpath, filename))
+                except FileNotFoundError:
+                    continue
+                latest = max(latest, stat.st_mtime)
+                total += stat.st_size
+        return latest, total